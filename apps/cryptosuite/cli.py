@@ -0,0 +1,194 @@
+# File: apps/cryptosuite/cli.py
+# Headless command line front-end for CryptoSuite recipes.
+#
+#   python -m apps.cryptosuite.cli bake recipe.json -i secret.txt -o secret.enc
+#   python -m apps.cryptosuite.cli bake recipe.json --invert < secret.enc > secret.txt
+#   python -m apps.cryptosuite.cli batch recipe.json documents/ encrypted/ --suffix .enc
+#
+# Recipes saved from the GUI run here unchanged. Only the operations package
+# is used: nothing from customtkinter or Tk is imported, and operation
+# implementations (NumPy, cryptography) load the first time a step needs
+# them, so the command starts quickly enough to call once per file from a
+# shell loop. Recipes whose steps all stream run chunk by chunk in constant
+# memory; the rest read the whole input first, as the GUI does. `batch`
+# applies a recipe to a whole directory tree on a process pool (batch.py).
+
+import argparse
+import os
+import stat
+import sys
+
+from .operations.batch import run_batch
+from .operations.optimizer import optimize_recipe
+from .operations.recipe import invert_recipe, load_recipe_file
+from .operations.registry import DECRYPT, ENCRYPT
+from .operations.streaming import bake_stream, format_rate
+
+# --- Exit Codes ---
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2  # Also used by argparse for invalid arguments
+
+
+def _error(message, code=EXIT_ERROR):
+    print(f"error: {message}", file=sys.stderr)
+    return code
+
+
+def load_steps(recipe_path, invert=False):
+    """The steps to run and their sidebar direction, following the Decrypt tab's Load & Invert.
+
+    Raises ValueError for recipes that are invalid, empty or already inverted.
+    """
+    steps, recipe_type = load_recipe_file(recipe_path)
+    direction = recipe_type if recipe_type in (ENCRYPT, DECRYPT) else None
+
+    if invert:
+        if recipe_type == DECRYPT:
+            raise ValueError("this is already a decryption recipe; run it without --invert")
+        steps, skipped = invert_recipe(steps)
+        for operation_name in skipped:
+            print(f"warning: no inverse found for '{operation_name}', skipping", file=sys.stderr)
+        direction = DECRYPT
+
+    if not steps:
+        raise ValueError("recipe file is empty or invalid")
+    return steps, direction
+
+
+def bake(steps, source, sink, direction=None):
+    """Runs steps from a binary source to a binary sink; redundant steps are optimized away first."""
+    plan, _ = optimize_recipe(steps, direction)
+    bake_stream(plan, source, sink, direction)
+
+
+def _open_input(path):
+    if path and path != "-":
+        return open(path, "rb")
+    return sys.stdin.buffer
+
+
+def _truncation_point(stream):
+    """Size of stdout before writing if it is a regular file written at its end (`> out.txt`); else None.
+
+    Output to a pipe or terminal cannot be taken back. Neither can output to
+    a file opened for appending (`>>`), whose position only moves to the end
+    on the first write.
+    """
+    try:
+        info = os.fstat(stream.fileno())
+        if stat.S_ISREG(info.st_mode) and stream.tell() == info.st_size:
+            return info.st_size
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def cmd_bake(args):
+    steps, direction = load_steps(args.recipe, args.invert)
+
+    to_file = args.output and args.output != "-"
+    if to_file and args.input and os.path.abspath(args.input) == os.path.abspath(args.output):
+        return _error("input and output must be different files", EXIT_USAGE)
+
+    source = _open_input(args.input)
+    try:
+        if not to_file:
+            sink = sys.stdout.buffer
+            start = _truncation_point(sink)
+            try:
+                bake(steps, source, sink, direction)
+                sink.flush()
+            except BaseException:
+                # A pipe or terminal has already received what streamed before the
+                # failure; a redirected file is cut back to what it held before
+                if start is not None:
+                    sink.seek(start)
+                    sink.truncate()
+                raise
+            return EXIT_OK
+        try:
+            with open(args.output, "wb") as sink:
+                bake(steps, source, sink, direction)
+        except BaseException:
+            # Never leave a partial output behind
+            if os.path.exists(args.output):
+                os.remove(args.output)
+            raise
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+    return EXIT_OK
+
+
+def cmd_batch(args):
+    steps, direction = load_steps(args.recipe, args.invert)
+    plan, _ = optimize_recipe(steps, direction)
+
+    def report(record):
+        if record["status"] != "ok":
+            print(f"failed: {record['path']}: {record['error']}", file=sys.stderr)
+        elif args.verbose:
+            print(f"{record['path']} ({record['size']:,} bytes, {record['seconds']:.2f}s)", file=sys.stderr)
+
+    summary = run_batch(plan, args.input_dir, args.output_dir, direction, manifest_path=args.manifest,
+                        jobs=args.jobs, pattern=args.pattern, suffix=args.suffix, progress=report)
+    for relative_path in summary["excluded"]:
+        print(f"excluded (left by an earlier batch run): {relative_path}", file=sys.stderr)
+    print(f"{summary['processed']} processed, {summary['skipped']} skipped, {summary['failed']} failed, "
+          f"{len(summary['excluded'])} excluded "
+          f"in {summary['seconds']:.2f}s ({format_rate(summary['bytes_in'], summary['seconds'])}); "
+          f"manifest: {summary['manifest']}", file=sys.stderr)
+    return EXIT_ERROR if summary["failed"] else EXIT_OK
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m apps.cryptosuite.cli",
+        description="Run recipes saved from CryptoSuite without the GUI."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    bake_parser = subparsers.add_parser("bake", help="apply a saved recipe to one input")
+    bake_parser.add_argument("recipe", help="recipe file saved from the Encrypt or Decrypt tab (.json)")
+    bake_parser.add_argument("-i", "--input", help="input file (default: stdin)")
+    bake_parser.add_argument("-o", "--output",
+                             help="output file (default: stdout; if a streamed step fails, output already "
+                                  "written to a pipe or terminal is left there and the exit code is 1)")
+    bake_parser.add_argument("--invert", action="store_true",
+                             help="undo the recipe: run each step's inverse in reverse order, like Load & Invert")
+    bake_parser.set_defaults(handler=cmd_bake)
+
+    batch_parser = subparsers.add_parser("batch", help="apply a saved recipe to every file in a directory tree")
+    batch_parser.add_argument("recipe", help="recipe file saved from the Encrypt or Decrypt tab (.json)")
+    batch_parser.add_argument("input_dir", help="directory of files to process (searched recursively)")
+    batch_parser.add_argument("output_dir", help="where to write results, mirroring the input tree")
+    batch_parser.add_argument("--invert", action="store_true", help="undo the recipe, as for bake")
+    batch_parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per CPU)")
+    batch_parser.add_argument("--pattern", default="*", help="only process file names matching this glob")
+    batch_parser.add_argument("--suffix", default="", help="append this to every output file name, e.g. .enc")
+    batch_parser.add_argument("--manifest",
+                              help="status file used to resume an interrupted run "
+                                   "(default: batch-manifest.jsonl in the output directory)")
+    batch_parser.add_argument("-v", "--verbose", action="store_true", help="list each file as it completes")
+    batch_parser.set_defaults(handler=cmd_batch)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # The reader went away (e.g. output piped into head); stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return EXIT_ERROR
+    except (OSError, ValueError) as e:
+        return _error(str(e))
+    except KeyboardInterrupt:
+        return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 # base_frame.py - FIXED
 import gc
 import json
+import os
 import queue
 import threading
 import time
@@ -9,6 +10,12 @@ from tkinter import filedialog, messagebox
 import customtkinter
 import pyperclip
 
+from ..operations.cache import StepResultCache, run_cached
+from ..operations.optimizer import describe_plan, optimize_recipe
+from ..operations.recipe import recipe_document, run_step, to_display
+from ..operations.registry import get_operation
+from ..operations.streaming import format_rate, process_file
+
 
 class CollapsibleFrame(customtkinter.CTkFrame):
     """Optimized collapsible frame with minimal overhead"""
@@ -74,6 +81,8 @@ class CollapsibleFrame(customtkinter.CTkFrame):
 
 
 class BaseFrame(customtkinter.CTkFrame):
+    operation_direction = None  # Registry direction (ENCRYPT/DECRYPT), set by subclasses
+
     def __init__(self, master, app, status_bar, **kwargs):
         super().__init__(master, **kwargs)
         self.app = app
@@ -87,6 +96,11 @@ class BaseFrame(customtkinter.CTkFrame):
         self.processing_cancelled = False
         self.current_thread = None
         self.operation_start_time = 0
+        self.last_output = None  # Typed (str or bytes) result of the last run
+        self.skipped_step_count = 0  # Steps the optimizer removed from the last bake
+        self.step_cache = StepResultCache()  # Intermediate results keyed by each step and the data it was given
+        self.reused_step_count = 0  # Plan steps the last bake took from the cache
+        self.planned_step_count = 0
 
         # Performance settings
         self.CHUNK_SIZE = 2 * 1024 * 1024  # 2MB chunks
@@ -161,10 +175,13 @@ class BaseFrame(customtkinter.CTkFrame):
 
         # Batch state updates for performance
         state = "disabled" if is_processing else "normal"
-        widgets = [self.bake_button, self.step_button,
+        widgets = [self.bake_button, self.step_button, getattr(self, 'file_button', None),
+                   getattr(self, 'plan_button', None),
                    getattr(self, 'clear_button', None),
                    getattr(self, 'load_button', None),
-                   getattr(self, 'save_button', None)]
+                   getattr(self, 'save_button', None),
+                   getattr(self, 'detect_button', None),
+                   getattr(self, 'magic_button', None)]
 
         for widget in widgets:
             if widget:
@@ -226,10 +243,11 @@ class BaseFrame(customtkinter.CTkFrame):
         if self.app.is_processing:
             return
 
+        steps = self.get_recipe_steps()
         self.operation_start_time = time.time()
         self.set_processing_state(True, "Processing step...")
 
-        self.current_thread = threading.Thread(target=self._worker_process_step, daemon=True)
+        self.current_thread = threading.Thread(target=self._worker_process_step, args=(steps,), daemon=True)
         self.current_thread.start()
         self.after(self.UPDATE_INTERVAL, self.check_queue)
 
@@ -238,96 +256,145 @@ class BaseFrame(customtkinter.CTkFrame):
         if self.app.is_processing:
             return
 
+        # Redundant steps (inverse pairs, mergeable shifts, repeats) are removed before running
+        steps = self.get_recipe_steps()
+        plan, _ = optimize_recipe(steps, self.operation_direction)
+        self.skipped_step_count = len(steps) - len(plan)
+
         self.operation_start_time = time.time()
         self.set_processing_state(True, "Baking recipe...")
 
-        self.current_thread = threading.Thread(target=self._worker_bake_recipe, daemon=True)
+        self.current_thread = threading.Thread(target=self._worker_bake_recipe, args=(plan, len(steps)),
+                                               daemon=True)
         self.current_thread.start()
         self.after(self.UPDATE_INTERVAL, self.check_queue)
 
-    def _worker_process_step(self):
-        """Optimized worker with error handling"""
+    def process_input_file(self):
+        """Run the recipe from an input file to an output file in chunks, without loading it"""
+        if self.app.is_processing:
+            return
+
+        steps = self.get_recipe_steps()
+        if not steps:
+            self.app.show_toast("Warning", "Recipe is empty", "warning")
+            return
+
+        input_path = filedialog.askopenfilename(title="Select File to Process")
+        if not input_path:
+            return
+        output_path = filedialog.asksaveasfilename(title="Save Processed File As")
+        if not output_path:
+            return
+        if os.path.abspath(input_path) == os.path.abspath(output_path):
+            self.app.show_toast("File Error", "Choose a different output file", "error")
+            return
+
+        self.operation_start_time = time.time()
+        self.set_processing_state(True, "Processing file...")
+
+        plan, _ = optimize_recipe(steps, self.operation_direction)
+        self.current_thread = threading.Thread(target=self._worker_process_file,
+                                               args=(plan, input_path, output_path), daemon=True)
+        self.current_thread.start()
+        self.after(self.UPDATE_INTERVAL, self.check_queue)
+
+    def _worker_process_file(self, steps, input_path, output_path):
+        """Stream the file through the recipe, reporting progress and throughput"""
+        total_size = os.path.getsize(input_path) or 1
+        last_report = [0.0]
+
+        def report(bytes_in, bytes_out, elapsed):
+            if elapsed - last_report[0] >= 0.25:  # Throttle status updates
+                last_report[0] = elapsed
+                self.result_queue.put(("progress", f"Processing file: {bytes_in / total_size:.0%} "
+                                                   f"({format_rate(bytes_in, elapsed)})"))
+
         try:
-            recipe_steps = [child for child in self.recipe_scrollable_frame.winfo_children()
-                            if isinstance(child, customtkinter.CTkFrame)]
+            stats = process_file(steps, input_path, output_path, self.operation_direction,
+                                 chunk_size=self.CHUNK_SIZE, progress=report,
+                                 cancelled=lambda: self.processing_cancelled)
+        except (ValueError, OSError) as e:
+            self.result_queue.put(("error", ("File Processing Failed", str(e))))
+            return
+        except Exception as e:
+            self.result_queue.put(("error", ("System Error", f"File processing failed: {str(e)}")))
+            return
 
-            if not recipe_steps:
+        if stats is None:
+            self.result_queue.put(("reset", "File processing cancelled."))
+        else:
+            self.result_queue.put(("file_success", (output_path, stats)))
+
+    def _worker_process_step(self, steps):
+        """Optimized worker with error handling"""
+        try:
+            if not steps:
                 self.result_queue.put(("error", ("Recipe Error", "Please add an operation.")))
                 return
 
-            if self.current_step_index >= len(recipe_steps):
+            if self.current_step_index >= len(steps):
                 self.result_queue.put(("reset", "Recipe completed. Ready for new operation."))
                 return
 
             current_data = self.input_textbox.get("1.0", "end-1c")
 
-            if self.processing_cancelled:
+            # Earlier steps come from the cache, so only the current step normally runs
+            result = run_cached(self.step_cache, current_data, steps[:self.current_step_index + 1],
+                                self.execute_step, self.operation_direction,
+                                cancelled=lambda: self.processing_cancelled)
+            if result is None:
                 return
 
-            # Process with optimized error handling
-            for i in range(self.current_step_index + 1):
-                if self.processing_cancelled:
-                    return
-
-                step_frame = recipe_steps[i]
-                operation_name = step_frame.op_name
-
-                try:
-                    success, current_data = self.execute_operation(operation_name, current_data, step_frame)
-                    if not success:
-                        self.result_queue.put(("error", ("Operation Failed",
-                                                         f"{operation_name}: {current_data}")))
-                        return
-                except Exception as e:
-                    self.result_queue.put(("error", ("Execution Error",
-                                                     f"{operation_name} failed: {str(e)}")))
-                    return
+            success, current_data, _ = result
+            if not success:
+                self.result_queue.put(("error", ("Operation Failed", current_data)))
+                return
 
             self.result_queue.put(("step_success", (current_data, self.current_step_index)))
 
         except Exception as e:
             self.result_queue.put(("error", ("System Error", f"Processing failed: {str(e)}")))
 
-    def _worker_bake_recipe(self):
+    def _worker_bake_recipe(self, plan, step_count):
         """Optimized recipe baking with robust error handling"""
         try:
             self.reset_step_state()
             current_data = self.input_textbox.get("1.0", "end-1c")
-            recipe_steps = [child for child in self.recipe_scrollable_frame.winfo_children()
-                            if isinstance(child, customtkinter.CTkFrame)]
 
             if not current_data.strip():
                 self.result_queue.put(("error", ("Input Error", "Input field is empty.")))
                 return
 
-            if not recipe_steps:
+            if not step_count:
                 self.result_queue.put(("error", ("Recipe Error", "No operations in recipe.")))
                 return
 
-            # Optimized processing with progress tracking
-            total_steps = len(recipe_steps)
-            for step_idx, step_frame in enumerate(recipe_steps):
-                if self.processing_cancelled:
-                    return
+            # Steps whose input and arguments are unchanged since the last run come
+            # from the cache, even after an earlier step re-ran with the same result
+            total_steps = len(plan)
 
-                operation_name = step_frame.op_name
+            def report(step_idx, operation_name):
                 self.result_queue.put(("progress", f"Step {step_idx + 1}/{total_steps}: {operation_name}"))
 
-                try:
-                    success, current_data = self.execute_operation(operation_name, current_data, step_frame)
-                    if not success:
-                        self.result_queue.put(("error", ("Operation Failed",
-                                                         f"{operation_name}: {current_data}")))
-                        return
-                except Exception as e:
-                    self.result_queue.put(("error", ("Execution Error",
-                                                     f"{operation_name} failed: {str(e)}")))
-                    return
-
+            def execute(operation_name, data, args):
+                result = self.execute_step(operation_name, data, args)
                 # Memory management for large data
-                if len(current_data) > self.CHUNK_SIZE * 5:
+                if len(result[1]) > self.CHUNK_SIZE * 5:
                     gc.collect()
+                return result
+
+            result = run_cached(self.step_cache, current_data, plan, execute, self.operation_direction,
+                                cancelled=lambda: self.processing_cancelled, progress=report)
+            if result is None:
+                return
+
+            success, current_data, reused = result
+            if not success:
+                self.result_queue.put(("error", ("Operation Failed", current_data)))
+                return
 
+            self.reused_step_count = reused
+            self.planned_step_count = total_steps
             self.result_queue.put(("bake_success", current_data))
 
         except Exception as e:
@@ -349,7 +416,55 @@ class BaseFrame(customtkinter.CTkFrame):
                         self.app.update_status(data, "processing", show_progress=True)
 
                     elif msg_type == "bake_success":
-                        self._handle_success(data, "Recipe completed successfully!")
+                        success_message = "Recipe completed successfully!"
+                        if self.skipped_step_count:
+                            success_message += f" {self.skipped_step_count} redundant step(s) optimized away."
+                        if not self.planned_step_count:
+                            success_message += " The steps cancel out, so the input is returned unchanged."
+                        elif self.reused_step_count == self.planned_step_count:
+                            success_message += " All steps reused from cache."
+                        elif self.reused_step_count:
+                            success_message += f" {self.reused_step_count} of {self.planned_step_count}" \
+                                               f" step(s) reused from cache."
+                        self._handle_success(data, success_message)
+                        return  # Stop processing
+
+                    elif msg_type == "file_success":
+                        output_path, stats = data
+                        self.app.update_status(
+                            f"Processed {os.path.basename(output_path)}: {stats['bytes_in']:,} → "
+                            f"{stats['bytes_out']:,} bytes in {stats['seconds']:.2f}s "
+                            f"({format_rate(stats['bytes_in'], stats['seconds'])})", "success")
+                        self.set_processing_state(False)
+                        return  # Stop processing
+
+                    elif msg_type == "hash_files_success":
+                        report, summary = data
+                        self._show_output(report)
+                        self.app.update_status(summary, "success")
+                        self.set_processing_state(False)
+                        return  # Stop processing
+
+                    elif msg_type == "kdf_calibrated":
+                        summary = []
+                        for algorithm, (costs, seconds) in data.items():
+                            for child in self.recipe_scrollable_frame.winfo_children():
+                                if isinstance(child, customtkinter.CTkFrame) and child.op_name == algorithm:
+                                    self.set_step_args(child, costs)
+                            summary.append(f"{algorithm} {seconds * 1000:.0f} ms")
+                        self.app.update_status("Calibrated: " + ", ".join(summary), "success")
+                        self.set_processing_state(False)
+                        return  # Stop processing
+
+                    elif msg_type == "detect_success":
+                        self.app.update_status(f"Auto-Detect found {len(data)} suggestion(s)", "success")
+                        self.set_processing_state(False)
+                        self.show_detection_results(data)
+                        return  # Stop processing
+
+                    elif msg_type == "magic_success":
+                        self.set_processing_state(False)
+                        self.show_magic_result(data)
                         return  # Stop processing
 
                     elif msg_type == "step_success":
@@ -379,13 +494,21 @@ class BaseFrame(customtkinter.CTkFrame):
         if self.app.is_processing:
             self.after(self.UPDATE_INTERVAL, self.check_queue)
 
-    def _handle_success(self, result_data, success_message):
-        """Fast success handling with performance metrics"""
-        # Batch UI updates
+    def _show_output(self, result_data):
+        """Show a typed result; binary data that is not UTF-8 is shown as hex"""
+        self.last_output = result_data
+        display_text, is_hex = to_display(result_data)
         self.output_textbox.configure(state="normal")
         self.output_textbox.delete("1.0", "end")
-        self.output_textbox.insert("1.0", result_data)
+        self.output_textbox.insert("1.0", display_text)
         self.output_textbox.configure(state="disabled")
+        return is_hex
+
+    def _handle_success(self, result_data, success_message):
+        """Fast success handling with performance metrics"""
+        # Batch UI updates
+        if self._show_output(result_data):
+            success_message += " Binary output shown as hex."
 
         # Performance metrics
         elapsed = time.time() - self.operation_start_time
@@ -393,7 +516,8 @@ class BaseFrame(customtkinter.CTkFrame):
 
         if elapsed > 0.1 and size > 1000:
             rate = size / elapsed / 1024
-            success_message += f" ({size:,} chars, {elapsed:.2f}s, {rate:.1f} KB/s)"
+            unit = "bytes" if isinstance(result_data, (bytes, bytearray)) else "chars"
+            success_message += f" ({size:,} {unit}, {elapsed:.2f}s, {rate:.1f} KB/s)"
 
         self.app.update_status(success_message, "success")
         self.set_processing_state(False)
@@ -403,10 +527,7 @@ class BaseFrame(customtkinter.CTkFrame):
         result_data, step_index = data
 
         # Update output
-        self.output_textbox.configure(state="normal")
-        self.output_textbox.delete("1.0", "end")
-        self.output_textbox.insert("1.0", result_data)
-        self.output_textbox.configure(state="disabled")
+        self._show_output(result_data)
 
         # Visual feedback
         recipe_steps = [child for child in self.recipe_scrollable_frame.winfo_children()
@@ -439,6 +560,7 @@ class BaseFrame(customtkinter.CTkFrame):
             self.output_textbox.configure(state="normal")
             self.output_textbox.delete("1.0", "end")
             self.output_textbox.configure(state="disabled")
+        self.last_output = None
         self.clear_recipe()
         self.app.update_status("All fields cleared", "info")
 
@@ -483,29 +605,19 @@ class BaseFrame(customtkinter.CTkFrame):
         )
         name_label.pack(side="top", anchor="w")
 
-        # Parameter inputs
-        if "Caesar" in operation_name:
-            shift_val = args.get("shift", "")
-            entry = customtkinter.CTkEntry(
-                param_container,
-                placeholder_text="Shift (1-25)",
-                width=100,
-                height=25
-            )
-            entry.insert(0, str(shift_val))
-            entry.pack(side="top", anchor="w", pady=(2, 0))
-            step_frame.param_entry = entry
-
-        elif "AES" in operation_name:
-            key = args.get("key", "")
+        # Parameter inputs, one entry per parameter in the operation's schema
+        operation = get_operation(operation_name, self.operation_direction)
+        step_frame.param_entries = {}
+        for param in (operation.params if operation else ()):
             entry = customtkinter.CTkEntry(
                 param_container,
-                placeholder_text="Enter Key...",
-                height=25
+                placeholder_text=param.placeholder,
+                height=25,
+                **({"width": 100} if param.kind is int else {})
             )
-            entry.insert(0, key)
+            entry.insert(0, str(args.get(param.name, param.initial())))
             entry.pack(side="top", anchor="w", pady=(2, 0))
-            step_frame.param_entry = entry
+            step_frame.param_entries[param.name] = entry
 
         # Remove button
         remove_button = customtkinter.CTkButton(
@@ -543,32 +655,7 @@ class BaseFrame(customtkinter.CTkFrame):
             self.app.show_toast("Warning", "Recipe is empty", "warning")
             return
 
-        recipe_data = {
-            "metadata": {
-                "version": "2.0",
-                "created": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "step_count": len(recipe_steps),
-                "recipe_type": self.__class__.__name__.replace("Frame", "").lower()
-            },
-            "steps": []
-        }
-
-        # Fast data collection
-        for step_frame in recipe_steps:
-            operation_name = step_frame.op_name
-            args = {}
-
-            if hasattr(step_frame, 'param_entry'):
-                param_value = step_frame.param_entry.get()
-                if "Caesar" in operation_name:
-                    args["shift"] = param_value
-                elif "AES" in operation_name:
-                    args["key"] = param_value
-
-            recipe_data["steps"].append({
-                "operation": operation_name,
-                "args": args
-            })
+        recipe_data = recipe_document(self.get_recipe_steps(), self.__class__.__name__.replace("Frame", "").lower())
 
         filepath = filedialog.asksaveasfilename(
             title="Save Recipe",
@@ -660,6 +747,26 @@ class BaseFrame(customtkinter.CTkFrame):
         )
         self.bake_button.grid(row=0, column=1, padx=(5, 0), sticky="ew")
 
+        self.file_button = customtkinter.CTkButton(
+            self.button_frame,
+            text="📁Process File...",
+            height=32,
+            fg_color=("gray65", "gray35"),
+            hover_color=("gray55", "gray45"),
+            command=self.process_input_file
+        )
+        self.file_button.grid(row=1, column=0, padx=(0, 5), pady=(8, 0), sticky="ew")
+
+        self.plan_button = customtkinter.CTkButton(
+            self.button_frame,
+            text="🔎Optimized Plan",
+            height=32,
+            fg_color=("gray65", "gray35"),
+            hover_color=("gray55", "gray45"),
+            command=self.show_optimized_plan
+        )
+        self.plan_button.grid(row=1, column=1, padx=(5, 0), pady=(8, 0), sticky="ew")
+
     def create_io_panel(self):
         """Create MUCH LARGER I/O panel for professional use"""
         io_frame = customtkinter.CTkFrame(self, fg_color="transparent")
@@ -789,6 +896,15 @@ class BaseFrame(customtkinter.CTkFrame):
         if not filepath:
             return
 
+        # Very large files are better run through "Process File" than loaded into the editor
+        file_size = os.path.getsize(filepath)
+        if file_size > 5 * 1024 * 1024:  # 5MB
+            if not messagebox.askyesno("Large File",
+                                       f"File is {file_size / (1024 * 1024):.1f}MB. Loading it into the editor "
+                                       f"may be slow; 'Process File' runs the recipe on it directly.\n\n"
+                                       f"Load it anyway?"):
+                return
+
         try:
             # Try multiple encodings quickly
             for encoding in ['utf-8', 'utf-16', 'ascii', 'latin-1']:
@@ -801,12 +917,6 @@ class BaseFrame(customtkinter.CTkFrame):
             else:
                 raise Exception("Could not decode file")
 
-            # Check size and warn if large
-            if len(content) > 5 * 1024 * 1024:  # 5MB
-                if not messagebox.askyesno("Large File",
-                                           f"File is {len(content) / (1024 * 1024):.1f}MB. Continue?"):
-                    return
-
             self.input_textbox.delete("1.0", "end")
             self.input_textbox.insert("1.0", content)
             self.reset_step_state()
@@ -833,8 +943,13 @@ class BaseFrame(customtkinter.CTkFrame):
             return
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            if isinstance(self.last_output, (bytes, bytearray)) and to_display(self.last_output)[1]:
+                # Binary output is saved as the raw bytes, not the hex shown on screen
+                with open(filepath, 'wb') as f:
+                    f.write(self.last_output)
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(content)
 
             filename = filepath.split('/')[-1] if '/' in filepath else filepath.split('\\')[-1]
             self.app.update_status(f"Saved: {filename} ({len(content):,} chars)", "success")
@@ -873,6 +988,7 @@ class BaseFrame(customtkinter.CTkFrame):
         self.output_textbox.delete("1.0", "end")
         self.output_textbox.configure(state="disabled")
         self.output_counter.configure(text="0 characters")
+        self.last_output = None
 
     def clear_recipe(self):
         """Fast recipe clearing"""
@@ -882,10 +998,54 @@ class BaseFrame(customtkinter.CTkFrame):
         self.after_idle(self.update_recipe_placeholder)
         self.reset_step_state()
 
-    # Abstract methods for subclasses
+    def get_recipe_steps(self):
+        """The recipe as a list of {"operation", "args"} dicts, in order"""
+        return [{"operation": child.op_name, "args": self.get_step_args(child)}
+                for child in self.recipe_scrollable_frame.winfo_children()
+                if isinstance(child, customtkinter.CTkFrame)]
+
+    def get_step_args(self, step_frame):
+        """Current parameter values of a recipe step, keyed by parameter name"""
+        return {name: entry.get() for name, entry in getattr(step_frame, 'param_entries', {}).items()}
+
+    def set_step_args(self, step_frame, values):
+        """Overwrite some parameter values of a recipe step"""
+        for name, value in values.items():
+            entry = getattr(step_frame, 'param_entries', {}).get(name)
+            if entry is not None:
+                entry.delete(0, "end")
+                entry.insert(0, str(value))
+        self.reset_step_state()
+
+    def show_optimized_plan(self):
+        """Show the plan a bake would actually run after redundant steps are removed"""
+        steps = self.get_recipe_steps()
+        if not steps:
+            self.app.show_toast("Warning", "Recipe is empty", "warning")
+            return
+        plan, notes = optimize_recipe(steps, self.operation_direction)
+        messagebox.showinfo("Optimized Plan", describe_plan(steps, plan, notes))
+
     def execute_operation(self, operation_name, input_data, step_frame):
-        """Execute operation - implemented by subclasses"""
-        raise NotImplementedError("Subclass must implement execute_operation")
+        """Execute a recipe step frame with its current parameter values"""
+        return self.execute_step(operation_name, input_data, self.get_step_args(step_frame))
+
+    def execute_step(self, operation_name, input_data, args):
+        """Execute an operation through the operation registry"""
+        operation = get_operation(operation_name, self.operation_direction)
+        if operation is None:
+            return False, f"Unknown operation: {operation_name}"
+        if not operation.implemented:
+            return self._placeholder_operation(operation_name, input_data)
+        try:
+            return run_step(operation, input_data, args)
+        except Exception as e:
+            return False, f"Operation '{operation_name}' failed: {str(e)}"
+
+    # Abstract methods for subclasses
+    def _placeholder_operation(self, operation_name, input_data):
+        """Placeholder output for operations not yet implemented - implemented by subclasses"""
+        raise NotImplementedError("Subclass must implement _placeholder_operation")
 
     def create_operations_sidebar(self):
         """Create sidebar - implemented by subclasses"""
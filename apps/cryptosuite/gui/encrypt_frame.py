@@ -1,12 +1,15 @@
 # encrypt_frame.py - FIXED
 import json
+import threading
+import time
 from tkinter import filedialog, messagebox
 
 import customtkinter
 
 from .base_frame import BaseFrame, CollapsibleFrame
-from ..operations.encoders import to_base64
-from ..operations.hex import to_hex
+from ..operations.hashes import HASH_ALGORITHMS, format_hash_report, hash_files, throughput
+from ..operations.kdf import DEFAULT_COSTS, calibrate
+from ..operations.registry import ENCRYPT, get_operation
 
 
 class EncryptFrame(BaseFrame):
@@ -15,126 +18,11 @@ class EncryptFrame(BaseFrame):
         self.recipe_title = "Encryption Recipe"
         self.placeholder_text = "🚀 Click an operation to begin building your encryption recipe...\n\nTip: Use Ctrl+1 to switch tabs, F5 to execute!"
         self.load_button_text = "📂Load"  # No space
+        self.operation_direction = ENCRYPT
         self.load_button_width = 80
 
         super().__init__(master, app, status_bar, **kwargs)
 
-    def execute_operation(self, operation_name, input_data, step_frame):
-        # ... (This method remains unchanged)
-        """Execute cryptographic operations with enhanced error handling"""
-        try:
-            # Data Format & Encoding Operations
-            if operation_name == "To Base64":
-                return to_base64(input_data)
-            elif operation_name == "To Base32":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "To Base58":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "To Hex":
-                return to_hex(input_data)
-            elif operation_name == "URL Encode":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "To Binary":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "To Morse Code":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "To QR Code":
-                return self._placeholder_operation(operation_name, input_data)
-
-            # Classic Cipher Operations
-            elif operation_name == "Caesar Encrypt":
-                return self._execute_caesar_encrypt(input_data, step_frame)
-            elif operation_name == "Atbash Cipher":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "ROT13 Cipher":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Vigenère Encrypt":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Playfair Encrypt":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Rail Fence Encrypt":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Beaufort Cipher":
-                return self._placeholder_operation(operation_name, input_data)
-
-            # Modern Symmetric Encryption
-            elif operation_name == "AES Encrypt":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Blowfish Encrypt":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Twofish Encrypt":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Serpent Encrypt":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "ChaCha20-Poly1305":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Salsa20 Encrypt":
-                return self._placeholder_operation(operation_name, input_data)
-
-            # Asymmetric Encryption
-            elif operation_name == "RSA Encrypt":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "ECC Encrypt":
-                return self._placeholder_operation(operation_name, input_data)
-
-            # Hash Functions
-            elif operation_name == "SHA-256":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "SHA-384":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "SHA-512":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "SHA-3-256":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "SHA-3-512":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "BLAKE2b":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "BLAKE2s":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "BLAKE3":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "RIPEMD-160":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Whirlpool":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "MD5":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "SHA-1":
-                return self._placeholder_operation(operation_name, input_data)
-
-            # Message Authentication Codes
-            elif operation_name == "HMAC-SHA256":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "HMAC-SHA512":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "HMAC-MD5":
-                return self._placeholder_operation(operation_name, input_data)
-
-            # Key Derivation Functions
-            elif operation_name == "PBKDF2":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Scrypt":
-                return self._placeholder_operation(operation_name, input_data)
-            elif operation_name == "Argon2":
-                return self._placeholder_operation(operation_name, input_data)
-
-            # Text Processing
-            elif operation_name == "Reverse Text":
-                return True, input_data[::-1]  # Fixed to return actual reversed text, not placeholder
-            elif operation_name == "Uppercase":
-                return True, input_data.upper()
-            elif operation_name == "Lowercase":
-                return True, input_data.lower()
-            elif operation_name == "Remove Spaces":
-                return True, input_data.replace(" ", "")
-
-            else:
-                return False, f"Unknown operation: {operation_name}"
-
-        except Exception as e:
-            return False, f"Operation '{operation_name}' failed: {str(e)}"
-
     def _placeholder_operation(self, operation_name, input_data):
         # ... (This method remains unchanged)
         """Placeholder for operations not yet implemented"""
@@ -182,11 +70,13 @@ class EncryptFrame(BaseFrame):
         # Data Formats & Encodings
         data_formats_frame = CollapsibleFrame(scrollable_frame, text="🗂Data Formats & Encodings")
         data_formats_frame.pack(fill="x", pady=(0, 8))
-        data_formats_frame.set_algorithm_count(8)
+        data_formats_frame.set_algorithm_count(10)
         # (add_button calls remain the same)
         add_button(data_formats_frame.content_frame, "To Base64", lambda: self.add_recipe_step("To Base64"), "📋")
         add_button(data_formats_frame.content_frame, "To Base32", lambda: self.add_recipe_step("To Base32"), "📋")
         add_button(data_formats_frame.content_frame, "To Base58", lambda: self.add_recipe_step("To Base58"), "📋")
+        add_button(data_formats_frame.content_frame, "To Base85", lambda: self.add_recipe_step("To Base85"), "📋")
+        add_button(data_formats_frame.content_frame, "To Ascii85", lambda: self.add_recipe_step("To Ascii85"), "📋")
         add_button(data_formats_frame.content_frame, "To Hex", lambda: self.add_recipe_step("To Hex"), "🔢")
         add_button(data_formats_frame.content_frame, "URL Encode", lambda: self.add_recipe_step("URL Encode"), "🌐")
         add_button(data_formats_frame.content_frame, "To Binary", lambda: self.add_recipe_step("To Binary"), "💻")
@@ -197,7 +87,7 @@ class EncryptFrame(BaseFrame):
         # Classic Ciphers
         classic_ciphers_frame = CollapsibleFrame(scrollable_frame, text="🏛Classic Ciphers")
         classic_ciphers_frame.pack(fill="x", pady=(0, 8))
-        classic_ciphers_frame.set_algorithm_count(7)
+        classic_ciphers_frame.set_algorithm_count(9)
         # (add_button calls remain the same)
         add_button(classic_ciphers_frame.content_frame, "Caesar Encrypt",
                    lambda: self.add_recipe_step("Caesar Encrypt"), "🏛")
@@ -205,6 +95,9 @@ class EncryptFrame(BaseFrame):
                    "🔄")
         add_button(classic_ciphers_frame.content_frame, "ROT13 Cipher", lambda: self.add_recipe_step("ROT13 Cipher"),
                    "🔄")
+        add_button(classic_ciphers_frame.content_frame, "ROT-N", lambda: self.add_recipe_step("ROT-N"), "🔄")
+        add_button(classic_ciphers_frame.content_frame, "ROT47 Cipher", lambda: self.add_recipe_step("ROT47 Cipher"),
+                   "🔄")
         add_button(classic_ciphers_frame.content_frame, "Vigenère Encrypt",
                    lambda: self.add_recipe_step("Vigenère Encrypt"), "🗝")
         add_button(classic_ciphers_frame.content_frame, "Playfair Encrypt",
@@ -256,6 +149,7 @@ class EncryptFrame(BaseFrame):
         add_button(hashing_frame.content_frame, "Whirlpool", lambda: self.add_recipe_step("Whirlpool"), "🌪")
         add_button(hashing_frame.content_frame, "MD5", lambda: self.add_recipe_step("MD5"), "⚠")
         add_button(hashing_frame.content_frame, "SHA-1", lambda: self.add_recipe_step("SHA-1"), "⚠")
+        add_button(hashing_frame.content_frame, "Hash Files...", self.hash_input_files, "📁")
 
         # Message Authentication Codes
         mac_frame = CollapsibleFrame(scrollable_frame, text="🔏Message Authentication")
@@ -274,6 +168,7 @@ class EncryptFrame(BaseFrame):
         add_button(kdf_frame.content_frame, "PBKDF2", lambda: self.add_recipe_step("PBKDF2"), "🗝")
         add_button(kdf_frame.content_frame, "Scrypt", lambda: self.add_recipe_step("Scrypt"), "⚙")
         add_button(kdf_frame.content_frame, "Argon2", lambda: self.add_recipe_step("Argon2"), "🛡")
+        add_button(kdf_frame.content_frame, "Calibrate Costs", self.calibrate_kdf_steps, "⏱")
 
         # Text Utilities
         text_utils_frame = CollapsibleFrame(scrollable_frame, text="📝Text Utilities")
@@ -289,12 +184,85 @@ class EncryptFrame(BaseFrame):
         stats_frame = customtkinter.CTkFrame(sidebar_frame, fg_color=("gray90", "gray20"), height=40)
         stats_frame.grid(row=2, column=0, padx=10, pady=(5, 10), sticky="ew")
 
-        total_algorithms = 8 + 7 + 6 + 2 + 12 + 3 + 3 + 4  # 45 total algorithms
+        total_algorithms = 10 + 9 + 6 + 2 + 12 + 3 + 3 + 4  # 49 total algorithms
         customtkinter.CTkLabel(
             stats_frame, text=f"📊 Total: {total_algorithms} algorithms available",
             font=customtkinter.CTkFont(size=11, weight="bold"), text_color=("gray30", "gray70")
         ).pack(pady=10)
 
+    def hash_input_files(self):
+        """Hash one or more files directly from disk with the recipe's hash algorithms"""
+        if self.app.is_processing:
+            return
+
+        algorithms = [step["operation"] for step in self.get_recipe_steps()
+                      if step["operation"] in HASH_ALGORITHMS]
+        algorithms = list(dict.fromkeys(algorithms)) or ["SHA-256"]
+
+        paths = filedialog.askopenfilenames(title="Select Files to Hash")
+        if not paths:
+            return
+
+        self.operation_start_time = time.time()
+        self.set_processing_state(True, f"Hashing {len(paths)} file(s)...")
+        self.current_thread = threading.Thread(target=self._worker_hash_files,
+                                               args=(list(paths), algorithms), daemon=True)
+        self.current_thread.start()
+        self.after(self.UPDATE_INTERVAL, self.check_queue)
+
+    def _worker_hash_files(self, paths, algorithms):
+        """Hash the files on a thread pool and queue the sha256sum-style report"""
+        def report(done, total):
+            self.result_queue.put(("progress", f"Hashing files: {done}/{total}"))
+
+        try:
+            results = hash_files(paths, algorithms, progress=report)
+        except ValueError as e:
+            self.result_queue.put(("error", ("Hashing Failed", str(e))))
+            return
+        except Exception as e:
+            self.result_queue.put(("error", ("System Error", f"Hashing failed: {str(e)}")))
+            return
+
+        speeds = throughput(results)
+        summary = ", ".join(f"{algorithm} {speeds.get(algorithm, 0.0):.0f} MB/s" for algorithm in algorithms)
+        failed = sum(1 for result in results if "error" in result)
+        message = f"Hashed {len(results) - failed} file(s)" + (f", {failed} failed" if failed else "")
+        self.result_queue.put(("hash_files_success", (format_hash_report(results, algorithms),
+                                                      f"{message} ({summary})")))
+
+    def calibrate_kdf_steps(self):
+        """Tune the cost parameters of the recipe's KDF steps to about half a second each"""
+        if self.app.is_processing:
+            return
+
+        algorithms = list(dict.fromkeys(step["operation"] for step in self.get_recipe_steps()
+                                        if step["operation"] in DEFAULT_COSTS))
+        if not algorithms:
+            self.app.show_toast("Warning", "Add a PBKDF2, Scrypt or Argon2 step first", "warning")
+            return
+
+        self.operation_start_time = time.time()
+        self.set_processing_state(True, "Calibrating key derivation costs...")
+        self.current_thread = threading.Thread(target=self._worker_calibrate, args=(algorithms,), daemon=True)
+        self.current_thread.start()
+        self.after(self.UPDATE_INTERVAL, self.check_queue)
+
+    def _worker_calibrate(self, algorithms):
+        """Time each KDF on this machine and queue the chosen costs"""
+        results = {}
+        try:
+            for algorithm in algorithms:
+                self.result_queue.put(("progress", f"Calibrating {algorithm}..."))
+                results[algorithm] = calibrate(algorithm)
+        except ValueError as e:
+            self.result_queue.put(("error", ("Calibration Failed", str(e))))
+            return
+        except Exception as e:
+            self.result_queue.put(("error", ("System Error", f"Calibration failed: {str(e)}")))
+            return
+        self.result_queue.put(("kdf_calibrated", results))
+
     def create_recipe_panel(self):
         """Create a consistent recipe panel by calling the base and customizing it."""
         super().create_recipe_panel()  # Create the base structure
@@ -404,24 +372,24 @@ class EncryptFrame(BaseFrame):
         if args is None:
             args = {}
 
-        # Pre-validate parameters for certain operations
-        if operation_name in ["Caesar Encrypt", "Vigenère Encrypt", "Rail Fence Encrypt"]:
-            if operation_name == "Caesar Encrypt" and "shift" in args:
+        # Pre-validate loaded parameters against the operation's schema
+        operation = get_operation(operation_name, self.operation_direction)
+        for param in (operation.params if operation else ()):
+            if str(args.get(param.name, "")).strip():
                 try:
-                    shift = int(args["shift"])
-                    if not 1 <= shift <= 25:
-                        self.app.show_toast("Parameter Error",
-                                            f"Invalid Caesar shift: {shift}. Must be 1-25.", "warning")
-                        args["shift"] = ""  # Reset to empty for user to fix
-                except (ValueError, TypeError):
-                    args["shift"] = ""
+                    param.parse(args[param.name])
+                except ValueError as e:
+                    self.app.show_toast("Parameter Error", f"{operation_name}: {e}", "warning")
+                    args[param.name] = ""  # Reset to empty for user to fix
 
         # Call parent method to add the step
         super().add_recipe_step(operation_name, args)
 
         # Provide helpful tips for complex operations
-        if operation_name in ["AES Encrypt", "RSA Encrypt", "HMAC-SHA256"]:
+        if operation_name in ["AES Encrypt", "ChaCha20-Poly1305", "RSA Encrypt", "HMAC-SHA256"]:
             self.app.update_status(f"Added {operation_name} - Remember to set a strong key/password", "info")
+        elif operation_name in DEFAULT_COSTS:
+            self.app.update_status(f"Added {operation_name} - Input is the password; use Calibrate Costs to tune it", "info")
         elif operation_name in ["SHA-256", "BLAKE2b", "MD5"]:
             self.app.update_status(f"Added {operation_name} - Hash functions are one-way operations", "info")
         else:
@@ -0,0 +1,293 @@
+# File: operations/aead.py
+# AES-256-GCM and ChaCha20-Poly1305 in a chunked container.
+#
+# The plaintext is split into fixed-size chunks that are sealed independently,
+# so chunks encrypt and decrypt in parallel on a thread pool, a file streams
+# through in constant memory, and any byte range can be decrypted by reading
+# only the chunks that cover it.
+#
+# Layout:  header | chunk 0 | chunk 1 | ... | chunk n-1 (final)
+#   header   magic "CSAE", version, algorithm id, chunk size, salt, nonce prefix
+#   chunk i  ciphertext of up to chunk_size bytes + 16-byte tag
+#
+# Chunk i uses the nonce  prefix || i  (96 bits). Its associated data is the
+# header plus i and a "final" flag, so chunks cannot be reordered, dropped,
+# truncated at a chunk boundary or moved into another container. The final
+# chunk is always present, even for empty input. The key is derived from the
+# recipe's key string with PBKDF2 and the per-container random salt, through
+# the session key cache in kdf.py.
+
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+
+from . import kdf
+
+MAGIC = b"CSAE"
+VERSION = 1
+SALT_SIZE = 16
+NONCE_PREFIX_SIZE = 8
+TAG_SIZE = 16
+KEY_SIZE = 32
+KEY_ITERATIONS = 100000
+DEFAULT_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_INDEX = 2 ** 32 - 1  # The counter fills the last 4 bytes of the nonce
+
+HEADER = struct.Struct(f">4sBBI{SALT_SIZE}s{NONCE_PREFIX_SIZE}s")
+HEADER_SIZE = HEADER.size
+_CHUNK_AAD = struct.Struct(">QB")
+_COUNTER = struct.Struct(">I")
+
+# Recipe operation name -> (algorithm id, cipher class)
+ALGORITHMS = {
+    "AES-256-GCM": (1, AESGCM),
+    "ChaCha20-Poly1305": (2, ChaCha20Poly1305),
+}
+_ALGORITHM_IDS = {algorithm_id: cipher for algorithm_id, cipher in ALGORITHMS.values()}
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _executor():
+    """Shared thread pool for sealing and opening chunks."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="aead")
+        return _pool
+
+
+def derive_key(key: str, salt: bytes) -> bytes:
+    """Derives the 256-bit cipher key from the recipe's key string (cached for the session)."""
+    if not key:
+        raise ValueError("Key cannot be empty.")
+    return kdf.derive_key("PBKDF2", key, salt, KEY_SIZE, iterations=KEY_ITERATIONS)
+
+
+class ContainerHeader:
+    """Parsed container header; raw is the exact header bytes (authenticated with every chunk)."""
+
+    def __init__(self, algorithm_id, chunk_size, salt, nonce_prefix):
+        if algorithm_id not in _ALGORITHM_IDS:
+            raise ValueError(f"Unknown cipher in container (id {algorithm_id}).")
+        if not 0 < chunk_size <= 2 ** 30:
+            raise ValueError("Invalid chunk size in container.")
+        self.algorithm_id = algorithm_id
+        self.chunk_size = chunk_size
+        self.salt = salt
+        self.nonce_prefix = nonce_prefix
+        self.raw = HEADER.pack(MAGIC, VERSION, algorithm_id, chunk_size, salt, nonce_prefix)
+
+    @classmethod
+    def new(cls, algorithm, chunk_size=DEFAULT_CHUNK_SIZE):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown cipher: {algorithm}")
+        return cls(ALGORITHMS[algorithm][0], chunk_size, os.urandom(SALT_SIZE), os.urandom(NONCE_PREFIX_SIZE))
+
+    @classmethod
+    def parse(cls, data):
+        if len(data) < HEADER_SIZE:
+            raise ValueError("Input is too short to be an encrypted container.")
+        magic, version, algorithm_id, chunk_size, salt, nonce_prefix = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Input is not an encrypted container (bad magic).")
+        if version != VERSION:
+            raise ValueError(f"Unsupported container version {version}.")
+        return cls(algorithm_id, chunk_size, salt, nonce_prefix)
+
+    @property
+    def sealed_chunk_size(self):
+        return self.chunk_size + TAG_SIZE
+
+    def cipher(self, key: str):
+        return _ALGORITHM_IDS[self.algorithm_id](derive_key(key, self.salt))
+
+    def chunk_count(self, container_size):
+        """Number of chunks in a container of the given total size."""
+        body = container_size - HEADER_SIZE
+        count = -(-body // self.sealed_chunk_size)
+        if body < TAG_SIZE or body - (count - 1) * self.sealed_chunk_size < TAG_SIZE:
+            raise ValueError("Encrypted container is truncated.")
+        return count
+
+
+class _Sealer:
+    """Seals or opens chunks with consecutive indices, in parallel when there are several."""
+
+    def __init__(self, header, key, decrypt=False):
+        self.header = header
+        self.cipher = header.cipher(key)
+        self.decrypt = decrypt
+        self.index = 0
+
+    def _nonce(self, index):
+        if index > MAX_CHUNK_INDEX:
+            raise ValueError("Input is too large for this chunk size.")
+        return self.header.nonce_prefix + _COUNTER.pack(index)
+
+    def _one(self, index, chunk, final):
+        aad = self.header.raw + _CHUNK_AAD.pack(index, final)
+        if not self.decrypt:
+            return self.cipher.encrypt(self._nonce(index), chunk, aad)
+        try:
+            return self.cipher.decrypt(self._nonce(index), chunk, aad)
+        except InvalidTag:
+            raise ValueError(f"Decryption failed at chunk {index}: wrong key or corrupted data.")
+
+    def process(self, chunks, final=False, start=None):
+        """Processes a list of chunks; the last one is marked final if final is true."""
+        if start is not None:
+            self.index = start
+        first, self.index = self.index, self.index + len(chunks)
+        flags = [final and i == len(chunks) - 1 for i in range(len(chunks))]
+        indices = range(first, first + len(chunks))
+        if len(chunks) < 2:
+            return [self._one(i, chunk, flag) for i, chunk, flag in zip(indices, chunks, flags)]
+        return list(_executor().map(self._one, indices, chunks, flags))
+
+
+def _split(data, size):
+    view = memoryview(data)
+    return [view[i:i + size] for i in range(0, len(data), size)]
+
+
+def encrypt_data(data: bytes, key: str, algorithm: str, chunk_size=DEFAULT_CHUNK_SIZE) -> bytes:
+    """Encrypts bytes into a complete container."""
+    header = ContainerHeader.new(algorithm, chunk_size)
+    chunks = _split(data, chunk_size) or [b""]
+    return header.raw + b"".join(_Sealer(header, key).process(chunks, final=True))
+
+
+def decrypt_data(data: bytes, key: str) -> bytes:
+    """Decrypts a complete container, verifying every chunk."""
+    header = ContainerHeader.parse(data)
+    header.chunk_count(len(data))
+    chunks = _split(memoryview(data)[HEADER_SIZE:], header.sealed_chunk_size)
+    return b"".join(_Sealer(header, key, decrypt=True).process(chunks, final=True))
+
+
+def decrypt_range(source, key: str, offset: int, length: int) -> bytes:
+    """Decrypts plaintext bytes [offset, offset + length) from a seekable container file.
+
+    Only the header and the chunks covering the range are read and verified.
+    """
+    if offset < 0 or length < 0:
+        raise ValueError("Offset and length must not be negative.")
+    source.seek(0)
+    header = ContainerHeader.parse(source.read(HEADER_SIZE))
+    count = header.chunk_count(source.seek(0, os.SEEK_END))
+    first = offset // header.chunk_size
+    if length == 0 or first >= count:
+        return b""
+    last = min((offset + length - 1) // header.chunk_size, count - 1)
+
+    source.seek(HEADER_SIZE + first * header.sealed_chunk_size)
+    sealed = source.read((last - first + 1) * header.sealed_chunk_size)
+    plain = b"".join(_Sealer(header, key, decrypt=True).process(
+        _split(sealed, header.sealed_chunk_size), final=last == count - 1, start=first))
+    skip = offset - first * header.chunk_size
+    return plain[skip:skip + length]
+
+
+def plaintext_size(source) -> int:
+    """Plaintext size of a container file, from its size alone (no decryption)."""
+    source.seek(0)
+    header = ContainerHeader.parse(source.read(HEADER_SIZE))
+    size = source.seek(0, os.SEEK_END)
+    return size - HEADER_SIZE - header.chunk_count(size) * TAG_SIZE
+
+
+# --------------------------------------------------------------------------
+# Recipe operations
+# --------------------------------------------------------------------------
+
+def aead_encrypt(input_data, key: str, algorithm: str) -> tuple[bool, bytes]:
+    """Encrypts bytes (or a string, as UTF-8) into a chunked AEAD container."""
+    try:
+        data = input_data.encode('utf-8') if isinstance(input_data, str) else input_data
+        return True, encrypt_data(data, key, algorithm)
+    except ValueError as e:
+        return False, str(e)
+    except Exception as e:
+        return False, f"{algorithm} encryption failed: {e}"
+
+
+def aead_decrypt(input_data: bytes, key: str, algorithm: str) -> tuple[bool, bytes]:
+    """Decrypts a chunked AEAD container back to the original bytes."""
+    try:
+        header = ContainerHeader.parse(input_data)
+        if header.algorithm_id != ALGORITHMS[algorithm][0]:
+            return False, f"Input was not encrypted with {algorithm}."
+        return True, decrypt_data(input_data, key)
+    except ValueError as e:
+        return False, str(e)
+    except Exception as e:
+        return False, f"{algorithm} decryption failed: {e}"
+
+
+# --------------------------------------------------------------------------
+# Streaming (see streaming.py)
+# --------------------------------------------------------------------------
+
+class AEADEncryptor:
+    """Streaming encryptor: emits the header, then sealed chunks as they fill up."""
+
+    def __init__(self, key, algorithm, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.header = ContainerHeader.new(algorithm, chunk_size)
+        self.sealer = _Sealer(self.header, key)
+        self.pending = self.header.raw  # Sent with the first output
+        self.buffer = b""
+
+    def _emit(self, sealed):
+        output, self.pending = self.pending + b"".join(sealed), b""
+        return output
+
+    def update(self, chunk):
+        data = self.buffer + chunk
+        # Always hold back the last (possibly full) chunk: only finalize knows it is the final one
+        cut = (len(data) - 1) // self.header.chunk_size * self.header.chunk_size if data else 0
+        self.buffer = data[cut:]
+        if not cut:
+            return b""
+        return self._emit(self.sealer.process(_split(data[:cut], self.header.chunk_size)))
+
+    def finalize(self):
+        data, self.buffer = self.buffer, b""
+        return self._emit(self.sealer.process([data], final=True))
+
+
+class AEADDecryptor:
+    """Streaming decryptor: verifies and opens chunks as they arrive."""
+
+    def __init__(self, key, algorithm):
+        self.key = key
+        self.algorithm = algorithm
+        self.sealer = None
+        self.buffer = b""
+
+    def update(self, chunk):
+        data = self.buffer + chunk
+        if self.sealer is None:
+            if len(data) < HEADER_SIZE:
+                self.buffer = data
+                return b""
+            header = ContainerHeader.parse(data)
+            if header.algorithm_id != ALGORITHMS[self.algorithm][0]:
+                raise ValueError(f"Input was not encrypted with {self.algorithm}.")
+            self.sealer = _Sealer(header, self.key, decrypt=True)
+            data = data[HEADER_SIZE:]
+        size = self.sealer.header.sealed_chunk_size
+        cut = (len(data) - 1) // size * size if data else 0
+        self.buffer = data[cut:]
+        return b"".join(self.sealer.process(_split(data[:cut], size))) if cut else b""
+
+    def finalize(self):
+        if self.sealer is None or len(self.buffer) < TAG_SIZE:
+            raise ValueError("Encrypted container is truncated.")
+        data, self.buffer = self.buffer, b""
+        return b"".join(self.sealer.process([data], final=True))
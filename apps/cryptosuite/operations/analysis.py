@@ -0,0 +1,222 @@
+# File: operations/analysis.py
+# Frequency analysis for breaking classic ciphers.
+#
+# Everything works from a 26-bin letter histogram built in one np.bincount
+# pass, so trying every Caesar shift costs O(26 * 26) after the O(n) count:
+# the histogram is rotated into a 26 x 26 matrix (row s = the letters seen if
+# the text was shifted by s) and all rows are scored against English letter
+# frequencies with chi-squared at once. Vigenère keys are recovered by
+# splitting the letters into columns and solving each one as a Caesar shift.
+
+import numpy as np
+
+from .ciphers import caesar_cipher
+from .polyalphabetic import letter_mask, vigenere_cipher
+
+# Relative frequencies of A-Z in English text
+ENGLISH_FREQUENCIES = np.array([
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966, 0.00153,
+    0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987, 0.06327, 0.09056,
+    0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+])
+ENGLISH_FREQUENCIES /= ENGLISH_FREQUENCIES.sum()
+
+PREVIEW_LENGTH = 60
+
+# _ROTATIONS[s, i] = index of the ciphertext letter that decrypts to letter i under shift s
+_ROTATIONS = (np.arange(26)[:, None] + np.arange(26)[None, :]) % 26
+
+
+def letter_values(data) -> np.ndarray:
+    """The ASCII letters of str or bytes as values 0-25, in order (case folded)."""
+    chars = np.frombuffer(data.encode('utf-8') if isinstance(data, str) else data, dtype=np.uint8)
+    return (chars[letter_mask(chars)] | np.uint8(0x20)) - np.uint8(ord('a'))
+
+
+def letter_histogram(data) -> np.ndarray:
+    """Counts of A-Z (case-insensitive) in str or bytes."""
+    return np.bincount(letter_values(data), minlength=26)
+
+
+def shift_scores(histogram: np.ndarray) -> np.ndarray:
+    """Chi-squared distance from English for every shift 0-25 (lower is more English-like).
+
+    Score s is for the text decrypted by shifting back s places.
+    """
+    total = histogram.sum()
+    if not total:
+        return np.full(26, np.inf)
+    observed = histogram[_ROTATIONS]
+    expected = total * ENGLISH_FREQUENCIES
+    return (((observed - expected) ** 2) / expected).sum(axis=1)
+
+
+def rank_shifts(data):
+    """All 26 shifts as (shift, chi-squared), best first, plus the letter count."""
+    return rank_histogram(letter_histogram(data))
+
+
+def rank_histogram(histogram):
+    """rank_shifts() for an existing A-Z histogram."""
+    scores = shift_scores(histogram)
+    order = np.argsort(scores, kind='stable')
+    return [(int(shift), float(scores[shift])) for shift in order], int(histogram.sum())
+
+
+def caesar_confidence(ranked, letter_count):
+    """Rough 0-1 confidence that the best shift is right, from how clearly it beats the runner-up."""
+    if letter_count < 10:
+        return 0.0
+    (_, best), (_, second) = ranked[0], ranked[1]
+    separation = second / max(best, 1e-9)
+    fit = best / letter_count  # English text usually scores well under 0.5 per letter
+    confidence = min(0.95, 0.4 + 0.15 * np.log2(separation)) if fit < 1.0 else 0.3
+    return max(0.0, float(confidence))
+
+
+def crack_caesar(input_data, candidates: int = 5) -> tuple[bool, str]:
+    """Ranks Caesar shifts by how English the decryption looks, with a preview of each."""
+    text = input_data.decode('utf-8', errors='replace') if isinstance(input_data, (bytes, bytearray)) else input_data
+    ranked, letter_count = rank_shifts(text)
+    if not letter_count:
+        return False, "Input contains no letters to analyse."
+
+    sample = " ".join(text[:PREVIEW_LENGTH * 2].split())[:PREVIEW_LENGTH]
+    lines = [f"Caesar analysis of {letter_count:,} letters (chi-squared vs English, lower is better)", ""]
+    for rank, (shift, score) in enumerate(ranked[:candidates], 1):
+        preview = caesar_cipher(sample, shift, decrypt=True)[1].rstrip()
+        lines.append(f"{rank}. Shift {shift:>2}  χ²={score:10.1f}  {preview}")
+    lines.append("")
+    best_shift = ranked[0][0]
+    if best_shift:
+        lines.append(f"Best guess: Caesar Decrypt with shift {best_shift} "
+                     f"({caesar_confidence(ranked, letter_count):.0%} confidence)")
+    else:
+        lines.append("Best guess: the text is not shifted (shift 0)")
+    return True, "\n".join(lines)
+
+
+# --------------------------------------------------------------------------
+# Vigenère
+# --------------------------------------------------------------------------
+#
+# The key length is found with the index of coincidence (IoC): splitting the
+# letters into L columns by strided slicing, each column is a Caesar cipher
+# when L is the key length, so its IoC approaches English (~0.066) instead of
+# random text (~0.038). Kasiski examination (distances between repeated
+# trigrams) is reported alongside. Each column is then solved with the
+# Caesar shift scorer above, and the resulting keys are ranked by how English
+# the full decryption looks.
+
+ENGLISH_IOC = float((ENGLISH_FREQUENCIES ** 2).sum())
+RANDOM_IOC = 1 / 26
+ANALYSIS_LETTERS = 1_000_000  # Key length statistics use at most this many letters
+KASISKI_LETTERS = 100_000
+
+
+def index_of_coincidence(values: np.ndarray) -> float:
+    """Probability that two letters drawn from values (0-25) are the same."""
+    n = values.size
+    if n < 2:
+        return 0.0
+    counts = np.bincount(values, minlength=26)
+    return float((counts * (counts - 1)).sum() / (n * (n - 1)))
+
+
+def column_ioc(values: np.ndarray, key_length: int) -> float:
+    """Mean IoC of the key_length columns values[j::key_length]."""
+    return float(np.mean([index_of_coincidence(values[j::key_length]) for j in range(key_length)]))
+
+
+def kasiski_support(values: np.ndarray, key_lengths) -> dict:
+    """Fraction of repeated-trigram distances divisible by each candidate key length."""
+    values = values[:KASISKI_LETTERS].astype(np.int32)
+    if values.size < 3:
+        return {length: 0.0 for length in key_lengths}
+    trigrams = values[:-2] * 676 + values[1:-1] * 26 + values[2:]
+    order = np.argsort(trigrams, kind='stable')  # Positions of equal trigrams end up adjacent, in order
+    repeated = trigrams[order[1:]] == trigrams[order[:-1]]
+    distances = (order[1:] - order[:-1])[repeated]
+    if not distances.size:
+        return {length: 0.0 for length in key_lengths}
+    return {length: float((distances % length == 0).mean()) for length in key_lengths}
+
+
+def rank_key_lengths(values: np.ndarray, max_length: int = 20):
+    """Candidate key lengths as (length, IoC, Kasiski support), most likely first.
+
+    Multiples of a good length score as well as the length itself, so a
+    length is ranked after any divisor of it whose IoC is nearly as high.
+    """
+    sample = values[:ANALYSIS_LETTERS]
+    lengths = range(1, max(1, min(max_length, sample.size // 2)) + 1)
+    iocs = {length: column_ioc(sample, length) for length in lengths}
+    support = kasiski_support(sample, lengths)
+
+    def has_good_divisor(length):
+        return any(length % d == 0 and iocs[d] >= 0.9 * iocs[length] for d in lengths if d < length)
+
+    ranked = sorted(lengths, key=lambda length: (has_good_divisor(length), -iocs[length]))
+    return [(length, iocs[length], support[length]) for length in ranked]
+
+
+def _minimal_period(key: str) -> str:
+    for size in range(1, len(key)):
+        if len(key) % size == 0 and key[:size] * (len(key) // size) == key:
+            return key[:size]
+    return key
+
+
+def solve_key(values: np.ndarray, key_length: int):
+    """Most likely key of a given length, and the chi-squared per letter of the decryption."""
+    shifts, total = [], 0.0
+    for j in range(key_length):
+        scores = shift_scores(np.bincount(values[j::key_length], minlength=26))
+        shift = int(np.argmin(scores))
+        shifts.append(shift)
+        total += float(scores[shift])
+    key = "".join(chr(ord('A') + shift) for shift in shifts)
+    return _minimal_period(key), total / max(values.size, 1)
+
+
+def rank_vigenere_keys(data, max_length: int = 20, candidates: int = 5):
+    """Ranked key guesses as dicts of key, length, ioc, kasiski and fit (chi-squared per letter, lower is better)."""
+    values = letter_values(data)
+    sample = values[:ANALYSIS_LETTERS]
+    guesses = {}
+    for length, ioc, support in rank_key_lengths(sample, max_length)[:max(candidates * 2, 4)]:
+        key, fit = solve_key(sample, length)
+        if key not in guesses:
+            guesses[key] = {"key": key, "length": length, "ioc": ioc, "kasiski": support, "fit": fit}
+    ranked = sorted(guesses.values(), key=lambda guess: guess["fit"])
+    return ranked[:candidates], int(values.size)
+
+
+def vigenere_confidence(guesses, letter_count):
+    """Rough 0-1 confidence that the best guess is a real multi-letter key."""
+    if letter_count < 100 or not guesses or len(guesses[0]["key"]) < 2:
+        return 0.0
+    best = guesses[0]
+    if best["ioc"] < (ENGLISH_IOC + RANDOM_IOC) / 2:
+        return 0.0
+    return 0.85 if best["fit"] < 0.5 else 0.6 if best["fit"] < 1.0 else 0.0
+
+
+def crack_vigenere(input_data, max_length: int = 20, candidates: int = 5) -> tuple[bool, str]:
+    """Recovers likely Vigenère keys from ciphertext alone, with a preview of each decryption."""
+    text = input_data.decode('utf-8', errors='replace') if isinstance(input_data, (bytes, bytearray)) else input_data
+    guesses, letter_count = rank_vigenere_keys(text, max_length, candidates)
+    if letter_count < 20:
+        return False, "Need at least 20 letters to estimate a Vigenère key."
+
+    sample = " ".join(text[:PREVIEW_LENGTH * 2].split())[:PREVIEW_LENGTH]
+    lines = [f"Vigenère analysis of {letter_count:,} letters "
+             f"(English IoC ≈ {ENGLISH_IOC:.3f}, random ≈ {RANDOM_IOC:.3f})", ""]
+    for rank, guess in enumerate(guesses, 1):
+        preview = vigenere_cipher(sample, guess["key"], decrypt=True)[1].rstrip()
+        lines.append(f"{rank}. Key {guess['key']!r} (length {len(guess['key'])})  IoC={guess['ioc']:.4f}  "
+                     f"Kasiski={guess['kasiski']:.0%}  χ²/letter={guess['fit']:.2f}  {preview}")
+    lines.append("")
+    lines.append(f"Best guess: Vigenère Decrypt with key {guesses[0]['key']} "
+                 f"({vigenere_confidence(guesses, letter_count):.0%} confidence)")
+    return True, "\n".join(lines)
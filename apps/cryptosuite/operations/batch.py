@@ -0,0 +1,175 @@
+# File: operations/batch.py
+# Applies one recipe to every file in a directory tree.
+#
+# Files are processed on a pool of worker processes and written to the same
+# relative path under an output directory. The parent only submits a few
+# files per worker at a time, and streamable recipes run in chunks, so memory
+# stays bounded however many files there are. Each result is written to
+# an output.part file and renamed into place when complete, and a JSON-lines
+# manifest records every file's status and timing as soon as it finishes. A
+# rerun skips files the manifest lists as done, provided the recipe (steps,
+# direction and output suffix, by digest) is the same, their size and
+# modification time are unchanged and the output still exists; failed files
+# are tried again. When a previous run's output directory is the input (e.g.
+# to invert it), its manifest and any .part file next to a finished output of
+# the same name are not inputs; they are listed in the summary instead.
+
+import fnmatch
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .streaming import bake_stream
+
+MANIFEST_NAME = "batch-manifest.jsonl"
+IN_FLIGHT_PER_WORKER = 2  # Files submitted ahead per worker
+PART_SUFFIX = ".part"
+
+
+def _is_artefact(name, filenames):
+    """True for a batch manifest, or for an unfinished "x.part" output left next to its finished "x"."""
+    return name == MANIFEST_NAME or (name.endswith(PART_SUFFIX) and name[:-len(PART_SUFFIX)] in filenames)
+
+
+def find_inputs(input_root, output_root=None, pattern="*", excluded=None):
+    """Yields paths relative to input_root of matching files, in sorted order.
+
+    An output directory inside the input tree is not descended into. Files
+    left by an earlier batch run whose output directory is now the input
+    (manifests, and .part files beside a finished output of the same name)
+    are left out and appended to the excluded list, if one is given.
+    """
+    skip = os.path.abspath(output_root) if output_root else None
+    for dirpath, dirnames, filenames in os.walk(input_root):
+        dirnames[:] = sorted(name for name in dirnames if os.path.abspath(os.path.join(dirpath, name)) != skip)
+        names = set(filenames)
+        for name in sorted(filenames):
+            if not fnmatch.fnmatch(name, pattern):
+                continue
+            relative_path = os.path.relpath(os.path.join(dirpath, name), input_root)
+            if _is_artefact(name, names):
+                if excluded is not None:
+                    excluded.append(relative_path)
+                continue
+            yield relative_path
+
+
+def load_manifest(path):
+    """Latest record per relative path from a manifest; a missing file gives an empty dict.
+
+    A line cut short by an interrupted run is ignored.
+    """
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and "path" in record:
+                records[record["path"]] = record
+    return records
+
+
+def _fingerprint(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def recipe_digest(steps, direction=None, suffix=""):
+    """Short digest of everything that determines a run's outputs besides the input files."""
+    recipe = json.dumps([direction, suffix, steps], sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(recipe.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def is_complete(record, input_path, output_path, recipe):
+    """True if a manifest record shows the file was processed with this recipe and nothing has changed since."""
+    return (record is not None and record.get("status") == "ok" and record.get("recipe") == recipe
+            and os.path.exists(output_path)
+            and (record.get("size"), record.get("mtime_ns")) == _fingerprint(input_path))
+
+
+def process_one(steps, direction, input_path, output_path):
+    """Runs the recipe on one file (in a worker process); returns the status fields of its record."""
+    start = time.perf_counter()
+    part_path = output_path + PART_SUFFIX
+    try:
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        with open(input_path, 'rb') as source, open(part_path, 'wb') as sink:
+            bake_stream(steps, source, sink, direction)
+        os.replace(part_path, output_path)
+    except Exception as e:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        return {"status": "error", "error": str(e) or type(e).__name__, "seconds": time.perf_counter() - start}
+    return {"status": "ok", "bytes_out": os.path.getsize(output_path), "seconds": time.perf_counter() - start}
+
+
+def run_batch(steps, input_root, output_root, direction=None, manifest_path=None, jobs=None, pattern="*",
+              suffix="", progress=None):
+    """Applies a recipe to every matching file under input_root, mirroring the tree under output_root.
+
+    progress(record) is called in the parent as each file finishes. Returns
+    a summary dict: processed, skipped, failed, bytes_in, bytes_out,
+    seconds, manifest (its path) and excluded (relative paths of batch
+    manifests and .part files that were not treated as inputs).
+    """
+    if not os.path.isdir(input_root):
+        raise ValueError(f"Input directory not found: {input_root}")
+    if os.path.abspath(input_root) == os.path.abspath(output_root):
+        raise ValueError("Output directory must differ from the input directory.")
+    jobs = jobs or os.cpu_count() or 1
+    manifest_path = manifest_path or os.path.join(output_root, MANIFEST_NAME)
+    os.makedirs(output_root, exist_ok=True)
+    previous = load_manifest(manifest_path)
+    recipe = recipe_digest(steps, direction, suffix)
+    summary = {"processed": 0, "skipped": 0, "failed": 0, "bytes_in": 0, "bytes_out": 0,
+               "manifest": manifest_path, "excluded": []}
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool, open(manifest_path, 'a', encoding='utf-8') as manifest:
+        pending = {}
+
+        def collect(done):
+            for future in done:
+                record = pending.pop(future)
+                record.update(future.result())
+                record["finished"] = time.strftime("%Y-%m-%d %H:%M:%S")
+                manifest.write(json.dumps(record) + "\n")
+                manifest.flush()  # Completed files stay recorded if the run is interrupted
+                if record["status"] == "ok":
+                    summary["processed"] += 1
+                    summary["bytes_in"] += record["size"]
+                    summary["bytes_out"] += record["bytes_out"]
+                else:
+                    summary["failed"] += 1
+                if progress:
+                    progress(record)
+
+        for relative_path in find_inputs(input_root, output_root, pattern, summary["excluded"]):
+            input_path = os.path.join(input_root, relative_path)
+            output_path = os.path.join(output_root, relative_path + suffix)
+            if os.path.abspath(input_path) == os.path.abspath(manifest_path):
+                summary["excluded"].append(relative_path)
+                continue
+            if is_complete(previous.get(relative_path), input_path, output_path, recipe):
+                summary["skipped"] += 1
+                continue
+
+            if len(pending) >= jobs * IN_FLIGHT_PER_WORKER:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            size, mtime_ns = _fingerprint(input_path)
+            future = pool.submit(process_one, steps, direction, input_path, output_path)
+            pending[future] = {"path": relative_path, "size": size, "mtime_ns": mtime_ns, "recipe": recipe}
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    summary["seconds"] = time.perf_counter() - start
+    return summary
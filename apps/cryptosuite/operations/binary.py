@@ -0,0 +1,103 @@
+# File: operations/binary.py
+# Bytes <-> text of 0s and 1s, eight bits per byte separated by spaces.
+#
+# Both directions work on whole NumPy buffers (unpackbits / packbits) instead
+# of formatting or parsing one character at a time.
+
+import numpy as np
+
+_ZERO, _ONE, _SPACE = ord('0'), ord('1'), ord(' ')
+_WHITESPACE = np.zeros(256, dtype=bool)
+_WHITESPACE[list(b" \t\r\n\x0b\x0c")] = True
+
+
+def encode_bits(data) -> bytes:
+    """ASCII '01001000 01101001' for the given bytes."""
+    if not data:
+        return b""
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8)).reshape(-1, 8)
+    text = np.full((bits.shape[0], 9), _SPACE, dtype=np.uint8)
+    text[:, :8] = bits + _ZERO
+    return text.tobytes()[:-1]
+
+
+def decode_bits(text) -> bytes:
+    """Bytes for ASCII 0s and 1s; whitespace is ignored, anything else raises ValueError."""
+    chars = np.frombuffer(text, dtype=np.uint8)
+    digits = chars[~_WHITESPACE[chars]]
+    if digits.size and ((digits != _ZERO) & (digits != _ONE)).any():
+        raise ValueError("Binary input may only contain 0, 1 and whitespace.")
+    if digits.size % 8:
+        raise ValueError(f"Binary input has {digits.size} bits, which is not a whole number of bytes.")
+    return np.packbits(digits - _ZERO).tobytes()
+
+
+def is_binary(text: str) -> bool:
+    """True if text is non-empty whole bytes of 0s and 1s (whitespace allowed)."""
+    try:
+        data = text.encode('ascii')
+    except UnicodeEncodeError:
+        return False
+    chars = np.frombuffer(data, dtype=np.uint8)
+    digits = chars[~_WHITESPACE[chars]]
+    return bool(digits.size) and digits.size % 8 == 0 and not ((digits != _ZERO) & (digits != _ONE)).any()
+
+
+def to_binary(input_data) -> tuple[bool, str]:
+    """Encodes bytes (or a string, as UTF-8) as space-separated 8-bit groups."""
+    try:
+        data = input_data.encode('utf-8') if isinstance(input_data, str) else input_data
+        return True, encode_bits(data).decode('ascii')
+    except Exception as e:
+        return False, f"Failed to encode to Binary: {e}"
+
+
+def from_binary(input_data) -> tuple[bool, bytes]:
+    """Decodes 8-bit groups of 0s and 1s back to the original bytes."""
+    try:
+        data = input_data.encode('utf-8') if isinstance(input_data, str) else input_data
+        return True, decode_bits(data)
+    except ValueError as e:
+        return False, str(e)
+
+
+# --------------------------------------------------------------------------
+# Streaming (see streaming.py)
+# --------------------------------------------------------------------------
+
+class BinaryEncoder:
+    """Keeps the space between groups when output is split across chunks."""
+
+    def __init__(self):
+        self.started = False
+
+    def update(self, chunk):
+        if not chunk:
+            return b""
+        output = encode_bits(chunk)
+        if self.started:
+            output = b" " + output
+        self.started = True
+        return output
+
+    def finalize(self):
+        return b""
+
+
+class BinaryDecoder:
+    """Decodes whole bytes as their 8 bits arrive, holding back a partial group."""
+
+    def __init__(self):
+        self.pending = np.empty(0, dtype=np.uint8)
+
+    def update(self, chunk):
+        chars = np.frombuffer(chunk, dtype=np.uint8)
+        digits = np.concatenate((self.pending, chars[~_WHITESPACE[chars]]))
+        cut = digits.size - digits.size % 8
+        self.pending = digits[cut:]
+        return decode_bits(digits[:cut].tobytes()) if cut else b""
+
+    def finalize(self):
+        if self.pending.size:
+            raise ValueError(f"Binary input ends with {self.pending.size} stray bits.")
+        return b""
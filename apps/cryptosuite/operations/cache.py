@@ -0,0 +1,127 @@
+# File: operations/cache.py
+# Memoizes intermediate recipe results so a step only runs once per input.
+#
+# Each result is keyed by a signature of the step that produced it: the
+# step's operation and arguments plus a digest of the data it was given,
+# which is the previous step's actual output. An edit to the input or to an
+# earlier step therefore re-runs steps only until some intermediate result
+# comes out unchanged (whitespace that From Hex ignores, a case change before
+# From Base32); every step after that is found in the cache again. Each entry
+# keeps the digest of its value, so the next step's key is formed without
+# hashing the cached data again.
+#
+# Entries are evicted least-recently-used once the memory budget is exceeded.
+# Large entries are stored zlib-compressed when that actually saves space.
+
+import hashlib
+import json
+import threading
+import zlib
+from collections import OrderedDict
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+COMPRESS_THRESHOLD = 256 * 1024  # Entries at least this large are compressed
+SIGNATURE_SIZE = 16
+
+
+def value_digest(value):
+    """Digest of a value passed between steps (str or bytes)."""
+    is_text = isinstance(value, str)
+    data = value.encode('utf-8') if is_text else bytes(value)
+    return hashlib.blake2b(data, digest_size=SIGNATURE_SIZE, person=b"text" if is_text else b"bytes").digest()
+
+
+def step_signature(data_digest, operation_name, args, direction=None):
+    """Signature of the result of applying one step to the data with the given value_digest."""
+    step = json.dumps([direction, operation_name, args or {}], sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(data_digest + step.encode('utf-8'), digest_size=SIGNATURE_SIZE).digest()
+
+
+class StepResultCache:
+    """Thread-safe LRU cache of step results bounded by an approximate memory budget."""
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._entries = OrderedDict()  # signature -> (is_text, compressed, payload, value digest)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, signature):
+        return signature in self._entries
+
+    def get(self, signature):
+        """Cached value for a signature, or None."""
+        entry = self.lookup(signature)
+        return entry and entry[0]
+
+    def lookup(self, signature):
+        """Cached (value, value digest) for a signature, or None."""
+        with self._lock:
+            entry = self._entries.get(signature)
+            if entry is None:
+                return None
+            self._entries.move_to_end(signature)
+        is_text, compressed, payload, digest = entry
+        data = zlib.decompress(payload) if compressed else payload
+        return (data.decode('utf-8') if is_text else data), digest
+
+    def put(self, signature, value, digest=None):
+        """Caches a value; digest is its value_digest, computed here if not given."""
+        digest = digest or value_digest(value)
+        is_text = isinstance(value, str)
+        payload = value.encode('utf-8') if is_text else bytes(value)
+        compressed = False
+        if len(payload) >= COMPRESS_THRESHOLD:
+            packed = zlib.compress(payload, 1)
+            if len(packed) < len(payload):
+                payload, compressed = packed, True
+        if len(payload) > self.budget_bytes:
+            return  # Never worth evicting everything for one entry
+
+        with self._lock:
+            old = self._entries.pop(signature, None)
+            if old is not None:
+                self.used_bytes -= len(old[2])
+            self._entries[signature] = (is_text, compressed, payload, digest)
+            self.used_bytes += len(payload)
+            while self.used_bytes > self.budget_bytes:
+                _, (_, _, evicted, _) = self._entries.popitem(last=False)
+                self.used_bytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.used_bytes = 0
+
+
+def run_cached(cache, value, steps, execute, direction=None, cancelled=None, progress=None):
+    """Runs steps on value, taking every step whose input and arguments were seen before from the cache.
+
+    execute(operation_name, data, args) -> (success, result) runs one step;
+    progress(index, operation_name) is called before each step that runs.
+    Returns (success, result or error message, number of steps taken from
+    the cache). On failure the message is prefixed with the failing step's
+    name. Returns None if cancelled() became true.
+    """
+    data, digest, reused = value, value_digest(value), 0
+    for index, step in enumerate(steps):
+        operation_name, args = step.get("operation"), step.get("args", {})
+        signature = step_signature(digest, operation_name, args, direction)
+        cached = cache.lookup(signature)
+        if cached is not None:
+            (data, digest), reused = cached, reused + 1
+            continue
+
+        if cancelled and cancelled():
+            return None
+        if progress:
+            progress(index, operation_name)
+        success, data = execute(operation_name, data, args)
+        if not success:
+            return False, f"{operation_name}: {data}", reused
+        digest = value_digest(data)
+        cache.put(signature, data, digest)
+    return True, data, reused
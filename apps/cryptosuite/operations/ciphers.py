@@ -1,17 +1,77 @@
 # File: operations/ciphers.py
+# Monoalphabetic ciphers are applied with str.translate / bytes.translate.
+# Translation tables are built once per shift and cached, so each call is a
+# single C-level pass over the input instead of a Python loop per character.
 
-def caesar_cipher(text: str, shift: int, decrypt: bool = False) -> tuple[bool, str]:
+import string
+from functools import lru_cache
+
+ROT47_FIRST, ROT47_LAST = 33, 126  # Printable ASCII range ('!' to '~') rotated by ROT47
+
+
+def _shifted(alphabet: str, shift: int) -> str:
+    return alphabet[shift:] + alphabet[:shift]
+
+
+@lru_cache(maxsize=None)
+def _caesar_table(shift: int) -> dict:
+    shift %= 26
+    return str.maketrans(
+        string.ascii_lowercase + string.ascii_uppercase,
+        _shifted(string.ascii_lowercase, shift) + _shifted(string.ascii_uppercase, shift)
+    )
+
+
+@lru_cache(maxsize=None)
+def _caesar_bytes_table(shift: int) -> bytes:
+    shift %= 26
+    return bytes.maketrans(
+        (string.ascii_lowercase + string.ascii_uppercase).encode(),
+        (_shifted(string.ascii_lowercase, shift) + _shifted(string.ascii_uppercase, shift)).encode()
+    )
+
+
+@lru_cache(maxsize=None)
+def _atbash_table() -> dict:
+    return str.maketrans(
+        string.ascii_lowercase + string.ascii_uppercase,
+        string.ascii_lowercase[::-1] + string.ascii_uppercase[::-1]
+    )
+
+
+@lru_cache(maxsize=None)
+def _atbash_bytes_table() -> bytes:
+    return bytes.maketrans(
+        (string.ascii_lowercase + string.ascii_uppercase).encode(),
+        (string.ascii_lowercase[::-1] + string.ascii_uppercase[::-1]).encode()
+    )
+
+
+@lru_cache(maxsize=None)
+def _rot47_table() -> dict:
+    printable = "".join(chr(c) for c in range(ROT47_FIRST, ROT47_LAST + 1))
+    return str.maketrans(printable, _shifted(printable, 47))
+
+
+@lru_cache(maxsize=None)
+def _rot47_bytes_table() -> bytes:
+    printable = bytes(range(ROT47_FIRST, ROT47_LAST + 1))
+    return bytes.maketrans(printable, printable[47:] + printable[:47])
+
+
+def caesar_cipher(text, shift: int, decrypt: bool = False) -> tuple[bool, str]:
     """
     Encrypts or decrypts text using the Caesar cipher method.
 
     Args:
-        text (str): The input string to be processed.
+        text (str | bytes): The input to be processed. Bytes are shifted as ASCII.
         shift (int): The number of positions to shift letters.
         decrypt (bool): If True, the function will decrypt the text.
                          If False, it will encrypt.
 
     Returns:
-        A tuple containing a boolean for success and the resulting string.
+        A tuple containing a boolean for success and the resulting string
+        (or bytes, for bytes input).
     """
     if not isinstance(shift, int):
         return False, "Shift value must be an integer."
@@ -19,34 +79,40 @@ def caesar_cipher(text: str, shift: int, decrypt: bool = False) -> tuple[bool, s
     if decrypt:
         shift = -shift
 
-    result = ""
-    for char in text:
-        if 'a' <= char <= 'z':
-            # Handle lowercase letters
-            shifted_char = chr(((ord(char) - ord('a') + shift) % 26) + ord('a'))
-            result += shifted_char
-        elif 'A' <= char <= 'Z':
-            # Handle uppercase letters
-            shifted_char = chr(((ord(char) - ord('A') + shift) % 26) + ord('A'))
-            result += shifted_char
-        else:
-            # Keep non-alphabetic characters unchanged
-            result += char
+    if isinstance(text, (bytes, bytearray)):
+        return True, text.translate(_caesar_bytes_table(shift % 26))
+    # Non-alphabetic characters are not in the table and pass through unchanged
+    return True, text.translate(_caesar_table(shift % 26))
+
+
+def rot_n(text, n: int) -> tuple[bool, str]:
+    """Rotates letters by n positions (ROT-N); ROT-(26 - n) undoes it."""
+    return caesar_cipher(text, n)
+
+
+def rot13(text) -> tuple[bool, str]:
+    """
+    Applies ROT13 to the letters of the text.
+    The cipher is reciprocal, so encryption and decryption are the same.
+    """
+    return caesar_cipher(text, 13)
+
 
-    return True, result
+def rot47(text) -> tuple[bool, str]:
+    """
+    Applies ROT47, rotating every printable ASCII character from '!' to '~'.
+    The cipher is reciprocal, so encryption and decryption are the same.
+    """
+    if isinstance(text, (bytes, bytearray)):
+        return True, text.translate(_rot47_bytes_table())
+    return True, text.translate(_rot47_table())
 
 
-def atbash_cipher(text: str) -> tuple[bool, str]:
+def atbash_cipher(text) -> tuple[bool, str]:
     """
     Encrypts or decrypts text using the Atbash cipher method.
     The cipher is reciprocal, so encryption and decryption are the same.
     """
-    result = ""
-    for char in text:
-        if 'a' <= char <= 'z':
-            result += chr(ord('z') - ord(char) + ord('a'))
-        elif 'A' <= char <= 'Z':
-            result += chr(ord('Z') - ord(char) + ord('A'))
-        else:
-            result += char
-    return True, result
\ No newline at end of file
+    if isinstance(text, (bytes, bytearray)):
+        return True, text.translate(_atbash_bytes_table())
+    return True, text.translate(_atbash_table())
@@ -0,0 +1,340 @@
+# File: operations/codecs.py
+# Base32, Base58, Base85 and Ascii85 codecs.
+#
+# Base58 treats the whole input as one big number, so converting it digit by
+# digit is quadratic and stalls on inputs of a few hundred KB. Here both
+# directions convert through a Decimal (libmpdec multiplies huge numbers in
+# n log n time) by splitting the number in halves recursively:
+#   * digits -> number: hi * base**k + lo, with small leaves done as ints
+#   * number -> digits: divmod by base**k, recursing on both halves. Each
+#     divmod multiplies by a cached reciprocal of base**k (Barrett
+#     reduction), which costs about a third of a Decimal division
+# Encoding runs bytes -> number -> base-58 digits and decoding base-58 digits
+# -> number -> bytes. Powers and reciprocals used for splitting are powers of
+# two in size, so they are cached and shared between both directions.
+#
+# Base32/Base85/Ascii85 work on independent fixed-size groups; they run in
+# aligned chunks so the streaming transforms in streaming.py produce exactly
+# the same output as a one-shot call.
+
+import base64
+import binascii
+import decimal
+from functools import lru_cache
+
+from .streaming import AlignedTransform
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+CODEC_CHUNK_SIZE = 20 * 64 * 1024  # A multiple of both the Base32 (5 byte) and Base85 (4 byte) groups
+
+_B58_PAIRS = [a + b for a in BASE58_ALPHABET for b in BASE58_ALPHABET]
+_B58_VALUES = bytes(BASE58_ALPHABET.index(chr(c)) if chr(c) in BASE58_ALPHABET else 255 for c in range(256))
+_B58_LEAF_DIGITS = 16  # Digits produced per leaf with a plain loop (always even)
+_B58_INT_DIGITS = 1024  # Below this many digits, plain int arithmetic is faster than Decimal
+_DECIMAL_LEAF_BYTES = 512  # Bytes converted to or from a Decimal in one go
+_BARRETT_GUARD = 20  # Extra leading digits kept when estimating a quotient
+
+_EXACT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN,
+                         traps=[decimal.Inexact, decimal.InvalidOperation])
+
+
+@lru_cache(maxsize=None)
+def _int_power(base, exponent):
+    """base ** exponent for exponents that are powers of two (times a leaf size), by squaring."""
+    if exponent <= _B58_LEAF_DIGITS:
+        return base ** exponent
+    half = _int_power(base, exponent // 2)
+    return half * half
+
+
+@lru_cache(maxsize=None)
+def _decimal_power(base, exponent):
+    """base ** exponent as a Decimal; built by squaring to stay clear of int/str conversion limits."""
+    if exponent <= 512:
+        return decimal.Decimal(base ** exponent)
+    half = _decimal_power(base, exponent // 2)
+    return _EXACT.multiply(half, half)
+
+
+def _split_size(size, leaf):
+    """Largest leaf * 2**k strictly below size: the size of the low half when splitting."""
+    part = leaf
+    while part * 2 < size:
+        part *= 2
+    return part
+
+
+@lru_cache(maxsize=None)
+def _reciprocal(base, exponent):
+    """(10**k // base**exponent, k), with 10**k above the square of base**exponent."""
+    power = _decimal_power(base, exponent)
+    k = 2 * (power.adjusted() + 1)
+    return _EXACT.divide_int(_EXACT.scaleb(decimal.Decimal(1), k), power), k
+
+
+def _floor_scaleb(d, exponent):
+    """floor(d * 10**exponent) for d >= 0."""
+    return _EXACT.scaleb(d, exponent).to_integral_value(rounding=decimal.ROUND_FLOOR, context=_EXACT)
+
+
+def _divmod_power(d, base, exponent):
+    """divmod(d, base**exponent) for 0 <= d < base**(2 * exponent), without a Decimal division.
+
+    The quotient is estimated from d's leading digits times the cached
+    reciprocal; the estimate is at most two too small and is then corrected.
+    """
+    power = _decimal_power(base, exponent)
+    reciprocal, k = _reciprocal(base, exponent)
+    drop = max(0, power.adjusted() - _BARRETT_GUARD)
+    quotient = _floor_scaleb(_EXACT.multiply(_floor_scaleb(d, -drop), reciprocal), drop - k)
+    remainder = _EXACT.subtract(d, _EXACT.multiply(quotient, power))
+    while remainder >= power:
+        quotient, remainder = _EXACT.add(quotient, 1), _EXACT.subtract(remainder, power)
+    return quotient, remainder
+
+
+def _int_digits(n, count):
+    """Exactly count base-58 digits of n < 58**count (count = leaf * 2**k)."""
+    if count <= _B58_LEAF_DIGITS:
+        pairs = []
+        for _ in range(count // 2):
+            n, pair = divmod(n, 58 * 58)
+            pairs.append(_B58_PAIRS[pair])
+        return "".join(reversed(pairs))
+    half = count // 2
+    high, low = divmod(n, _int_power(58, half))
+    return _int_digits(high, half) + _int_digits(low, half)
+
+
+def _values_to_int(values):
+    if len(values) <= _B58_LEAF_DIGITS:
+        n = 0
+        for value in values:
+            n = n * 58 + value
+        return n
+    low = _split_size(len(values), _B58_LEAF_DIGITS)
+    return _values_to_int(values[:-low]) * _int_power(58, low) + _values_to_int(values[-low:])
+
+
+def _to_decimal(digits, base, leaf):
+    """Decimal value of big-endian digit values in base 256 (bytes) or 58 (Base58 values)."""
+    if len(digits) <= leaf:
+        return decimal.Decimal(int.from_bytes(digits, 'big') if base == 256 else _values_to_int(digits))
+    low = _split_size(len(digits), leaf)
+    high = _to_decimal(digits[:-low], base, leaf)
+    return _EXACT.add(_EXACT.multiply(high, _decimal_power(base, low)), _to_decimal(digits[-low:], base, leaf))
+
+
+def _from_decimal(d, count, base, leaf, convert, pieces):
+    """Appends the count base-`base` digits of d < base**count to pieces, most significant first.
+
+    count is leaf * 2**k; convert(n, leaf) turns each leaf's int into its piece.
+    """
+    if count <= leaf:
+        pieces.append(convert(int(d), count))
+    elif not d:
+        pieces.append(convert(0, leaf) * (count // leaf))
+    else:
+        high, low = _divmod_power(d, base, count // 2)
+        _from_decimal(high, count // 2, base, leaf, convert, pieces)
+        _from_decimal(low, count // 2, base, leaf, convert, pieces)
+
+
+def _leaf_bytes(n, count):
+    return n.to_bytes(count, 'big')
+
+
+def b58encode(data: bytes) -> str:
+    """Base58 (Bitcoin alphabet); leading zero bytes become leading '1's."""
+    data = bytes(data)
+    stripped = data.lstrip(b"\0")
+    zeros = len(data) - len(stripped)
+    if not stripped:
+        return BASE58_ALPHABET[0] * zeros
+
+    # log(256) / log(58) ~ 1.3657 digits per byte
+    count = _B58_LEAF_DIGITS
+    while count < len(stripped) * 1.3658 + 1:
+        count *= 2
+    if count <= _B58_INT_DIGITS:
+        digits = _int_digits(int.from_bytes(stripped, 'big'), count)
+    else:
+        pieces = []
+        _from_decimal(_to_decimal(stripped, 256, _DECIMAL_LEAF_BYTES), count, 58, _B58_INT_DIGITS,
+                      _int_digits, pieces)
+        digits = "".join(pieces)
+    return BASE58_ALPHABET[0] * zeros + digits.lstrip(BASE58_ALPHABET[0])
+
+
+def b58decode(text) -> bytes:
+    """Decodes Base58 text, raising ValueError on characters outside the alphabet."""
+    if isinstance(text, (bytes, bytearray)):
+        text = bytes(text).decode('ascii', errors='replace')
+    text = text.strip()
+    try:
+        values = text.encode('ascii').translate(_B58_VALUES)
+    except UnicodeEncodeError:
+        values = b"\xff"
+    if 255 in values:
+        raise ValueError("Invalid Base58 character.")
+    stripped = values.lstrip(b"\0")
+    zeros = len(values) - len(stripped)
+    if len(stripped) <= _B58_INT_DIGITS:
+        n = _values_to_int(stripped) if stripped else 0
+        return b"\0" * zeros + n.to_bytes((n.bit_length() + 7) // 8, 'big')
+
+    # log(58) / log(256) ~ 0.7322 bytes per digit
+    count = _DECIMAL_LEAF_BYTES
+    while count < len(stripped) * 0.7323 + 1:
+        count *= 2
+    pieces = []
+    _from_decimal(_to_decimal(stripped, 58, _B58_INT_DIGITS), count, 256, _DECIMAL_LEAF_BYTES, _leaf_bytes, pieces)
+    return b"\0" * zeros + b"".join(pieces).lstrip(b"\0")
+
+
+def _chunked(function, data, chunk_size):
+    if len(data) <= chunk_size:
+        return function(data)
+    view = memoryview(data)
+    return b"".join(function(view[i:i + chunk_size]) for i in range(0, len(data), chunk_size))
+
+
+def _as_bytes(input_data):
+    return input_data.encode('utf-8') if isinstance(input_data, str) else bytes(input_data)
+
+
+def _strip_whitespace(data):
+    return data.translate(None, b" \t\r\n\x0b\x0c")
+
+
+# --------------------------------------------------------------------------
+# Recipe operations
+# --------------------------------------------------------------------------
+
+def to_base32(input_data) -> tuple[bool, str]:
+    """Encodes bytes (or a string, as UTF-8) to Base32."""
+    try:
+        return True, _chunked(base64.b32encode, _as_bytes(input_data), CODEC_CHUNK_SIZE).decode('ascii')
+    except Exception as e:
+        return False, f"Failed to encode to Base32: {e}"
+
+
+def from_base32(input_string) -> tuple[bool, bytes]:
+    """Decodes Base32 (case-insensitive, whitespace ignored) back to bytes."""
+    try:
+        data = _strip_whitespace(_as_bytes(input_string)).upper()
+        if b"=" in data.rstrip(b"="):
+            raise binascii.Error("Padding before the end of the data")
+        return True, _chunked(base64.b32decode, data, CODEC_CHUNK_SIZE // 5 * 8)
+    except (binascii.Error, ValueError) as e:
+        return False, f"Invalid Base32 input: {e}"
+
+
+def to_base58(input_data) -> tuple[bool, str]:
+    """Encodes bytes (or a string, as UTF-8) to Base58."""
+    try:
+        return True, b58encode(_as_bytes(input_data))
+    except Exception as e:
+        return False, f"Failed to encode to Base58: {e}"
+
+
+def from_base58(input_string) -> tuple[bool, bytes]:
+    """Decodes Base58 back to bytes."""
+    try:
+        return True, b58decode(input_string)
+    except ValueError as e:
+        return False, str(e)
+
+
+def to_base85(input_data) -> tuple[bool, str]:
+    """Encodes bytes (or a string, as UTF-8) to Base85 (RFC 1924 alphabet, as used by git)."""
+    try:
+        return True, _chunked(base64.b85encode, _as_bytes(input_data), CODEC_CHUNK_SIZE).decode('ascii')
+    except Exception as e:
+        return False, f"Failed to encode to Base85: {e}"
+
+
+def from_base85(input_string) -> tuple[bool, bytes]:
+    """Decodes Base85 back to bytes."""
+    try:
+        data = _strip_whitespace(_as_bytes(input_string))
+        return True, _chunked(base64.b85decode, data, CODEC_CHUNK_SIZE // 4 * 5)
+    except (binascii.Error, ValueError) as e:
+        return False, f"Invalid Base85 input: {e}"
+
+
+def to_ascii85(input_data) -> tuple[bool, str]:
+    """Encodes bytes (or a string, as UTF-8) to Ascii85 ('z' abbreviates zero groups)."""
+    try:
+        return True, _chunked(base64.a85encode, _as_bytes(input_data), CODEC_CHUNK_SIZE).decode('ascii')
+    except Exception as e:
+        return False, f"Failed to encode to Ascii85: {e}"
+
+
+def from_ascii85(input_string) -> tuple[bool, bytes]:
+    """Decodes Ascii85, with or without Adobe's <~ ~> delimiters."""
+    try:
+        data = _strip_whitespace(_as_bytes(input_string))
+        if data.startswith(b"<~") and data.endswith(b"~>"):
+            data = data[2:-2]
+        return True, base64.a85decode(data)
+    except (binascii.Error, ValueError) as e:
+        return False, f"Invalid Ascii85 input: {e}"
+
+
+# --------------------------------------------------------------------------
+# Streaming (see streaming.py)
+# --------------------------------------------------------------------------
+
+class Base32Encoder(AlignedTransform):
+    block = 5
+
+    def convert(self, data):
+        return base64.b32encode(data)
+
+
+class Base32Decoder(AlignedTransform):
+    block = 8
+    strip_whitespace = True
+
+    def __init__(self):
+        super().__init__()
+        self.padded = False  # Padding seen; only more padding may follow
+
+    def update(self, chunk):
+        chunk = _strip_whitespace(chunk)
+        if (self.padded and chunk.lstrip(b"=")) or b"=" in chunk.rstrip(b"="):
+            raise ValueError("Invalid Base32 input: Padding before the end of the data")
+        self.padded = self.padded or chunk.endswith(b"=")
+        return super().update(chunk)
+
+    def convert(self, data):
+        try:
+            return base64.b32decode(data.upper())
+        except binascii.Error as e:
+            raise ValueError(f"Invalid Base32 input: {e}")
+
+
+class Base85Encoder(AlignedTransform):
+    block = 4
+
+    def convert(self, data):
+        return base64.b85encode(data)
+
+
+class Base85Decoder(AlignedTransform):
+    block = 5
+    strip_whitespace = True
+
+    def convert(self, data):
+        try:
+            return base64.b85decode(data)
+        except ValueError as e:
+            raise ValueError(f"Invalid Base85 input: {e}")
+
+
+class Ascii85Encoder(AlignedTransform):
+    block = 4
+
+    def convert(self, data):
+        return base64.a85encode(data)
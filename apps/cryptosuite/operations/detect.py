@@ -0,0 +1,193 @@
+# File: operations/detect.py
+# Auto-Detect: guesses which decoding or decryption applies to a text.
+#
+# One np.bincount gives the count of every byte value, and each format check
+# is then a question about which bins are non-empty ("Hex" = every byte is a
+# hex digit or whitespace), so the input is scanned once however many formats
+# are tried. Inputs over SAMPLE_THRESHOLD characters are profiled from evenly
+# spaced blocks (always including the first and last, where delimiters and
+# padding live); length checks then only apply to complete profiles. The
+# letter analyses that need the text in order read a bounded prefix.
+# Operations the registry lists as placeholders (URL Decode) are never
+# suggested, so "+Add" and Magic only see steps that can run.
+
+import re
+import string
+
+import numpy as np
+
+from .analysis import caesar_confidence, rank_histogram, rank_vigenere_keys, vigenere_confidence
+from .codecs import BASE58_ALPHABET
+from .registry import DECRYPT, get_operation
+
+SAMPLE_THRESHOLD = 1024 * 1024
+SAMPLE_BLOCKS = 64
+SAMPLE_BLOCK_SIZE = 16 * 1024
+ORDERED_SAMPLE = 20_000  # Characters read by the Vigenère check
+MAX_SUGGESTIONS = 5
+
+
+def _byte_class(chars) -> np.ndarray:
+    table = np.zeros(256, dtype=bool)
+    table[list(chars.encode('ascii'))] = True
+    return table
+
+
+WHITESPACE = _byte_class(" \t\r\n\x0b\x0c")
+HEX = _byte_class(string.hexdigits)
+BINARY = _byte_class("01")
+MORSE = _byte_class(".-/")
+BASE64 = _byte_class(string.ascii_letters + string.digits + "+/=")
+BASE32 = _byte_class(string.ascii_uppercase + "234567=")
+BASE58 = _byte_class(BASE58_ALPHABET)
+BASE85 = _byte_class(string.digits + string.ascii_letters + "!#$%&()*+-;<=>?@^_`{|}~")
+BASE85_SYMBOLS = _byte_class("!#$%&()*-;<>?@^_`{|}~")  # In Base85 but not in Base64
+ASCII85 = _byte_class("".join(map(chr, range(ord('!'), ord('u') + 1))) + "z")
+DIGITS = _byte_class(string.digits)
+LETTERS = _byte_class(string.ascii_letters)
+_URL_ESCAPE = re.compile(rb"%[0-9A-Fa-f]{2}")
+
+
+def sample_bytes(text):
+    """UTF-8 bytes of text, or of evenly spaced blocks of it when it is large; returns (bytes, complete)."""
+    if len(text) <= SAMPLE_THRESHOLD:
+        return text.encode('utf-8', errors='replace'), True
+    starts = np.linspace(0, len(text) - SAMPLE_BLOCK_SIZE, SAMPLE_BLOCKS).astype(np.int64)
+    blocks = "".join(text[start:start + SAMPLE_BLOCK_SIZE] for start in starts)
+    return blocks.encode('utf-8', errors='replace'), False
+
+
+class ByteProfile:
+    """Byte histogram of a text (or of a sample of it) with set-membership queries."""
+
+    def __init__(self, text):
+        self.sample, self.complete = sample_bytes(text)
+        self.histogram = np.bincount(np.frombuffer(self.sample, dtype=np.uint8), minlength=256)
+        self.stripped = self.sample.strip()
+
+    def count(self, byte_class) -> int:
+        return int(self.histogram[byte_class].sum())
+
+    def has(self, char) -> bool:
+        return bool(self.histogram[ord(char)])
+
+    def only(self, byte_class, whitespace=True) -> bool:
+        """True if every byte is in byte_class (or whitespace, when allowed), and at least one is in it."""
+        allowed = byte_class | WHITESPACE if whitespace else byte_class
+        return not self.histogram[~allowed].any() and bool(self.histogram[byte_class].any())
+
+    def symbols(self, byte_class) -> int:
+        """Number of non-whitespace bytes in byte_class; only meaningful for complete profiles."""
+        return self.count(byte_class & ~WHITESPACE)
+
+    def padded_at_end(self, pad="=", limit=2) -> bool:
+        """True if pad characters, if any, only appear as up to limit trailing characters."""
+        trailing = len(self.stripped) - len(self.stripped.rstrip(pad.encode()))
+        return trailing <= limit and self.histogram[ord(pad)] == trailing
+
+    def letter_histogram(self) -> np.ndarray:
+        return self.histogram[ord('A'):ord('Z') + 1] + self.histogram[ord('a'):ord('z') + 1]
+
+
+def _suggest(operation, confidence, reason, pattern, args=None):
+    suggestion = {"operation": operation, "confidence": confidence, "reason": reason, "pattern": pattern}
+    if args:
+        suggestion["args"] = args
+    return suggestion
+
+
+def _available(operation_name):
+    """True if the Decrypt sidebar has a working operation of this name (not a placeholder)."""
+    operation = get_operation(operation_name, DECRYPT)
+    return operation is not None and operation.implemented
+
+
+def _encoding_suggestions(profile):
+    """Suggestions for the text encodings, from the byte classes alone."""
+    suggestions = []
+    whole = profile.complete
+
+    if profile.only(BINARY):
+        if not whole or profile.symbols(BINARY) % 8 == 0:
+            suggestions.append(_suggest("From Binary", 0.95, "Text appears to be binary encoded",
+                                        "Contains only 0s and 1s and grouped by 8 bits"))
+
+    if profile.only(HEX):
+        if not whole or profile.symbols(HEX) % 2 == 0:
+            suggestions.append(_suggest("From Hex", 0.6 if profile.only(BINARY) else 0.9,
+                                        "Text consists of valid hexadecimal characters", "Contains 0-9, A-F, a-f"))
+
+    if profile.only(MORSE) and (profile.has('.') or profile.has('-')):
+        suggestions.append(_suggest("From Morse Code", 0.8, "Text appears to be Morse code",
+                                    "Contains dots, dashes, and proper spacing"))
+
+    if profile.stripped.startswith(b"<~") and profile.stripped.endswith(b"~>"):
+        body = profile.histogram.copy()
+        body[ord('~')] -= 2  # '<' and '>' are themselves Ascii85 characters
+        if not body[~(ASCII85 | WHITESPACE)].any():
+            suggestions.append(_suggest("From Ascii85", 0.9, "Text is wrapped in Ascii85 <~ ~> delimiters",
+                                        "Characters ! to u (and z) between <~ and ~>"))
+
+    text_like = profile.has(' ') and profile.count(LETTERS) > 0.5 * len(profile.sample)
+    if profile.only(BASE64) and profile.padded_at_end() and not text_like:
+        if not whole or profile.symbols(BASE64) % 4 == 0:
+            # Hex digits and Base32 are subsets of the Base64 alphabet; prefer the narrower format
+            narrower = profile.only(HEX) or profile.only(BASE32)
+            suggestions.append(_suggest("From Base64", 0.6 if narrower else 0.9,
+                                        "Text matches Base64 character set and padding",
+                                        "Contains A-Z, a-z, 0-9, +, /, ="))
+
+    if profile.only(BASE32) and profile.padded_at_end(limit=6) and not profile.only(HEX) and not text_like:
+        if not whole or profile.symbols(BASE32) % 8 == 0:
+            suggestions.append(_suggest("From Base32", 0.85, "Text matches the Base32 alphabet and padding",
+                                        "Contains A-Z, 2-7, ="))
+
+    if (profile.only(BASE58, whitespace=False) and profile.count(DIGITS) and profile.count(LETTERS)
+            and len(profile.stripped) >= 8 and not profile.only(HEX)):
+        suggestions.append(_suggest("From Base58", 0.7, "Text uses only the Base58 alphabet",
+                                    "Alphanumerics without 0, O, I and l"))
+
+    if (profile.only(BASE85, whitespace=False) and profile.count(BASE85_SYMBOLS)
+            and profile.count(DIGITS) and profile.count(LETTERS) and len(profile.stripped) >= 10):
+        suggestions.append(_suggest("From Base85", 0.6, "Text uses only the Base85 alphabet",
+                                    "Alphanumerics mixed with !#$%&()*+-;<=>?@^_`{|}~"))
+
+    # '%' is also a Base85/Ascii85 digit, so require every '%' to start an escape
+    if profile.has('%') and len(_URL_ESCAPE.findall(profile.sample)) == profile.histogram[ord('%')]:
+        suggestions.append(_suggest("URL Decode", 0.75, "Text appears to be URL encoded",
+                                    "Contains % encoding sequences"))
+    return suggestions
+
+
+def _cipher_suggestions(profile, text):
+    """Suggestions for classic ciphers, from letter frequencies."""
+    suggestions = []
+    ranked, letter_count = rank_histogram(profile.letter_histogram())
+    confidence = caesar_confidence(ranked, letter_count)
+    shift = ranked[0][0]
+    if shift and confidence > 0.5:
+        suggestions.append(_suggest(
+            "Caesar Decrypt", confidence, f"Shifting back by {shift} gives English-like letter frequencies",
+            f"Chi-squared frequency analysis of all 26 shifts (confidence: {confidence:.1%})", {"shift": str(shift)}))
+    elif confidence <= 0.5 and letter_count >= 100:
+        guesses, sample_letters = rank_vigenere_keys(text[:ORDERED_SAMPLE], candidates=1)
+        confidence = vigenere_confidence(guesses, sample_letters)
+        if confidence > 0.5:
+            key = guesses[0]["key"]
+            suggestions.append(_suggest(
+                "Vigenère Decrypt", confidence,
+                f"Columns of every {len(key)} letters look like English shifted by key {key}",
+                f"Index of coincidence and per-column chi-squared (confidence: {confidence:.1%})", {"key": key}))
+    return suggestions
+
+
+def detect_formats(text, limit=MAX_SUGGESTIONS):
+    """Likely decodings for text as suggestion dicts (operation, confidence, reason, pattern, optional args)."""
+    text = text.strip()
+    if not text:
+        return []
+    profile = ByteProfile(text)
+    suggestions = [suggestion for suggestion in _encoding_suggestions(profile) + _cipher_suggestions(profile, text)
+                   if _available(suggestion["operation"])]
+    suggestions.sort(key=lambda suggestion: suggestion["confidence"], reverse=True)
+    return suggestions[:limit]
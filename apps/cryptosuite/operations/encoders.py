@@ -3,28 +3,27 @@
 import base64
 
 
-def to_base64(input_string: str) -> tuple[bool, str]:
-    """Encodes a standard string to Base64."""
+def to_base64(input_data) -> tuple[bool, str]:
+    """Encodes bytes (or a string, as UTF-8) to Base64."""
     try:
-        # The base64 library works on bytes, so we encode the string first.
-        input_bytes = input_string.encode('utf-8')
+        # The base64 library works on bytes, so strings are encoded first.
+        input_bytes = input_data.encode('utf-8') if isinstance(input_data, str) else input_data
         base64_bytes = base64.b64encode(input_bytes)
-        # Decode the result back to a string for the GUI.
-        base64_string = base64_bytes.decode('utf-8')
+        # Base64 output is always ASCII text.
+        base64_string = base64_bytes.decode('ascii')
         return True, base64_string
     except Exception as e:
         return False, f"Failed to encode: {e}"
 
 
-def from_base64(input_string: str) -> tuple[bool, str]:
-    """Decodes a Base64 string back to a standard string."""
+def from_base64(input_string: str) -> tuple[bool, bytes]:
+    """Decodes a Base64 string back to the original bytes."""
     try:
         # We need to encode the string back to bytes to be decoded.
-        base64_bytes = input_string.encode('utf-8')
+        base64_bytes = input_string.encode('utf-8') if isinstance(input_string, str) else input_string
         decoded_bytes = base64.b64decode(base64_bytes)
-        # Decode the final bytes into a readable string.
-        decoded_string = decoded_bytes.decode('utf-8')
-        return True, decoded_string
+        # The bytes are returned as is; the recipe decides whether they are text.
+        return True, decoded_bytes
     except Exception as e:
         # This usually happens if the input isn't valid Base64.
-        return False, f"Invalid Base64 input: {e}"
\ No newline at end of file
+        return False, f"Invalid Base64 input: {e}"
@@ -0,0 +1,159 @@
+# File: operations/hashes.py
+# hashlib-backed hash functions for recipes and for hashing files directly.
+#
+# Files are read in fixed-size blocks with readinto() on one reusable buffer
+# per thread, so hashing a file never allocates per block. hashlib releases
+# the GIL while digesting large blocks, so several files hash in parallel on
+# a thread pool.
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+HASH_BUFFER_SIZE = 1024 * 1024
+
+# Recipe operation name -> hashlib algorithm name
+HASH_ALGORITHMS = {
+    "SHA-256": "sha256",
+    "SHA-384": "sha384",
+    "SHA-512": "sha512",
+    "SHA-3-256": "sha3_256",
+    "SHA-3-512": "sha3_512",
+    "BLAKE2b": "blake2b",
+    "BLAKE2s": "blake2s",
+    "BLAKE3": "blake3",  # Provided by the optional 'blake3' package
+    "RIPEMD-160": "ripemd160",  # Only if the OpenSSL build still ships it
+    "Whirlpool": "whirlpool",  # Only if the OpenSSL build still ships it
+    "MD5": "md5",
+    "SHA-1": "sha1",
+}
+
+_thread_buffers = threading.local()
+
+
+def new_hash(algorithm: str):
+    """Creates a hash object for a recipe algorithm name, raising ValueError if unavailable."""
+    if algorithm not in HASH_ALGORITHMS:
+        raise ValueError(f"Unknown hash algorithm: {algorithm}")
+    if algorithm == "BLAKE3":
+        try:
+            import blake3
+        except ImportError:
+            raise ValueError("BLAKE3 requires the 'blake3' package (pip install blake3).")
+        return blake3.blake3()
+    try:
+        return hashlib.new(HASH_ALGORITHMS[algorithm])
+    except ValueError:
+        raise ValueError(f"{algorithm} is not supported by this Python/OpenSSL build.")
+
+
+def available_algorithms() -> list[str]:
+    """Recipe algorithm names that can actually be used here."""
+    available = []
+    for algorithm in HASH_ALGORITHMS:
+        try:
+            new_hash(algorithm)
+            available.append(algorithm)
+        except ValueError:
+            pass
+    return available
+
+
+def hash_data(input_data, algorithm: str) -> tuple[bool, str]:
+    """Hashes bytes (or a string, as UTF-8) and returns the hex digest."""
+    try:
+        hasher = new_hash(algorithm)
+    except ValueError as e:
+        return False, str(e)
+    hasher.update(input_data.encode('utf-8') if isinstance(input_data, str) else input_data)
+    return True, hasher.hexdigest()
+
+
+def _buffer():
+    buffer = getattr(_thread_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _thread_buffers.buffer = bytearray(HASH_BUFFER_SIZE)
+    return buffer
+
+
+def hash_file(path, algorithms):
+    """Hashes one file with each algorithm in a single read pass.
+
+    Returns a dict with the file size and, per algorithm, the hex digest and
+    the seconds spent digesting (excluding disk reads).
+    """
+    hashers = {algorithm: new_hash(algorithm) for algorithm in algorithms}
+    seconds = dict.fromkeys(hashers, 0.0)
+    buffer = _buffer()
+    view = memoryview(buffer)
+    size = 0
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+            size += count
+            block = view[:count]
+            for algorithm, hasher in hashers.items():
+                start = time.perf_counter()
+                hasher.update(block)
+                seconds[algorithm] += time.perf_counter() - start
+    return {
+        "path": path,
+        "size": size,
+        "digests": {algorithm: hasher.hexdigest() for algorithm, hasher in hashers.items()},
+        "seconds": seconds,
+    }
+
+
+def hash_files(paths, algorithms, max_workers=None, progress=None):
+    """Hashes many files concurrently on a thread pool.
+
+    progress(done, total) is called as files finish. Returns one result per
+    path, in the order given; failed files have an "error" entry instead of
+    digests.
+    """
+    if max_workers is None:
+        max_workers = min(len(paths), (os.cpu_count() or 1) + 2) or 1
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(hash_file, path, algorithms): path for path in paths}
+        for done, future in enumerate(as_completed(futures), 1):
+            path = futures[future]
+            try:
+                results[path] = future.result()
+            except (OSError, ValueError) as e:
+                results[path] = {"path": path, "size": 0, "error": str(e)}
+            if progress:
+                progress(done, len(paths))
+    return [results[path] for path in paths]
+
+
+def throughput(results):
+    """Per-algorithm digesting speed in MB/s across a set of hash_file results."""
+    totals = {}
+    for result in results:
+        for algorithm, seconds in result.get("seconds", {}).items():
+            size, elapsed = totals.get(algorithm, (0, 0.0))
+            totals[algorithm] = (size + result["size"], elapsed + seconds)
+    return {algorithm: (size / (1024 * 1024)) / elapsed if elapsed > 0 else 0.0
+            for algorithm, (size, elapsed) in totals.items()}
+
+
+def format_hash_report(results, algorithms):
+    """Text report with one '<digest>  <file>' line per file and algorithm, like sha256sum."""
+    lines = []
+    for algorithm in algorithms:
+        lines.append(f"# {algorithm}")
+        for result in results:
+            if "error" in result:
+                lines.append(f"# {result['path']}: {result['error']}")
+            else:
+                lines.append(f"{result['digests'][algorithm]}  {result['path']}")
+        lines.append("")
+    speeds = throughput(results)
+    lines.append("# Throughput: " + ", ".join(f"{algorithm} {speeds.get(algorithm, 0.0):.1f} MB/s"
+                                               for algorithm in algorithms))
+    return "\n".join(lines)
@@ -1,29 +1,31 @@
 # File: operations/hex.py
 
-def to_hex(input_string: str) -> tuple[bool, str]:
-    """Encodes a standard string to a Hexadecimal string."""
+_WHITESPACE = {ord(char): None for char in " \t\r\n\x0b\x0c"}
+
+
+def to_hex(input_data) -> tuple[bool, str]:
+    """Encodes bytes (or a string, as UTF-8) to a Hexadecimal string."""
     try:
-        # Convert the string to bytes, then to a hex representation.
-        input_bytes = input_string.encode('utf-8')
+        # Convert strings to bytes, then to a hex representation.
+        input_bytes = input_data.encode('utf-8') if isinstance(input_data, str) else input_data
         hex_string = input_bytes.hex()
         return True, hex_string
     except Exception as e:
         return False, f"Failed to encode to Hex: {e}"
 
 
-def from_hex(input_string: str) -> tuple[bool, str]:
-    """Decodes a Hexadecimal string back to a standard string."""
+def from_hex(input_string: str) -> tuple[bool, bytes]:
+    """Decodes a Hexadecimal string back to the original bytes."""
     try:
-        # Remove common prefixes and spaces
-        cleaned_string = input_string.replace("0x", "").replace(" ", "").strip()
+        # Remove common prefixes and all whitespace
+        cleaned_string = input_string.replace("0x", "").translate(_WHITESPACE)
         if len(cleaned_string) % 2 != 0:
             return False, "Invalid Hex string: odd length."
 
-        # Convert the hex string back to bytes, then to a readable string.
+        # The bytes are returned as is; the recipe decides whether they are text.
         decoded_bytes = bytes.fromhex(cleaned_string)
-        decoded_string = decoded_bytes.decode('utf-8')
-        return True, decoded_string
+        return True, decoded_bytes
     except ValueError:
         return False, "Invalid characters in Hex string."
     except Exception as e:
-        return False, f"Failed to decode from Hex: {e}"
\ No newline at end of file
+        return False, f"Failed to decode from Hex: {e}"
@@ -0,0 +1,166 @@
+# File: operations/kdf.py
+# Password-based key derivation: PBKDF2, Scrypt and Argon2id.
+#
+# Derived keys are cached for the session, keyed by a keyed digest of the
+# algorithm, its parameters, the salt and the password, so re-baking a recipe
+# (or decrypting several containers with the same key) only pays the KDF cost
+# once. The password itself is never stored. calibrate() picks cost
+# parameters that take roughly a target time on this machine.
+
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+SALT_SIZE = 16
+KEY_CACHE_SIZE = 64
+SCRYPT_MAX_MEMORY = 1024 * 1024 * 1024  # Calibration never suggests more than this
+
+# Defaults used when a step is added (OWASP 2023 minimums or better)
+DEFAULT_COSTS = {
+    "PBKDF2": {"iterations": 600000},
+    "Scrypt": {"log_n": 17, "r": 8, "p": 1},
+    "Argon2": {"iterations": 3, "memory_kib": 65536, "lanes": 4},
+}
+
+_cache_secret = os.urandom(32)
+_key_cache = OrderedDict()
+_key_cache_lock = threading.Lock()
+
+
+def random_salt() -> str:
+    """A fresh random salt as hex, the form it takes in recipe arguments."""
+    return os.urandom(SALT_SIZE).hex()
+
+
+def parse_salt(salt) -> bytes:
+    if isinstance(salt, (bytes, bytearray)):
+        return bytes(salt)
+    try:
+        value = bytes.fromhex(salt.strip())
+    except ValueError:
+        raise ValueError("Salt must be a hexadecimal string.")
+    if len(value) < 8:
+        raise ValueError("Salt must be at least 8 bytes (16 hex characters).")
+    return value
+
+
+def _argon2id(password, salt, length, iterations, memory_kib, lanes):
+    try:
+        from cryptography.hazmat.primitives.kdf.argon2 import Argon2id
+    except ImportError:  # cryptography < 44
+        Argon2id = None
+    if Argon2id is not None:
+        return Argon2id(salt=salt, length=length, iterations=iterations, lanes=lanes,
+                        memory_cost=memory_kib).derive(password)
+    try:
+        from argon2.low_level import Type, hash_secret_raw
+    except ImportError:
+        raise ValueError("Argon2 requires cryptography 44+ or the 'argon2-cffi' package.")
+    return hash_secret_raw(password, salt, time_cost=iterations, memory_cost=memory_kib,
+                           parallelism=lanes, hash_len=length, type=Type.ID)
+
+
+def _derive_uncached(algorithm, password, salt, length, costs):
+    if algorithm == "PBKDF2":
+        return PBKDF2HMAC(algorithm=hashes.SHA256(), length=length, salt=salt,
+                          iterations=costs["iterations"]).derive(password)
+    if algorithm == "Scrypt":
+        return Scrypt(salt=salt, length=length, n=2 ** costs["log_n"], r=costs["r"], p=costs["p"]).derive(password)
+    if algorithm == "Argon2":
+        return _argon2id(password, salt, length, costs["iterations"], costs["memory_kib"], costs["lanes"])
+    raise ValueError(f"Unknown key derivation function: {algorithm}")
+
+
+def derive_key(algorithm: str, password, salt, length=32, **costs) -> bytes:
+    """Derives a key, reusing the session cache when the same inputs were seen before.
+
+    costs are the algorithm's parameters (see DEFAULT_COSTS); missing ones use the defaults.
+    """
+    costs = {**DEFAULT_COSTS.get(algorithm, {}), **costs}
+    password = password.encode('utf-8') if isinstance(password, str) else bytes(password)
+    salt = parse_salt(salt)
+
+    description = json.dumps([algorithm, length, costs, salt.hex()], sort_keys=True).encode('utf-8')
+    cache_key = hmac.new(_cache_secret, description + b"\0" + password, hashlib.sha256).digest()
+    with _key_cache_lock:
+        key = _key_cache.get(cache_key)
+        if key is not None:
+            _key_cache.move_to_end(cache_key)
+            return key
+
+    key = _derive_uncached(algorithm, password, salt, length, costs)
+    with _key_cache_lock:
+        _key_cache[cache_key] = key
+        while len(_key_cache) > KEY_CACHE_SIZE:
+            _key_cache.popitem(last=False)
+    return key
+
+
+def clear_key_cache():
+    """Forgets every derived key cached this session."""
+    with _key_cache_lock:
+        _key_cache.clear()
+
+
+# --------------------------------------------------------------------------
+# Recipe operations
+# --------------------------------------------------------------------------
+
+def kdf_derive(input_data, algorithm: str, salt: str, length: int, **costs) -> tuple[bool, str]:
+    """Derives a key from the input (the password) and returns it as hex."""
+    try:
+        return True, derive_key(algorithm, input_data, salt, length, **costs).hex()
+    except ValueError as e:
+        return False, str(e)
+    except Exception as e:
+        return False, f"{algorithm} failed: {e}"
+
+
+# --------------------------------------------------------------------------
+# Cost calibration
+# --------------------------------------------------------------------------
+
+def _time(algorithm, **costs):
+    start = time.perf_counter()
+    _derive_uncached(algorithm, b"calibration", b"\0" * SALT_SIZE, 32, {**DEFAULT_COSTS[algorithm], **costs})
+    return time.perf_counter() - start
+
+
+def calibrate(algorithm: str, target_seconds=0.5) -> tuple[dict, float]:
+    """Picks cost parameters that take about target_seconds here.
+
+    Returns (costs, measured seconds). PBKDF2 scales its iteration count;
+    Scrypt doubles N (within SCRYPT_MAX_MEMORY); Argon2 doubles its memory
+    until one pass takes a third of the target, then adds passes.
+    """
+    if algorithm == "PBKDF2":
+        probe = 20000
+        elapsed = _time(algorithm, iterations=probe)
+        iterations = max(100000, round(probe * target_seconds / max(elapsed, 1e-6), -3))
+        return {"iterations": int(iterations)}, _time(algorithm, iterations=int(iterations))
+
+    if algorithm == "Scrypt":
+        log_n, elapsed = 14, _time(algorithm, log_n=14)
+        while elapsed * 2 <= target_seconds * 1.3 and 128 * 8 * 2 ** (log_n + 1) <= SCRYPT_MAX_MEMORY:
+            log_n += 1
+            elapsed = _time(algorithm, log_n=log_n)
+        return {"log_n": log_n, "r": 8, "p": 1}, elapsed
+
+    if algorithm == "Argon2":
+        costs = dict(DEFAULT_COSTS[algorithm], iterations=1)
+        elapsed = _time(algorithm, **costs)
+        while elapsed < target_seconds / 3 and costs["memory_kib"] < 1024 * 1024:
+            costs["memory_kib"] *= 2
+            elapsed = _time(algorithm, **costs)
+        costs["iterations"] = max(1, round(target_seconds / elapsed))
+        return costs, _time(algorithm, **costs)
+
+    raise ValueError(f"Unknown key derivation function: {algorithm}")
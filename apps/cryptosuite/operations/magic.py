@@ -0,0 +1,174 @@
+# File: operations/magic.py
+# "Magic": finds a chain of decodings that turns the input into plaintext.
+#
+# A best-first search where each node is an intermediate value and the chain
+# of steps that produced it. The node with the highest plaintext score is
+# expanded next: Auto-Detect (detect.py) proposes the decodings worth trying,
+# they run concurrently on a thread pool, and each result is scored. Values
+# already reached by another chain are skipped (memoized by digest), results
+# that are binary and score poorly are pruned (the decoders all read text),
+# and only the best few children of each node are kept. The search stops at
+# the first value that reads like English, when the queue runs dry, or when
+# the wall-clock budget is spent, and returns the best chain found as a
+# recipe. A step still running at the deadline cannot be stopped, so decoders
+# whose cost grows faster than their input (Base58) are only tried on values
+# of up to SLOW_INPUT_LIMIT characters; every other candidate is linear.
+
+import hashlib
+import heapq
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+
+from .analysis import shift_scores
+from .detect import detect_formats
+from .recipe import recipe_document, run_step
+from .registry import DECRYPT, get_operation
+
+SCORE_SAMPLE = 64 * 1024  # Bytes of each value that are scored and analysed
+TARGET_SCORE = 0.85  # A value scoring this high is taken as the plaintext
+PRUNE_SCORE = 0.2  # Binary values scoring lower are treated as dead ends
+BRANCH_LIMIT = 4  # Children kept per expanded node
+DEPTH_PENALTY = 0.02  # Prefer shorter chains between values that score alike
+MAX_DEPTH = 8
+TIME_BUDGET = 5.0
+MAX_WORKERS = 4
+SLOW_OPERATIONS = frozenset({"From Base58"})  # Superlinear in the input size (several seconds per MB)
+SLOW_INPUT_LIMIT = SCORE_SAMPLE
+
+_PRINTABLE = np.zeros(256)
+_PRINTABLE[32:127] = 1.0
+_PRINTABLE[[9, 10, 13]] = 1.0
+_PRINTABLE[128:] = 0.5  # UTF-8 text is fine, but bytes >= 0x80 are also typical of binary data
+
+
+def _as_bytes(value):
+    return value.encode('utf-8') if isinstance(value, str) else bytes(value)
+
+
+def plaintext_score(value) -> float:
+    """0-1 estimate of how much a value reads like English text.
+
+    Combines the printable fraction with the letter-frequency fit
+    (chi-squared per letter), the share of spaces and the share of letters.
+    """
+    sample = _as_bytes(value)[:SCORE_SAMPLE]
+    if not sample:
+        return 0.0
+    histogram = np.bincount(np.frombuffer(sample, dtype=np.uint8), minlength=256)
+    printable = float(histogram @ _PRINTABLE) / len(sample)
+    letters = histogram[ord('A'):ord('Z') + 1] + histogram[ord('a'):ord('z') + 1]
+    letter_count = int(letters.sum())
+    if not letter_count:
+        return 0.3 * printable
+    fit = 1.0 / (1.0 + float(shift_scores(letters)[0]) / letter_count)
+    spacing = min(1.0, histogram[ord(' ')] / len(sample) / 0.1)
+    wordiness = min(1.0, letter_count / len(sample) / 0.6)
+    return printable * (0.5 * fit + 0.25 * spacing + 0.25 * wordiness)
+
+
+def _digest(value):
+    return hashlib.blake2b(_as_bytes(value), digest_size=16).digest()
+
+
+def _as_text(value):
+    """Text for the detectors; None when a value is not text in any useful sense."""
+    if isinstance(value, str):
+        return value
+    try:
+        return bytes(value).decode('ascii')
+    except UnicodeDecodeError:
+        return None
+
+
+def candidate_steps(value):
+    """Decode steps Auto-Detect proposes for a value, as {"operation", "args"} dicts.
+
+    Slow decoders are left out for values over SLOW_INPUT_LIMIT characters,
+    so no step can keep running for long after the search's budget is spent.
+    """
+    text = _as_text(value)
+    if not text:
+        return []
+    return [{"operation": suggestion["operation"], "args": suggestion.get("args", {})}
+            for suggestion in detect_formats(text, limit=None)
+            if len(text) <= SLOW_INPUT_LIMIT or suggestion["operation"] not in SLOW_OPERATIONS]
+
+
+def _try_step(step, value):
+    """Runs one step and scores the result; returns (step, value, score) or None on failure."""
+    operation = get_operation(step["operation"], DECRYPT)
+    if operation is None or not operation.implemented:
+        return None
+    try:
+        success, result = run_step(operation, value, step["args"])
+    except Exception:  # A wrong guess may fail in ways the operation does not anticipate
+        return None
+    if not success or not result or result == value:
+        return None
+    return step, result, plaintext_score(result)
+
+
+def magic_search(value, max_depth=MAX_DEPTH, seconds=TIME_BUDGET, cancelled=None, progress=None):
+    """Best-first search for the chain of decodings that yields the most plaintext-like value.
+
+    Returns a dict with "steps" (empty if no decoding improved on the
+    input), "recipe" (the steps as a loadable decrypt recipe), "output",
+    "score", "explored" (values scored), "elapsed" and "timed_out".
+    """
+    start = time.monotonic()
+    deadline = start + seconds
+    order = itertools.count()  # Tie-breaker so the heap never compares values
+    best = {"steps": [], "output": value, "score": plaintext_score(value)}
+    seen = {_digest(value)}
+    frontier = [(-best["score"], next(order), value, [])]
+    explored = 1
+    timed_out = False
+
+    # Not a with-block: leaving one waits for steps still running past the deadline
+    pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        while frontier and best["score"] < TARGET_SCORE:
+            if cancelled and cancelled():
+                break
+            _, _, node, steps = heapq.heappop(frontier)
+            if len(steps) >= max_depth:
+                continue
+            if progress:
+                progress(explored, len(steps))
+
+            pending = {pool.submit(_try_step, step, node) for step in candidate_steps(node)}
+            children = []
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                finished, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                children.extend(future.result() for future in finished if future.result())
+            for future in pending:
+                future.cancel()
+                timed_out = True
+
+            children.sort(key=lambda child: child[2], reverse=True)
+            for step, child, score in children[:BRANCH_LIMIT]:
+                digest = _digest(child)
+                if digest in seen or (score < PRUNE_SCORE and _as_text(child) is None):
+                    continue
+                seen.add(digest)
+                explored += 1
+                chain = steps + [step]
+                if score > best["score"]:
+                    best = {"steps": chain, "output": child, "score": score}
+                heapq.heappush(frontier, (-(score - DEPTH_PENALTY * len(chain)), next(order), child, chain))
+
+            if time.monotonic() >= deadline:
+                timed_out = timed_out or (bool(frontier) and best["score"] < TARGET_SCORE)
+                break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    best.update(recipe=recipe_document(best["steps"], "decrypt"), explored=explored,
+                elapsed=time.monotonic() - start, timed_out=timed_out)
+    return best
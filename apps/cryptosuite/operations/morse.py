@@ -0,0 +1,45 @@
+# File: operations/morse.py
+# International Morse code: letters separated by spaces, words by " / ".
+#
+# Encoding is a single str.translate through a precomputed table and decoding
+# is a single split plus dictionary lookups, so multi-MB inputs convert in
+# one pass without per-character branching.
+
+MORSE_CODE = {
+    'A': '.-', 'B': '-...', 'C': '-.-.', 'D': '-..', 'E': '.', 'F': '..-.', 'G': '--.', 'H': '....',
+    'I': '..', 'J': '.---', 'K': '-.-', 'L': '.-..', 'M': '--', 'N': '-.', 'O': '---', 'P': '.--.',
+    'Q': '--.-', 'R': '.-.', 'S': '...', 'T': '-', 'U': '..-', 'V': '...-', 'W': '.--', 'X': '-..-',
+    'Y': '-.--', 'Z': '--..',
+    '0': '-----', '1': '.----', '2': '..---', '3': '...--', '4': '....-', '5': '.....', '6': '-....',
+    '7': '--...', '8': '---..', '9': '----.',
+    '.': '.-.-.-', ',': '--..--', '?': '..--..', "'": '.----.', '!': '-.-.--', '/': '-..-.', '(': '-.--.',
+    ')': '-.--.-', '&': '.-...', ':': '---...', ';': '-.-.-.', '=': '-...-', '+': '.-.-.', '-': '-....-',
+    '_': '..--.-', '"': '.-..-.', '$': '...-..-', '@': '.--.-.',
+}
+WORD_SEPARATOR = "/"
+
+# Each character maps to its code plus the separator that follows it
+_ENCODE_TABLE = {ord(char): code + " " for char, code in MORSE_CODE.items()}
+_ENCODE_TABLE.update({ord(char.lower()): code + " " for char, code in MORSE_CODE.items() if char.isalpha()})
+_ENCODE_TABLE.update({ord(space): WORD_SEPARATOR + " " for space in " \t\r\n"})
+_DECODE_TABLE = {code: char for char, code in MORSE_CODE.items()}
+_DECODE_TABLE[WORD_SEPARATOR] = " "
+
+
+def to_morse(input_text: str) -> tuple[bool, str]:
+    """Encodes text as Morse code; letters are case-insensitive."""
+    encoded = input_text.translate(_ENCODE_TABLE)
+    # Any character left untranslated has no Morse code
+    unsupported = set(encoded) - set(".- /")
+    if unsupported:
+        listed = ", ".join(repr(char) for char in sorted(unsupported)[:5])
+        return False, f"No Morse code for: {listed}"
+    return True, encoded.rstrip()
+
+
+def from_morse(input_text: str) -> tuple[bool, str]:
+    """Decodes Morse code (letters separated by whitespace, words by '/') to uppercase text."""
+    try:
+        return True, "".join(map(_DECODE_TABLE.__getitem__, input_text.split()))
+    except KeyError as e:
+        return False, f"Invalid Morse code sequence: {e.args[0]}"
@@ -0,0 +1,120 @@
+# File: operations/optimizer.py
+# Rewrites a recipe into an equivalent, shorter plan before it runs.
+#
+# Three rewrites are applied to adjacent steps until none applies:
+#   * a lossless step followed by its inverse with the same arguments cancels
+#     (To Hex -> From Hex, Caesar Encrypt 3 -> Caesar Decrypt 3, ROT13 -> ROT13)
+#   * consecutive letter rotations (Caesar Encrypt/Decrypt, ROT13, ROT-N) merge into
+#     one Caesar step, or vanish when the shifts add up to a multiple of 26
+#   * an idempotent step repeated with the same arguments runs once
+#
+# Steps whose arguments do not validate are left alone, so they still report
+# their error when the plan runs.
+
+from .registry import DECRYPT, get_operation
+
+ALPHABET_SIZE = 26
+
+
+def _rotation(operation, args):
+    """Letter rotation a step applies (0-25), or None if it is not a plain rotation."""
+    if operation.name == "ROT13 Cipher":
+        return 13
+    if operation.name == "ROT-N":
+        return operation.parse_args(args)["n"] % ALPHABET_SIZE
+    if operation.name in ("Caesar Encrypt", "Caesar Decrypt"):
+        shift = operation.parse_args(args)["shift"]
+        return (-shift if operation.fixed_args.get("decrypt") else shift) % ALPHABET_SIZE
+    return None
+
+
+def _rotation_step(rotation, direction):
+    """A single Caesar step applying the rotation, using the operation the direction offers."""
+    if direction == DECRYPT:
+        return {"operation": "Caesar Decrypt", "args": {"shift": str(ALPHABET_SIZE - rotation)}}
+    return {"operation": "Caesar Encrypt", "args": {"shift": str(rotation)}}
+
+
+class _Step:
+    def __init__(self, step, direction):
+        self.step = step
+        self.name = step.get("operation")
+        self.args = step.get("args", {}) or {}
+        self.operation = get_operation(self.name, direction)
+        self.parsed = None
+        if self.operation is not None and self.operation.implemented:
+            try:
+                self.parsed = self.operation.parse_args(self.args)
+            except ValueError:
+                pass  # Invalid arguments: never rewrite this step
+
+    @property
+    def usable(self):
+        return self.parsed is not None
+
+
+def _combine(previous, current, direction):
+    """Returns (replacement steps, note) if the two steps can be rewritten, else None."""
+    if not (previous.usable and current.usable):
+        return None
+
+    if (previous.operation.lossless and previous.operation.inverse == current.name
+            and previous.parsed == current.parsed):
+        return [], f"{previous.name} → {current.name} cancel out"
+
+    first = _rotation(previous.operation, previous.args)
+    second = _rotation(current.operation, current.args)
+    if first is not None and second is not None:
+        total = (first + second) % ALPHABET_SIZE
+        if total == 0:
+            return [], f"{previous.name} → {current.name} rotate letters back to the start"
+        merged = _rotation_step(total, direction)
+        return [merged], f"{previous.name} → {current.name} merged into {merged['operation']} " \
+                         f"(shift {merged['args']['shift']})"
+
+    if previous.operation.idempotent and previous.name == current.name and previous.parsed == current.parsed:
+        return [previous.step], f"Repeated {current.name} runs once"
+
+    return None
+
+
+def optimize_recipe(steps, direction=None):
+    """Rewrites a list of {"operation", "args"} steps into an equivalent plan.
+
+    Returns (optimized steps, list of human-readable notes on each rewrite).
+    """
+    plan, notes = [], []
+
+    def push(step):
+        current = _Step(step, direction)
+        while plan:
+            result = _combine(plan[-1], current, direction)
+            if result is None:
+                break
+            replacement, note = result
+            notes.append(note)
+            plan.pop()
+            if not replacement:
+                return
+            # The merged step may combine again with the step before it
+            current = _Step(replacement[0], direction)
+        plan.append(current)
+
+    for step in steps:
+        push(step)
+    return [entry.step for entry in plan], notes
+
+
+def describe_plan(steps, optimized, notes):
+    """Text summary of an optimized plan for display."""
+    lines = [f"Original recipe: {len(steps)} steps", f"Optimized plan: {len(optimized)} steps", ""]
+    for index, step in enumerate(optimized, 1):
+        args = ", ".join(f"{name}={value}" for name, value in (step.get("args") or {}).items())
+        lines.append(f"{index}. {step.get('operation')}" + (f" ({args})" if args else ""))
+    if not optimized:
+        lines.append("(no steps - the output equals the input)")
+    if notes:
+        lines.append("")
+        lines.append("Rewrites:")
+        lines.extend(f"• {note}" for note in notes)
+    return "\n".join(lines)
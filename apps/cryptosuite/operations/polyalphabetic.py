@@ -0,0 +1,137 @@
+# File: operations/polyalphabetic.py
+# Vigenère and Beaufort ciphers over NumPy uint8 arrays.
+#
+# Letters are found with a mask, pulled out in one gather, shifted against
+# the repeated key, and scattered back, so non-letters pass through untouched
+# and the key only advances on letters. The key is tiled once per call and
+# sliced per block (np.resize rebuilds it from one copy per repetition,
+# which costs more than the cipher itself). Sums stay in uint8 and wrap with
+# np.minimum(v, v - 26) instead of a modulo. Case is kept by carrying the
+# 0x20 bit of each letter through the shift.
+# Text is handled as UTF-8 bytes: only ASCII letters change, so multi-byte
+# characters are never split or altered. The input is encoded or copied once
+# into a bytearray that the arrays view and modify in place. It is processed
+# in 64 KB blocks, with the letters shifted in place, so the few temporaries
+# each block needs stay in cache instead of spanning the whole input.
+
+import numpy as np
+
+BLOCK_SIZE = 64 * 1024
+_CASE_BIT = np.uint8(0x20)
+
+VIGENERE_ENCRYPT = "vigenere_encrypt"
+VIGENERE_DECRYPT = "vigenere_decrypt"
+BEAUFORT = "beaufort"
+
+
+def key_shifts(key: str) -> np.ndarray:
+    """Shifts 0-25 for the letters of a key (other characters are ignored)."""
+    letters = np.frombuffer(key.encode('ascii', errors='ignore'), dtype=np.uint8)
+    letters = letters[((letters | _CASE_BIT) >= ord('a')) & ((letters | _CASE_BIT) <= ord('z'))]
+    if not letters.size:
+        raise ValueError("Key must contain at least one letter (A-Z).")
+    return (letters | _CASE_BIT) - np.uint8(ord('a'))
+
+
+def letter_mask(chars: np.ndarray) -> np.ndarray:
+    """True where a byte is an ASCII letter."""
+    return ((chars | _CASE_BIT) - np.uint8(ord('a'))) < 26
+
+
+def key_stream(shifts: np.ndarray, length: int) -> np.ndarray:
+    """The key shifts repeated to cover `length` letters starting at any key position."""
+    return np.tile(shifts, -(-length // shifts.size) + 1)
+
+
+def apply_block(chars: np.ndarray, stream: np.ndarray, key_size: int, mode: str, offset: int = 0) -> int:
+    """Applies the cipher in place to one block; returns how many letters it contained.
+
+    stream comes from key_stream() and must cover the block; offset is the
+    number of letters already processed, so the key continues where the
+    previous block stopped.
+    """
+    mask = letter_mask(chars)
+    letters = chars[mask]
+    if not letters.size:
+        return 0
+    case = letters & _CASE_BIT
+    values = letters  # Shifted in place from here on
+    values |= _CASE_BIT
+    values -= np.uint8(ord('a'))
+    start = offset % key_size
+    keys = stream[start:start + letters.size]
+    if mode == VIGENERE_ENCRYPT:
+        values += keys
+    elif mode == VIGENERE_DECRYPT:
+        values += np.uint8(26)
+        values -= keys
+    else:  # Beaufort: ciphertext = key - plaintext, its own inverse
+        np.subtract(keys, values, out=values)
+        values += np.uint8(26)
+    # values < 52: subtracting 26 underflows (to >= 230) exactly when values < 26
+    np.minimum(values, values - np.uint8(26), out=values)
+    values += np.uint8(ord('A'))
+    values |= case
+    chars[mask] = values
+    return letters.size
+
+
+def apply_blocks(chars: np.ndarray, stream: np.ndarray, key_size: int, mode: str, offset: int = 0) -> int:
+    """Applies the cipher in place, BLOCK_SIZE bytes at a time; returns the new letter offset.
+
+    stream must cover min(chars.size, BLOCK_SIZE) letters.
+    """
+    for start in range(0, chars.size, BLOCK_SIZE):
+        offset += apply_block(chars[start:start + BLOCK_SIZE], stream, key_size, mode, offset)
+    return offset
+
+
+def transform(data, key: str, mode: str):
+    """Runs the cipher over str or bytes and returns the same type."""
+    is_text = isinstance(data, str)
+    buffer = bytearray(data, 'utf-8') if is_text else bytearray(data)
+    chars = np.frombuffer(buffer, dtype=np.uint8)
+    shifts = key_shifts(key)
+    apply_blocks(chars, key_stream(shifts, min(chars.size, BLOCK_SIZE)), shifts.size, mode)
+    return buffer.decode('utf-8') if is_text else bytes(buffer)
+
+
+def vigenere_cipher(text, key: str, decrypt: bool = False) -> tuple[bool, str]:
+    """Encrypts or decrypts with the Vigenère cipher; str or bytes in, same type out."""
+    try:
+        return True, transform(text, key, VIGENERE_DECRYPT if decrypt else VIGENERE_ENCRYPT)
+    except ValueError as e:
+        return False, str(e)
+
+
+def beaufort_cipher(text, key: str) -> tuple[bool, str]:
+    """Applies the Beaufort cipher (the same call encrypts and decrypts)."""
+    try:
+        return True, transform(text, key, BEAUFORT)
+    except ValueError as e:
+        return False, str(e)
+
+
+class VigenereTransform:
+    """Streaming transform that keeps the key position across chunks."""
+
+    mode = None
+
+    def __init__(self, key, decrypt=False):
+        self.shifts = key_shifts(key)
+        self.stream = key_stream(self.shifts, BLOCK_SIZE)
+        self.mode = self.mode or (VIGENERE_DECRYPT if decrypt else VIGENERE_ENCRYPT)
+        self.offset = 0
+
+    def update(self, chunk):
+        buffer = bytearray(chunk)
+        self.offset = apply_blocks(np.frombuffer(buffer, dtype=np.uint8), self.stream, self.shifts.size,
+                                   self.mode, self.offset)
+        return bytes(buffer)
+
+    def finalize(self):
+        return b""
+
+
+class BeaufortTransform(VigenereTransform):
+    mode = BEAUFORT
@@ -0,0 +1,128 @@
+# File: operations/recipe.py
+# Runs recipe steps on typed values.
+#
+# Data travels between steps as either str (TEXT) or bytes (BYTES), whichever
+# the previous step produced. Each operation declares the kind it consumes in
+# the registry, and a conversion only happens when the kinds differ, so a
+# chain such as From Base64 -> From Hex -> To Base64 never round-trips through
+# UTF-8 text, and binary results are carried as bytes instead of failing.
+
+import json
+import time
+
+from .registry import ANY, BYTES, TEXT, get_operation
+
+RECIPE_VERSION = "2.0"
+
+
+def kind_of(value):
+    return BYTES if isinstance(value, (bytes, bytearray)) else TEXT
+
+
+def coerce(value, kind):
+    """Converts a value to the requested kind (UTF-8 at the text/bytes boundary)."""
+    if kind == ANY or kind_of(value) == kind:
+        return value
+    if kind == BYTES:
+        return value.encode('utf-8')
+    try:
+        return bytes(value).decode('utf-8')
+    except UnicodeDecodeError:
+        raise ValueError("Input is binary data, not UTF-8 text.")
+
+
+def run_step(operation, value, args=None):
+    """Runs one operation on a typed value, converting the input only if its kind differs."""
+    try:
+        value = coerce(value, operation.input_kind)
+    except ValueError as e:
+        return False, str(e)
+    return operation.run(value, args)
+
+
+def run_recipe(steps, value, direction=None):
+    """Runs a list of {"operation", "args"} steps, returning (success, value or error message)."""
+    for step in steps:
+        operation_name = step.get("operation")
+        operation = get_operation(operation_name, direction)
+        if operation is None:
+            return False, f"Unknown operation: {operation_name}"
+        if not operation.implemented:
+            return False, f"{operation_name} is not implemented yet."
+        success, value = run_step(operation, value, step.get("args", {}))
+        if not success:
+            return False, f"{operation_name}: {value}"
+    return True, value
+
+
+def recipe_document(steps, recipe_type):
+    """The JSON structure recipes are saved and loaded as; recipe_type is "encrypt" or "decrypt"."""
+    return {
+        "metadata": {
+            "version": RECIPE_VERSION,
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "step_count": len(steps),
+            "recipe_type": recipe_type
+        },
+        "steps": steps
+    }
+
+
+def parse_recipe(recipe_data):
+    """Steps and recipe type of a loaded recipe.
+
+    Accepts the saved format (see recipe_document) and the older bare list of
+    steps, whose type is None. Raises ValueError for anything else.
+    """
+    if isinstance(recipe_data, list):
+        return recipe_data, None
+    if isinstance(recipe_data, dict) and isinstance(recipe_data.get("steps"), list):
+        return recipe_data["steps"], recipe_data.get("metadata", {}).get("recipe_type") or None
+    raise ValueError("Recipe file is empty or invalid.")
+
+
+def load_recipe_file(path):
+    """Reads a saved recipe; returns (steps, recipe type). Raises ValueError for invalid JSON or structure."""
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            recipe_data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format: {e}")
+    return parse_recipe(recipe_data)
+
+
+def invert_recipe(steps):
+    """The steps that undo a recipe: each step's inverse, in reverse order.
+
+    Arguments are kept as they are unless the operation says how its inverse's
+    differ (ROT-N 3 is undone by ROT-N 23). Returns (inverted steps, names of
+    operations without an inverse, which are skipped).
+    """
+    inverted, skipped = [], []
+    for step in reversed(steps):
+        operation_name = step.get("operation")
+        operation = get_operation(operation_name)
+        if operation is None or not operation.inverse:
+            skipped.append(operation_name)
+            continue
+        args = step.get("args", {})
+        if operation.inverse_args:
+            try:
+                args = operation.inverse_args(args)
+            except ValueError:
+                pass  # Invalid arguments: the step reports its error when it runs
+        inverted.append({"operation": operation.inverse, "args": args})
+    return inverted, skipped
+
+
+def to_display(value):
+    """Text for showing a value: bytes are decoded as UTF-8 when valid, otherwise shown as hex.
+
+    Returns (text, is_hex).
+    """
+    if kind_of(value) == TEXT:
+        return value, False
+    try:
+        return bytes(value).decode('utf-8'), False
+    except UnicodeDecodeError:
+        return bytes(value).hex(), True
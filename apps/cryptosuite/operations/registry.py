@@ -0,0 +1,301 @@
+# File: operations/registry.py
+# Central table of every recipe operation the GUI offers.
+#
+# Each entry records how to run the operation, which parameters it takes, what
+# undoes it and how it handles data. Frames look operations up by name instead
+# of walking an if/elif chain, and recipe inversion reads the inverse from
+# here. Implementations are referenced as "module:function" inside this
+# package and only imported the first time the operation runs.
+#
+# Some names ("Atbash Cipher", "ChaCha20-Poly1305", ...) appear in both the
+# encryption and decryption sidebars. Operations registered for one direction
+# take precedence over those registered for both when looking them up.
+
+import importlib
+import os
+
+ENCRYPT = "encrypt"
+DECRYPT = "decrypt"
+
+# Kinds of data passed between recipe steps (see recipe.py)
+TEXT = "text"
+BYTES = "bytes"
+ANY = "any"  # Input: accepts either kind as is. Output: same kind as the input.
+
+# Generic ways to stream an operation (see streaming.py)
+CHUNKWISE = "chunkwise"
+TEXT_CHUNKWISE = "text_chunkwise"
+
+
+class Param:
+    """Schema for one user-supplied operation parameter."""
+
+    def __init__(self, name, title, kind=str, placeholder="", minimum=None, maximum=None, default=""):
+        self.name = name
+        self.title = title
+        self.kind = kind
+        self.placeholder = placeholder or title
+        self.minimum = minimum
+        self.maximum = maximum
+        self.default = default
+
+    def initial(self):
+        """Value a new step starts with. A callable default (e.g. a random salt) is called each time."""
+        return self.default() if callable(self.default) else self.default
+
+    def parse(self, raw):
+        """Converts the raw entry text to the parameter's type, raising ValueError with a user-facing message."""
+        text = str(raw).strip()
+        if not text:
+            raise ValueError(f"{self.title} value cannot be empty.")
+        if self.kind is str:
+            return text
+        try:
+            value = self.kind(text)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {self.name} value. Must be a number between {self.minimum}-{self.maximum}.")
+        if (self.minimum is not None and value < self.minimum) or (self.maximum is not None and value > self.maximum):
+            raise ValueError(f"{self.title} must be between {self.minimum} and {self.maximum}.")
+        return value
+
+
+class Operation:
+    """A recipe operation and the metadata the frames and recipe tools need about it.
+
+    Attributes:
+        name (str): Name shown in the sidebar and stored in recipes.
+        target (str | None): "module:function" in this package, or None while
+                             the operation is still a placeholder.
+        params (tuple[Param]): Parameters read from the recipe step.
+        inverse (str | None): Name of the operation that undoes this one.
+        inverse_args (callable | None): Maps a step's arguments to the ones its
+                                        inverse needs, when they differ.
+        direction (str | None): ENCRYPT, DECRYPT, or None for both sidebars.
+        stream (str | None): How the operation runs chunk by chunk on large
+                             inputs: CHUNKWISE, TEXT_CHUNKWISE, the name of
+                             a transform class in streaming.py, or
+                             "module:Class" for one elsewhere in this
+                             package. None if it needs the whole input at once.
+        input_kind (str): TEXT, BYTES or ANY - what the function is given.
+        output_kind (str): TEXT, BYTES or ANY - what the function returns.
+        lossless (bool): Running the inverse (same arguments) right after gives back the input exactly.
+        idempotent (bool): Running it twice in a row is the same as running it once.
+        fixed_args (dict): Extra keyword arguments always passed to the function.
+    """
+
+    def __init__(self, name, target=None, params=(), inverse=None, direction=None,
+                 stream=None, input_kind=TEXT, output_kind=TEXT, lossless=False, idempotent=False,
+                 fixed_args=None, inverse_args=None):
+        self.name = name
+        self.target = target
+        self.params = tuple(params)
+        self.inverse = inverse
+        self.inverse_args = inverse_args
+        self.direction = direction
+        self.stream = stream
+        self.input_kind = input_kind
+        self.output_kind = output_kind
+        self.lossless = lossless
+        self.idempotent = idempotent
+        self.fixed_args = fixed_args or {}
+        self._function = None
+
+    @property
+    def implemented(self):
+        return self.target is not None
+
+    @property
+    def streamable(self):
+        return self.stream is not None
+
+    @property
+    def bytes_native(self):
+        return self.input_kind in (BYTES, ANY)
+
+    @property
+    def function(self):
+        """The implementation, imported on first use.
+
+        Nothing imports the operation modules statically, so frozen builds
+        must bundle them explicitly (--collect-submodules
+        apps.cryptosuite.operations, see the PyInstaller workflow).
+        """
+        if self._function is None:
+            module_name, function_name = self.target.split(":")
+            module = importlib.import_module(f"{__package__}.{module_name}")
+            self._function = getattr(module, function_name)
+        return self._function
+
+    def parse_args(self, args):
+        """Validates raw step arguments against the parameter schema."""
+        args = args or {}
+        # A callable default only seeds new steps; the value must be stored in the recipe
+        return {param.name: param.parse(args.get(param.name, "" if callable(param.default) else param.default))
+                for param in self.params}
+
+    def run(self, data, args=None):
+        """Runs the operation, returning the usual (success, result) tuple."""
+        try:
+            kwargs = self.parse_args(args)
+        except ValueError as e:
+            return False, str(e)
+        return self.function(data, **self.fixed_args, **kwargs)
+
+
+_OPERATIONS = {}
+
+
+def register(operation):
+    """Adds an operation to the registry, replacing any with the same name and direction."""
+    _OPERATIONS[(operation.name, operation.direction)] = operation
+    return operation
+
+
+def get_operation(name, direction=None):
+    """Looks up an operation for a sidebar direction; returns None if unknown.
+
+    Without a direction, an operation registered for either sidebar is found
+    (the encryption one first if the name exists in both).
+    """
+    operation = _OPERATIONS.get((name, direction)) or _OPERATIONS.get((name, None))
+    if operation is None and direction is None:
+        operation = _OPERATIONS.get((name, ENCRYPT)) or _OPERATIONS.get((name, DECRYPT))
+    return operation
+
+
+def operation_names(direction=None):
+    """Names available in a direction's sidebar, in registration order."""
+    return [name for (name, op_direction) in _OPERATIONS if op_direction in (None, direction)]
+
+
+def inverse_operations():
+    """Maps each operation name to the name of the operation that undoes it."""
+    return {name: operation.inverse for (name, _), operation in _OPERATIONS.items() if operation.inverse}
+
+
+# --------------------------------------------------------------------------
+# Built-in operations
+# --------------------------------------------------------------------------
+
+CAESAR_SHIFT = Param("shift", "Shift", int, placeholder="Shift (1-25)", minimum=1, maximum=25)
+ROT_N = Param("n", "N", int, placeholder="N (1-25)", minimum=1, maximum=25, default="13")
+KEY = Param("key", "Key", placeholder="Enter Key...")
+SALT = Param("salt", "Salt", placeholder="Salt (hex)", default=lambda: os.urandom(16).hex())
+KEY_LENGTH = Param("length", "Key Length", int, placeholder="Key length (16-64 bytes)",
+                   minimum=16, maximum=64, default="32")
+KDF_PARAMS = {
+    "PBKDF2": (Param("iterations", "Iterations", int, minimum=1000, maximum=100000000, default="600000"),),
+    "Scrypt": (Param("log_n", "Cost (log2 N)", int, minimum=10, maximum=22, default="17"),
+               Param("r", "Block Size (r)", int, minimum=1, maximum=32, default="8"),
+               Param("p", "Parallelism (p)", int, minimum=1, maximum=16, default="1")),
+    "Argon2": (Param("iterations", "Passes", int, minimum=1, maximum=100, default="3"),
+               Param("memory_kib", "Memory (KiB)", int, minimum=8192, maximum=4194304, default="65536"),
+               Param("lanes", "Lanes", int, minimum=1, maximum=64, default="4")),
+}
+
+
+def _pair(forward, backward, forward_target=None, backward_target=None, backward_args=None, **kwargs):
+    """Registers an encryption-side operation and the decryption-side operation that undoes it."""
+    register(Operation(forward, forward_target, inverse=backward, direction=ENCRYPT, **kwargs))
+    register(Operation(backward, backward_target, inverse=forward, direction=DECRYPT,
+                       fixed_args=backward_args, **kwargs))
+
+
+# Data formats
+register(Operation("To Base64", "encoders:to_base64", inverse="From Base64", direction=ENCRYPT,
+                   stream="Base64Encoder", input_kind=BYTES, lossless=True))
+register(Operation("From Base64", "encoders:from_base64", inverse="To Base64", direction=DECRYPT,
+                   stream="Base64Decoder", input_kind=ANY, output_kind=BYTES))
+for _forward, _backward, _name, _encoder, _decoder in (
+        ("To Base32", "From Base32", "base32", "codecs:Base32Encoder", "codecs:Base32Decoder"),
+        ("To Base58", "From Base58", "base58", None, None),  # One big number: needs the whole input
+        ("To Base85", "From Base85", "base85", "codecs:Base85Encoder", "codecs:Base85Decoder"),
+        ("To Ascii85", "From Ascii85", "ascii85", "codecs:Ascii85Encoder", None)):  # 'z' groups are unaligned
+    register(Operation(_forward, f"codecs:to_{_name}", inverse=_backward, direction=ENCRYPT,
+                       stream=_encoder, input_kind=BYTES, lossless=True))
+    register(Operation(_backward, f"codecs:from_{_name}", inverse=_forward, direction=DECRYPT,
+                       stream=_decoder, input_kind=ANY, output_kind=BYTES))
+register(Operation("To Hex", "hex:to_hex", inverse="From Hex", direction=ENCRYPT, stream="HexEncoder",
+                   input_kind=BYTES, lossless=True))
+register(Operation("From Hex", "hex:from_hex", inverse="To Hex", direction=DECRYPT, stream="HexDecoder",
+                   output_kind=BYTES))
+_pair("URL Encode", "URL Decode")
+register(Operation("To Binary", "binary:to_binary", inverse="From Binary", direction=ENCRYPT,
+                   stream="binary:BinaryEncoder", input_kind=BYTES, lossless=True))
+register(Operation("From Binary", "binary:from_binary", inverse="To Binary", direction=DECRYPT,
+                   stream="binary:BinaryDecoder", input_kind=ANY, output_kind=BYTES))
+_pair("To Morse Code", "From Morse Code", forward_target="morse:to_morse", backward_target="morse:from_morse")
+_pair("To QR Code", "From QR Code")
+
+# Classic ciphers
+_pair("Caesar Encrypt", "Caesar Decrypt", forward_target="ciphers:caesar_cipher",
+      backward_target="ciphers:caesar_cipher", backward_args={"decrypt": True},
+      params=(CAESAR_SHIFT,), stream=CHUNKWISE, input_kind=ANY, output_kind=ANY, lossless=True)
+register(Operation("Atbash Cipher", "ciphers:atbash_cipher", inverse="Atbash Cipher",
+                   stream=CHUNKWISE, input_kind=ANY, output_kind=ANY, lossless=True))
+register(Operation("ROT13 Cipher", "ciphers:rot13", inverse="ROT13 Cipher",
+                   stream=CHUNKWISE, input_kind=ANY, output_kind=ANY, lossless=True))
+register(Operation("ROT-N", "ciphers:rot_n", params=(ROT_N,), inverse="ROT-N",
+                   inverse_args=lambda args: {"n": str(26 - ROT_N.parse(args.get("n", ROT_N.default)))},
+                   stream=CHUNKWISE, input_kind=ANY, output_kind=ANY))
+register(Operation("ROT47 Cipher", "ciphers:rot47", inverse="ROT47 Cipher",
+                   stream=CHUNKWISE, input_kind=ANY, output_kind=ANY, lossless=True))
+_pair("Vigenère Encrypt", "Vigenère Decrypt", forward_target="polyalphabetic:vigenere_cipher",
+      backward_target="polyalphabetic:vigenere_cipher", backward_args={"decrypt": True},
+      params=(KEY,), stream="polyalphabetic:VigenereTransform", input_kind=ANY, output_kind=ANY, lossless=True)
+_pair("Playfair Encrypt", "Playfair Decrypt")
+_pair("Rail Fence Encrypt", "Rail Fence Decrypt")
+register(Operation("Crack Caesar", "analysis:crack_caesar", direction=DECRYPT, input_kind=ANY,
+                   params=(Param("candidates", "Candidates", int, placeholder="Candidates (1-26)",
+                                 minimum=1, maximum=26, default="5"),)))
+register(Operation("Crack Vigenère", "analysis:crack_vigenere", direction=DECRYPT, input_kind=ANY,
+                   params=(Param("max_length", "Max Key Length", int, placeholder="Max key length (2-40)",
+                                 minimum=2, maximum=40, default="20"),
+                           Param("candidates", "Candidates", int, placeholder="Candidates (1-10)",
+                                 minimum=1, maximum=10, default="5"))))
+register(Operation("Beaufort Cipher", "polyalphabetic:beaufort_cipher", params=(KEY,), inverse="Beaufort Cipher",
+                   stream="polyalphabetic:BeaufortTransform", input_kind=ANY, output_kind=ANY, lossless=True))
+
+# Modern symmetric ciphers
+for _forward, _backward, _algorithm in (("AES Encrypt", "AES Decrypt", "AES-256-GCM"),
+                                        ("ChaCha20-Poly1305", "ChaCha20-Poly1305", "ChaCha20-Poly1305")):
+    register(Operation(_forward, "aead:aead_encrypt", params=(KEY,), inverse=_backward, direction=ENCRYPT,
+                       stream="aead:AEADEncryptor", input_kind=BYTES, output_kind=BYTES,
+                       fixed_args={"algorithm": _algorithm}))
+    register(Operation(_backward, "aead:aead_decrypt", params=(KEY,), inverse=_forward, direction=DECRYPT,
+                       stream="aead:AEADDecryptor", input_kind=BYTES, output_kind=BYTES,
+                       fixed_args={"algorithm": _algorithm}))
+
+_pair("Blowfish Encrypt", "Blowfish Decrypt")
+register(Operation("Twofish Encrypt", direction=ENCRYPT))
+register(Operation("Twofish Decrypt", direction=DECRYPT))
+register(Operation("Serpent Encrypt", direction=ENCRYPT))
+register(Operation("Serpent Decrypt", direction=DECRYPT))
+register(Operation("Salsa20 Encrypt", direction=ENCRYPT))
+register(Operation("Salsa20 Decrypt", direction=DECRYPT))
+
+# Asymmetric ciphers
+_pair("RSA Encrypt", "RSA Decrypt")
+register(Operation("ECC Encrypt", direction=ENCRYPT))
+register(Operation("ECC Decrypt", direction=DECRYPT))
+
+# Hashes (one-way, encryption sidebar only)
+for _name in ("SHA-256", "SHA-384", "SHA-512", "SHA-3-256", "SHA-3-512", "BLAKE2b", "BLAKE2s", "BLAKE3",
+              "RIPEMD-160", "Whirlpool", "MD5", "SHA-1"):
+    register(Operation(_name, "hashes:hash_data", direction=ENCRYPT, stream="HashTransform",
+                       input_kind=BYTES, fixed_args={"algorithm": _name}))
+
+# MACs
+for _name in ("HMAC-SHA256", "HMAC-SHA512", "HMAC-MD5"):
+    register(Operation(_name, direction=ENCRYPT))
+
+# Key derivation: the input is the password, the output the derived key in hex
+for _name, _costs in KDF_PARAMS.items():
+    register(Operation(_name, "kdf:kdf_derive", params=(SALT, *_costs, KEY_LENGTH), direction=ENCRYPT,
+                       input_kind=ANY, fixed_args={"algorithm": _name}))
+
+# Text processing
+register(Operation("Reverse Text", "text:reverse_text", inverse="Reverse Text", lossless=True))
+register(Operation("Uppercase", "text:to_uppercase", inverse="Lowercase", stream=TEXT_CHUNKWISE, idempotent=True))
+register(Operation("Lowercase", "text:to_lowercase", inverse="Uppercase", stream=TEXT_CHUNKWISE, idempotent=True))
+register(Operation("Remove Spaces", "text:remove_spaces", stream=TEXT_CHUNKWISE, idempotent=True))
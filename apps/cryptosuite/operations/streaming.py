@@ -0,0 +1,361 @@
+# File: operations/streaming.py
+# Runs a recipe over a byte stream chunk by chunk, so files far larger than
+# memory can be processed with constant memory use.
+#
+# Every streamable operation has a transform with update(chunk) -> bytes and
+# finalize() -> bytes. Transforms that need aligned input (Base64 works on 3
+# or 4 byte groups, Hex on pairs) hold back the unaligned tail until the next
+# chunk arrives. Text operations decode UTF-8 incrementally, so multi-byte
+# characters split across chunks are handled correctly. A transform accepts
+# exactly the input its operation's one-shot function accepts, and produces
+# the same output, wherever the chunk boundaries fall.
+
+import base64
+import binascii
+import codecs
+import importlib
+import os
+import time
+
+from .recipe import run_recipe
+from .registry import CHUNKWISE, TEXT_CHUNKWISE, get_operation
+
+STREAM_CHUNK_SIZE = 2 * 1024 * 1024  # Matches BaseFrame.CHUNK_SIZE
+
+_WHITESPACE = b" \t\r\n\x0b\x0c"
+_BASE64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+_BASE64_VALUES = {byte: value for value, byte in enumerate(_BASE64_ALPHABET)}
+_BASE64_IGNORED = bytes(byte for byte in range(256) if byte not in _BASE64_ALPHABET + b"=")
+
+
+def _checked(result):
+    success, value = result
+    if not success:
+        raise ValueError(value)
+    return value
+
+
+class ChunkTransform:
+    """Transform that applies an operation's function to each chunk independently."""
+
+    def __init__(self, function, kwargs):
+        self.function = function
+        self.kwargs = kwargs
+
+    def update(self, chunk):
+        return _checked(self.function(chunk, **self.kwargs))
+
+    def finalize(self):
+        return b""
+
+
+class TextChunkTransform(ChunkTransform):
+    """Chunk transform for text operations, decoding and re-encoding UTF-8 incrementally."""
+
+    def __init__(self, function, kwargs):
+        super().__init__(function, kwargs)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def _apply(self, data, final=False):
+        try:
+            text = self.decoder.decode(data, final)
+        except UnicodeDecodeError:
+            raise ValueError("Input is binary data, not UTF-8 text.")
+        return _checked(self.function(text, **self.kwargs)).encode('utf-8') if text else b""
+
+    def update(self, chunk):
+        return self._apply(chunk)
+
+    def finalize(self):
+        return self._apply(b"", final=True)
+
+
+class AlignedTransform:
+    """Base for transforms that only process whole groups of `block` bytes at a time."""
+
+    block = 1
+    strip_whitespace = False
+
+    def __init__(self):
+        self.pending = b""
+
+    def convert(self, data):
+        raise NotImplementedError
+
+    def update(self, chunk):
+        if self.strip_whitespace:
+            chunk = chunk.translate(None, _WHITESPACE)
+        data = self.pending + chunk
+        cut = len(data) - len(data) % self.block
+        self.pending = data[cut:]
+        return self.convert(data[:cut]) if cut else b""
+
+    def finalize(self):
+        data, self.pending = self.pending, b""
+        return self.convert(data) if data else b""
+
+
+class Base64Encoder(AlignedTransform):
+    block = 3
+
+    def convert(self, data):
+        return base64.b64encode(data)
+
+
+class Base64Decoder:
+    """Decodes Base64 with the same leniency as base64.b64decode (validate=False).
+
+    Characters outside the alphabet are skipped, and padding that completes a
+    group ends the data; anything after it is ignored. Runs of whole groups
+    without padding are decoded in bulk. The few characters from a '=' to the
+    next group boundary are stepped through one by one, following binascii's
+    rules.
+    """
+
+    def __init__(self):
+        self.pending = b""  # Fewer than 4 alphabet characters at a group boundary
+        self.quad_pos = 0
+        self.leftchar = 0
+        self.pads = 0
+        self.done = False
+
+    def _step(self, char, output):
+        if char == ord("="):
+            if self.quad_pos >= 2:
+                self.pads += 1
+                self.done = self.quad_pos + self.pads >= 4
+            return
+        value = _BASE64_VALUES[char]
+        self.pads = 0
+        if self.quad_pos == 1:
+            output.append((self.leftchar << 2 | value >> 4) & 0xFF)
+        elif self.quad_pos == 2:
+            output.append((self.leftchar << 4 | value >> 2) & 0xFF)
+        elif self.quad_pos == 3:
+            output.append((self.leftchar << 6 | value) & 0xFF)
+        self.leftchar = value & (0x3F, 0x0F, 0x03, 0x00)[self.quad_pos]
+        self.quad_pos = (self.quad_pos + 1) % 4
+
+    def update(self, chunk):
+        if self.done:
+            return b""
+        data = self.pending + chunk.translate(None, _BASE64_IGNORED)
+        output = bytearray()
+        position = 0
+        while position < len(data) and not self.done:
+            if self.quad_pos == 0:
+                pad = data.find(b"=", position)
+                end = len(data) if pad == -1 else pad
+                whole = position + (end - position) // 4 * 4
+                if whole > position:
+                    output += binascii.a2b_base64(data[position:whole])
+                    position, self.pads = whole, 0
+                if pad == -1:
+                    break
+            self._step(data[position], output)
+            position += 1
+        self.pending = b"" if self.done else data[position:]
+        return bytes(output)
+
+    def finalize(self):
+        output = bytearray()
+        for char in self.pending:
+            if not self.done:
+                self._step(char, output)
+        self.pending = b""
+        if self.quad_pos and not self.done:
+            raise ValueError("Invalid Base64 input: Incorrect padding")
+        return bytes(output)
+
+
+class HexEncoder:
+    def update(self, chunk):
+        return chunk.hex().encode('ascii')
+
+    def finalize(self):
+        return b""
+
+
+class HexDecoder(AlignedTransform):
+    """Decodes Hex as hex.from_hex does: every "0x" and all whitespace are ignored."""
+
+    block = 2
+    strip_whitespace = True
+
+    def __init__(self):
+        super().__init__()
+        self.zero = b""  # A trailing '0' that may start a "0x" in the next chunk
+
+    def update(self, chunk):
+        chunk, self.zero = self.zero + chunk, b""
+        if chunk.endswith(b"0"):
+            chunk, self.zero = chunk[:-1], b"0"
+        return super().update(chunk.replace(b"0x", b""))
+
+    def finalize(self):
+        output, self.zero = super().update(self.zero), b""
+        return output + super().finalize()
+
+    def convert(self, data):
+        if len(data) % 2:
+            raise ValueError("Invalid Hex string: odd length.")
+        try:
+            return bytes.fromhex(data.decode('ascii'))
+        except (UnicodeDecodeError, ValueError):
+            raise ValueError("Invalid characters in Hex string.")
+
+
+class HashTransform:
+    """Consumes the whole stream and emits the hex digest at the end."""
+
+    def __init__(self, algorithm):
+        from .hashes import new_hash
+
+        self.hasher = new_hash(algorithm)
+
+    def update(self, chunk):
+        self.hasher.update(chunk)
+        return b""
+
+    def finalize(self):
+        return self.hasher.hexdigest().encode('ascii')
+
+
+def open_transform(operation, args=None):
+    """Creates the streaming transform for one recipe step."""
+    kwargs = {**operation.fixed_args, **operation.parse_args(args)}
+    if operation.stream == CHUNKWISE:
+        return ChunkTransform(operation.function, kwargs)
+    if operation.stream == TEXT_CHUNKWISE:
+        return TextChunkTransform(operation.function, kwargs)
+    if ":" in operation.stream:
+        module_name, class_name = operation.stream.split(":")
+        transform = getattr(importlib.import_module(f"{__package__}.{module_name}"), class_name)
+    else:
+        transform = globals()[operation.stream]
+    return transform(**kwargs)
+
+
+def open_pipeline(steps, direction=None):
+    """Builds transforms for a list of {"operation", "args"} steps; raises ValueError if any cannot stream."""
+    transforms = []
+    for step in steps:
+        operation_name = step.get("operation")
+        operation = get_operation(operation_name, direction)
+        if operation is None:
+            raise ValueError(f"Unknown operation: {operation_name}")
+        if not operation.streamable:
+            raise ValueError(f"{operation_name} cannot process files in chunks.")
+        transforms.append(open_transform(operation, step.get("args", {})))
+    return transforms
+
+
+def _push(transforms, chunk, start=0):
+    for transform in transforms[start:]:
+        if not chunk:
+            return b""
+        chunk = transform.update(chunk)
+    return chunk
+
+
+def iter_pipeline(transforms, chunks):
+    """Yields output chunks for an iterable of input chunks."""
+    for chunk in chunks:
+        output = _push(transforms, chunk)
+        if output:
+            yield output
+    # Flush each transform's held-back tail through the transforms after it
+    for index, transform in enumerate(transforms):
+        output = _push(transforms, transform.finalize(), index + 1)
+        if output:
+            yield output
+
+
+class _Cancelled(Exception):
+    pass
+
+
+def stream_recipe(steps, source, sink, direction=None, chunk_size=STREAM_CHUNK_SIZE,
+                  progress=None, cancelled=None):
+    """Runs a recipe from a readable binary file object to a writable one.
+
+    progress(bytes_in, bytes_out, elapsed) is called after every input chunk
+    has gone through the pipeline, and once more at the end; cancelled() is
+    polled before every read. Both happen per input chunk, so they keep
+    working when steps hold their output back (hashes, aligned tails).
+    Returns a dict of byte counts and timing, or None if cancelled.
+    """
+    transforms = open_pipeline(steps, direction)
+    stats = {"bytes_in": 0, "bytes_out": 0, "seconds": 0.0}
+    start = time.perf_counter()
+
+    def report():
+        stats["seconds"] = time.perf_counter() - start
+        if progress:
+            progress(stats["bytes_in"], stats["bytes_out"], stats["seconds"])
+
+    def read_chunks():
+        while True:
+            if cancelled and cancelled():
+                raise _Cancelled()
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            stats["bytes_in"] += len(chunk)
+            yield chunk
+            report()  # Resumed only once the chunk's output has been written
+
+    try:
+        for output in iter_pipeline(transforms, read_chunks()):
+            sink.write(output)
+            stats["bytes_out"] += len(output)
+    except _Cancelled:
+        return None
+
+    report()
+    return stats
+
+
+def can_stream(steps, direction=None):
+    """True if every step is a known operation that can process data in chunks."""
+    operations = [get_operation(step.get("operation"), direction) for step in steps]
+    return all(operation is not None and operation.streamable for operation in operations)
+
+
+def bake_stream(steps, source, sink, direction=None):
+    """Runs a recipe from a binary file object to another, in chunks when every step can stream.
+
+    Otherwise the whole input is read and run in memory, as Bake Recipe
+    does. Raises ValueError if a step fails.
+    """
+    if can_stream(steps, direction):
+        stream_recipe(steps, source, sink, direction)
+        return
+    success, result = run_recipe(steps, source.read(), direction)
+    if not success:
+        raise ValueError(result)
+    sink.write(result.encode('utf-8') if isinstance(result, str) else result)
+
+
+def process_file(steps, input_path, output_path, direction=None, **kwargs):
+    """Runs a recipe from one file to another; a partial output file is removed on failure."""
+    try:
+        with open(input_path, 'rb') as source, open(output_path, 'wb') as sink:
+            stats = stream_recipe(steps, source, sink, direction, **kwargs)
+    except BaseException:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+    if stats is None:
+        os.remove(output_path)
+    return stats
+
+
+def format_rate(byte_count, seconds):
+    """Human-readable throughput, e.g. '143.2 MB/s'."""
+    rate = byte_count / seconds if seconds > 0 else 0.0
+    for unit in ("B/s", "KB/s", "MB/s"):
+        if rate < 1024:
+            return f"{rate:.1f} {unit}"
+        rate /= 1024
+    return f"{rate:.1f} GB/s"
@@ -0,0 +1,20 @@
+# File: operations/text.py
+
+def reverse_text(text: str) -> tuple[bool, str]:
+    """Reverses the order of the characters in the text."""
+    return True, text[::-1]
+
+
+def to_uppercase(text: str) -> tuple[bool, str]:
+    """Converts the text to uppercase."""
+    return True, text.upper()
+
+
+def to_lowercase(text: str) -> tuple[bool, str]:
+    """Converts the text to lowercase."""
+    return True, text.lower()
+
+
+def remove_spaces(text: str) -> tuple[bool, str]:
+    """Removes all space characters from the text."""
+    return True, text.replace(" ", "")
@@ -1,24 +1,43 @@
 import os
 import base64
+import hmac
+import io
+import shutil
+import struct
 import numpy as np
-from collections import deque
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.backends import default_backend
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
 
 # --- Constants ---
 ENCRYPTION_ITERATIONS = 100000
 MESSAGE_DELIMITER = "####"
+DECODE_BLOCK_BYTES = 64 * 1024  # Bytes unpacked per pass while searching for the delimiter
+BMP_EXTENSIONS = (".bmp", ".dib")
+PPM_EXTENSIONS = (".ppm", ".pnm")
+
+# Streaming payload container (see encrypt_stream)
+STREAM_MAGIC = b"\x89SSP"  # Never valid Base64, so it cannot clash with the Fernet text format
+STREAM_VERSION = 2
+STREAM_CHUNK_SIZE = 256 * 1024
+STREAM_MAX_CHUNK_SIZE = 16 * 1024 * 1024  # Upper bound accepted when reading chunk lengths
+STREAM_SALT_SIZE = 16
+STREAM_NONCE_PREFIX_SIZE = 7
+STREAM_TAG_SIZE = 16
+STREAM_KCV_SIZE = 4
+STREAM_HEADER = struct.Struct(f">4sB{STREAM_SALT_SIZE}s{STREAM_NONCE_PREFIX_SIZE}s{STREAM_KCV_SIZE}s")
+STREAM_CHUNK_HEADER = struct.Struct(">BI")  # final flag, ciphertext length
 
 
 # --------------------------------------------------------------------------
 # Core Steganography & Crypto Logic
 # --------------------------------------------------------------------------
 
-def generate_key(password, salt=None):
-    if salt is None:
-        salt = os.urandom(16)
+def derive_key(password, salt):
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
@@ -26,16 +45,17 @@ def generate_key(password, salt=None):
         iterations=ENCRYPTION_ITERATIONS,
         backend=default_backend()
     )
-    return base64.urlsafe_b64encode(kdf.derive(password.encode())), salt
+    return kdf.derive(password.encode())
 
 
-def encrypt_message(message, password):
-    key, salt = generate_key(password)
-    cipher = Fernet(key)
-    return base64.b64encode(salt + cipher.encrypt(message.encode())).decode()
+def generate_key(password, salt=None):
+    if salt is None:
+        salt = os.urandom(16)
+    return base64.urlsafe_b64encode(derive_key(password, salt)), salt
 
 
 def decrypt_message(encrypted_data, password):
+    """Decrypts the Fernet text format that older GUI versions embedded (read-only; new images use streams)."""
     try:
         decoded_data = base64.b64decode(encrypted_data.encode())
         salt, encrypted_msg = decoded_data[:16], decoded_data[16:]
@@ -48,31 +68,421 @@ def decrypt_message(encrypted_data, password):
         return None
 
 
-def encode_lsb(image, data):
-    data += MESSAGE_DELIMITER
-    binary_data = ''.join(format(ord(c), '08b') for c in data)
-    flat_img = image.flatten()
-    if len(binary_data) > len(flat_img):
-        return None
-    binary_array = np.array(list(binary_data), dtype=np.uint8)
-    flat_img[:len(binary_array)] = (flat_img[:len(binary_array)] & 0b11111110) | binary_array
-    return flat_img.reshape(image.shape)
+def plan_embedding(message_size, capacity_bytes, channels=3):
+    """Works out what embedding a message of message_size bytes will take, without any crypto.
+
+    Returns a dict with the embedded size in bytes and bits, the pixels touched,
+    the headroom left in bytes (negative when it does not fit) and whether it fits.
+    """
+    payload_bytes = stream_payload_size(message_size)
+    bits = payload_bytes * 8
+    return {
+        "payload_bytes": payload_bytes,
+        "bits": bits,
+        "pixels": -(-bits // channels),
+        "headroom_bytes": capacity_bytes - payload_bytes,
+        "fits": payload_bytes <= capacity_bytes,
+    }
 
 
 def decode_lsb(image):
-    flat_img = image.flatten()
-    extracted_bits, byte_chars = [], []
-    history = deque(maxlen=len(MESSAGE_DELIMITER))
-
-    for pixel in flat_img:
-        extracted_bits.append(pixel & 1)
-        if len(extracted_bits) == 8:
-            byte = int("".join(map(str, extracted_bits)), 2)
-            char = chr(byte)
-            byte_chars.append(char)
-            history.append(char)
-            extracted_bits = []
-
-            if "".join(history) == MESSAGE_DELIMITER:
-                return "".join(byte_chars[:-len(MESSAGE_DELIMITER)])
-    return None
\ No newline at end of file
+    delimiter = MESSAGE_DELIMITER.encode()
+    extracted = bytearray()
+    leftover_bits = np.empty(0, dtype=np.uint8)
+
+    # Unpack the LSB plane block by block so a short message near the start of a
+    # large image is found without touching the rest of the pixels.
+    for block in _iter_flat_blocks(image, DECODE_BLOCK_BYTES * 8):
+        bits = np.concatenate((leftover_bits, block & 1))
+        usable = len(bits) - len(bits) % 8
+        leftover_bits = bits[usable:]
+
+        search_start = max(0, len(extracted) - len(delimiter) + 1)
+        extracted += np.packbits(bits[:usable]).tobytes()
+        index = extracted.find(delimiter, search_start)
+        if index != -1:
+            return extracted[:index].decode("latin-1")
+    return None
+
+
+def calculate_capacity(image):
+    """Returns how many payload bytes (delimiter included) fit in the image's LSBs."""
+    return image.size // 8
+
+
+def _read_flat_values(image, start, count):
+    """Returns count channel values starting at flat index start, copying only the rows spanned."""
+    if image.flags.c_contiguous:
+        return image.reshape(-1)[start:start + count]
+    row_values = image[0].size
+    first_row, last_row = start // row_values, -(-(start + count) // row_values)
+    offset = start - first_row * row_values
+    return np.ascontiguousarray(image[first_row:last_row]).reshape(-1)[offset:offset + count]
+
+
+def _iter_flat_blocks(image, block_values):
+    """Yields the image's channel values in flattened (row-major) order, in blocks.
+
+    Strided views such as memory-mapped carriers are copied a few rows at a
+    time, so only the rows that are actually consumed get read.
+    """
+    if image.ndim < 2 or image.flags.c_contiguous:
+        flat_img = image.reshape(-1)
+        for start in range(0, flat_img.size, block_values):
+            yield flat_img[start:start + block_values]
+        return
+
+    rows_per_block = max(1, block_values // image[0].size)
+    for start in range(0, image.shape[0], rows_per_block):
+        yield np.ascontiguousarray(image[start:start + rows_per_block]).reshape(-1)
+
+
+def _write_lsb_bits(image, bits, start=0):
+    """Writes bits into the LSBs of the channel values starting at start, in place."""
+    end = start + len(bits)
+    if image.flags.c_contiguous:
+        flat_img = image.reshape(-1)
+        flat_img[start:end] = (flat_img[start:end] & 0b11111110) | bits
+        return
+
+    # Only copy out (and write back) the rows the bits span
+    row_values = image[0].size
+    first_row, last_row = start // row_values, -(-end // row_values)
+    block = np.ascontiguousarray(image[first_row:last_row])
+    flat_block = block.reshape(-1)
+    offset = start - first_row * row_values
+    flat_block[offset:offset + len(bits)] = (flat_block[offset:offset + len(bits)] & 0b11111110) | bits
+    image[first_row:last_row] = block
+
+
+# --------------------------------------------------------------------------
+# Uncompressed Carriers (BMP / PPM) - Zero-Decode Embedding
+# --------------------------------------------------------------------------
+
+def _parse_bmp_header(f):
+    header = f.read(54)
+    if len(header) < 54 or header[:2] != b"BM":
+        return None
+    pixel_offset, dib_size = struct.unpack_from("<II", header, 10)
+    if dib_size < 40:
+        return None
+    width, height, _, bits_per_pixel, compression = struct.unpack_from("<iiHHI", header, 18)
+    # Only uncompressed 24/32-bit images share OpenCV's BGR byte layout
+    if compression != 0 or bits_per_pixel not in (24, 32) or width <= 0 or height == 0:
+        return None
+    return {
+        "offset": pixel_offset,
+        "width": width,
+        "height": abs(height),
+        "bytes_per_pixel": bits_per_pixel // 8,
+        "row_stride": ((width * bits_per_pixel + 31) // 32) * 4,
+        "bottom_up": height > 0,
+        "rgb": False,
+    }
+
+
+def _parse_ppm_header(f):
+    header = f.read(1024)
+    if header[:2] != b"P6":
+        return None
+    fields, pos = [], 2
+    while len(fields) < 3:
+        while pos < len(header) and header[pos:pos + 1].isspace():
+            pos += 1
+        if header[pos:pos + 1] == b"#":
+            pos = header.find(b"\n", pos)
+            if pos == -1:
+                return None
+            continue
+        start = pos
+        while pos < len(header) and header[pos:pos + 1].isdigit():
+            pos += 1
+        if start == pos:
+            return None
+        fields.append(int(header[start:pos]))
+    width, height, max_value = fields
+    # A single whitespace byte separates the header from the pixel data
+    if max_value > 255 or width <= 0 or height <= 0 or not header[pos:pos + 1].isspace():
+        return None
+    return {
+        "offset": pos + 1,
+        "width": width,
+        "height": height,
+        "bytes_per_pixel": 3,
+        "row_stride": width * 3,
+        "bottom_up": False,
+        "rgb": True,
+    }
+
+
+def read_raw_carrier_layout(path):
+    """Parses a BMP/PPM header and returns the pixel layout, or None if unsupported."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in BMP_EXTENSIONS:
+        parser = _parse_bmp_header
+    elif extension in PPM_EXTENSIONS:
+        parser = _parse_ppm_header
+    else:
+        return None
+    try:
+        with open(path, "rb") as f:
+            layout = parser(f)
+        if layout and os.path.getsize(path) < layout["offset"] + layout["row_stride"] * layout["height"]:
+            return None
+        return layout
+    except OSError:
+        return None
+
+
+def is_raw_carrier(path):
+    return read_raw_carrier_layout(path) is not None
+
+
+def open_raw_carrier(path, mode="r", layout=None):
+    """Memory-maps an uncompressed carrier without decoding it.
+
+    Returns (memmap, image) where image is a (height, width, 3) view over the
+    pixel region in the same top-down BGR order cv2.imread produces, so the
+    regular LSB functions see exactly the same channel sequence.
+    """
+    layout = layout or read_raw_carrier_layout(path)
+    if layout is None:
+        return None, None
+    mapped = np.memmap(path, dtype=np.uint8, mode=mode, offset=layout["offset"],
+                       shape=(layout["height"], layout["row_stride"]))
+    pixels = mapped[:, :layout["width"] * layout["bytes_per_pixel"]]
+    image = pixels.reshape(layout["height"], layout["width"], layout["bytes_per_pixel"])[:, :, :3]
+    if layout["bottom_up"]:
+        image = image[::-1]
+    if layout["rgb"]:
+        image = image[:, :, ::-1]
+    return mapped, image
+
+
+def can_embed_raw(src_path, dst_path):
+    """True if the payload can be written straight into a copy of an uncompressed carrier."""
+    src_ext = os.path.splitext(src_path)[1].lower()
+    dst_ext = os.path.splitext(dst_path)[1].lower()
+    same_format = ((src_ext in BMP_EXTENSIONS and dst_ext in BMP_EXTENSIONS) or
+                   (src_ext in PPM_EXTENSIONS and dst_ext in PPM_EXTENSIONS))
+    return same_format and is_raw_carrier(src_path)
+
+
+def encode_lsb_raw(src_path, dst_path, payload):
+    """Embeds payload bytes into an uncompressed carrier without decoding or re-encoding it.
+
+    The carrier is copied to dst_path and only the pixel rows the payload spans
+    are touched through a memory map. Returns False if the payload is too large.
+    """
+    layout = read_raw_carrier_layout(src_path)
+    if len(payload) * 8 > layout["width"] * layout["height"] * 3:
+        return False
+
+    if os.path.abspath(src_path) != os.path.abspath(dst_path):
+        shutil.copyfile(src_path, dst_path)
+    mapped, image = open_raw_carrier(dst_path, mode="r+", layout=layout)
+    _write_lsb_bits(image, np.unpackbits(np.frombuffer(payload, dtype=np.uint8)))
+    mapped.flush()
+    del mapped, image
+    return True
+
+
+# --------------------------------------------------------------------------
+# Streaming Payloads - Chunked AES-256-GCM
+# --------------------------------------------------------------------------
+#
+# Large payloads are sealed chunk by chunk (STREAM construction) so that
+# neither encryption nor embedding ever holds more than one chunk:
+#
+#   header: magic | version | salt | nonce prefix | key check value
+#   chunk:  final flag | ciphertext length | AES-GCM ciphertext + tag
+#
+# Each chunk nonce is prefix || counter || final flag and the header is the
+# associated data, so reordering, truncating or extending the stream, or
+# editing the header, all fail authentication.
+#
+# The PBKDF2 output is split with HKDF into the AES key and a short key check
+# value stored in the header, so a wrong password is rejected right after the
+# header is read instead of after pulling the first chunk out of the image.
+
+class InvalidPassword(InvalidTag):
+    """Raised when a stream header's key check value does not match the password."""
+
+
+def _stream_nonce(prefix, counter, final):
+    return prefix + struct.pack(">IB", counter, 1 if final else 0)
+
+
+def _hkdf_expand(master_key, info, length):
+    return HKDF(algorithm=hashes.SHA256(), length=length, salt=None, info=info,
+                backend=default_backend()).derive(master_key)
+
+
+def derive_stream_keys(password, salt):
+    """Returns (AES-256 key, key check value) for a stream container."""
+    master_key = derive_key(password, salt)
+    return (_hkdf_expand(master_key, b"SecureSuite stream key", 32),
+            _hkdf_expand(master_key, b"SecureSuite key check", STREAM_KCV_SIZE))
+
+
+def read_stream_header(reader):
+    """Reads a container header; returns a dict with the raw header bytes and its fields."""
+    raw = reader.read(STREAM_HEADER.size)
+    if len(raw) < STREAM_HEADER.size:
+        raise ValueError("No stream payload found.")
+    magic, version, salt, nonce_prefix, kcv = STREAM_HEADER.unpack(raw)
+    if magic != STREAM_MAGIC or version != STREAM_VERSION:
+        raise ValueError("No stream payload found.")
+    return {"raw": raw, "salt": salt, "nonce_prefix": nonce_prefix, "kcv": kcv}
+
+
+def _open_stream_cipher(header, password):
+    key, kcv = derive_stream_keys(password, header["salt"])
+    if not hmac.compare_digest(kcv, header["kcv"]):
+        raise InvalidPassword()
+    return AESGCM(key)
+
+
+def stream_payload_size(plaintext_size, chunk_size=STREAM_CHUNK_SIZE):
+    """Exact number of bytes encrypt_stream produces for a plaintext of the given size."""
+    chunks = max(1, -(-plaintext_size // chunk_size))
+    return STREAM_HEADER.size + plaintext_size + chunks * (STREAM_CHUNK_HEADER.size + STREAM_TAG_SIZE)
+
+
+def max_stream_plaintext(capacity_bytes, chunk_size=STREAM_CHUNK_SIZE):
+    """Largest plaintext whose stream container fits in capacity_bytes."""
+    available = capacity_bytes - STREAM_HEADER.size
+    chunk_overhead = STREAM_CHUNK_HEADER.size + STREAM_TAG_SIZE
+    if available < chunk_overhead:
+        return 0
+    full_chunks, remainder = divmod(available, chunk_size + chunk_overhead)
+    return full_chunks * chunk_size + max(0, remainder - chunk_overhead)
+
+
+def encrypt_stream(source, password, chunk_size=STREAM_CHUNK_SIZE):
+    """Yields the encrypted container for a readable binary file object, chunk by chunk."""
+    if not 0 < chunk_size <= STREAM_MAX_CHUNK_SIZE:
+        raise ValueError(f"Chunk size must be between 1 and {STREAM_MAX_CHUNK_SIZE} bytes.")
+    salt, nonce_prefix = os.urandom(STREAM_SALT_SIZE), os.urandom(STREAM_NONCE_PREFIX_SIZE)
+    key, kcv = derive_stream_keys(password, salt)
+    header = STREAM_HEADER.pack(STREAM_MAGIC, STREAM_VERSION, salt, nonce_prefix, kcv)
+    cipher = AESGCM(key)
+    yield header
+
+    # Read one chunk ahead so the last chunk can be flagged as final
+    counter, chunk = 0, source.read(chunk_size)
+    while True:
+        next_chunk = source.read(chunk_size)
+        final = not next_chunk
+        sealed = cipher.encrypt(_stream_nonce(nonce_prefix, counter, final), chunk, header)
+        yield STREAM_CHUNK_HEADER.pack(1 if final else 0, len(sealed)) + sealed
+        if final:
+            return
+        counter, chunk = counter + 1, next_chunk
+
+
+def decrypt_stream(reader, password):
+    """Yields plaintext chunks from a container read through reader.read(n).
+
+    Raises InvalidPassword (before any chunk is read) when the key check value
+    does not match, cryptography.exceptions.InvalidTag for tampered data and
+    ValueError for anything that is not a complete container.
+    """
+    header = read_stream_header(reader)
+    cipher = _open_stream_cipher(header, password)
+
+    counter = 0
+    while True:
+        chunk_header = reader.read(STREAM_CHUNK_HEADER.size)
+        if len(chunk_header) < STREAM_CHUNK_HEADER.size:
+            raise ValueError("Stream payload is truncated.")
+        final, length = STREAM_CHUNK_HEADER.unpack(chunk_header)
+        if length < STREAM_TAG_SIZE or length > STREAM_MAX_CHUNK_SIZE + STREAM_TAG_SIZE:
+            raise ValueError("Stream payload is corrupted.")
+        sealed = reader.read(length)
+        if len(sealed) < length:
+            raise ValueError("Stream payload is truncated.")
+        yield cipher.decrypt(_stream_nonce(header["nonce_prefix"], counter, final), sealed, header["raw"])
+        if final:
+            return
+        counter += 1
+
+
+def check_stream_password(image, password):
+    """Checks a password against the header alone, without reading any payload bits.
+
+    Returns True if the password matches the header's key check value.
+    """
+    header = read_stream_header(LSBReader(image))
+    try:
+        _open_stream_cipher(header, password)
+        return True
+    except InvalidPassword:
+        return False
+
+
+def encode_lsb_stream(image, chunks):
+    """Writes a stream of byte chunks into the image's LSBs in place.
+
+    Works on in-memory images as well as memory-mapped carriers. Returns the
+    number of bytes written, or None if the image ran out of capacity (the
+    image then holds a partial, unreadable payload).
+    """
+    position, capacity = 0, image.size
+    for chunk in chunks:
+        bits = np.unpackbits(np.frombuffer(chunk, dtype=np.uint8))
+        if position + len(bits) > capacity:
+            return None
+        _write_lsb_bits(image, bits, position)
+        position += len(bits)
+    return position // 8
+
+
+class LSBReader:
+    """File-like reader over the bytes hidden in an image's LSBs.
+
+    Every read unpacks exactly the channel values it needs, so reading a
+    header never touches the payload behind it.
+    """
+
+    def __init__(self, image):
+        self._image = image
+        self._position = 0
+
+    def read(self, size):
+        count = min(size * 8, self._image.size - self._position)
+        count -= count % 8
+        if count <= 0:
+            return b""
+        values = _read_flat_values(self._image, self._position, count)
+        self._position += count
+        return np.packbits(values & 1).tobytes()
+
+
+def encrypt_stream_message(message, password):
+    """The stream container for a text message, as one bytes object (what the GUI embeds)."""
+    return b"".join(encrypt_stream(io.BytesIO(message.encode("utf-8")), password))
+
+
+def decrypt_stream_message(image, password):
+    """Decrypts a text stream payload in one go, mirroring decrypt_message's results.
+
+    Returns "BINARY_PAYLOAD" when the payload decrypts but is not UTF-8 text.
+    A chunk that fails authentication after the key check passed means the
+    data is corrupted, not that the password is wrong, so it gives None.
+    """
+    try:
+        data = b"".join(decrypt_stream(LSBReader(image), password))
+    except InvalidPassword:
+        return "INVALID_PASSWORD"
+    except Exception:  # InvalidTag (tampered chunk) or a malformed container
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return "BINARY_PAYLOAD"
+
+
+def is_stream_payload(image):
+    """True if the image's LSBs start with a streaming payload container."""
+    return LSBReader(image).read(len(STREAM_MAGIC)) == STREAM_MAGIC
@@ -7,14 +7,14 @@ import tkinter as tk
 import webbrowser
 from tkinter import messagebox, filedialog
 
-import cv2
 import ttkbootstrap as ttk
-from PIL import Image, ImageTk
 from tkinterdnd2 import DND_FILES, TkinterDnD
 from ttkbootstrap.scrolled import ScrolledText
 
-# Import the core logic from our new core.py file
-from .core import encrypt_message, decrypt_message, encode_lsb, decode_lsb
+# Import the core logic from our new core.py file.
+# OpenCV and Pillow are imported on first image load to keep startup fast.
+from .core import (encrypt_stream_message, decrypt_message, encode_lsb_stream, decode_lsb, calculate_capacity,
+                   plan_embedding, can_embed_raw, encode_lsb_raw, is_stream_payload, decrypt_stream_message)
 
 
 def resource_path(relative_path):
@@ -32,7 +32,7 @@ def resource_path(relative_path):
 class SteganographyApp(TkinterDnD.Tk):
     """A secure steganography tool with a modern GUI."""
 
-    def __init__(self):
+    def __init__(self, on_first_window=None):
         super().__init__()
         self.style = ttk.Style(theme="superhero")
         self.title("Steganography Suite")
@@ -71,14 +71,20 @@ class SteganographyApp(TkinterDnD.Tk):
 
         # State variables
         self.img_encrypt, self.img_decrypt = None, None
+        self.encrypt_path = None
         self.original_pil_encrypt, self.original_pil_decrypt = None, None
         self.resize_timer, self.max_bytes, self.status_timer, self.debounce_timer = None, 0, None, None
+        self.decrypt_tab, self.img_label_decrypt, self.img_container_decrypt = None, None, None
 
         self._create_main_content_widgets()
 
         # --- Reveal the window only when it is fully built ---
         self.deiconify()
 
+        # Startup measurement hook: called once the first window has been drawn
+        if on_first_window is not None:
+            self.after_idle(on_first_window)
+
     def _create_menu_bar(self):
         menu_bar = tk.Menu(self)
 
@@ -185,11 +191,14 @@ class SteganographyApp(TkinterDnD.Tk):
         self.style.configure('TNotebook.Tab', font=('Segoe UI', 12, 'bold'), padding=[20, 8])
         self.style.configure('TNotebook', tabposition='nw')
 
-        notebook = ttk.Notebook(main_frame)
-        notebook.grid(row=0, column=0, pady=5, sticky="nsew")
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.grid(row=0, column=0, pady=5, sticky="nsew")
 
-        notebook.add(self._create_encrypt_tab(notebook), text="Hide Message 🖼️")
-        notebook.add(self._create_decrypt_tab(notebook), text="Extract Message 🔍")
+        # The extract tab starts as an empty frame and is filled on first selection
+        self.decrypt_tab_frame = ttk.Frame(self.notebook, padding=20)
+        self.notebook.add(self._create_encrypt_tab(self.notebook), text="Hide Message 🖼️")
+        self.notebook.add(self.decrypt_tab_frame, text="Extract Message 🔍")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self.status_bar = ttk.Label(main_frame, text="Ready", padding=(10, 5), font=('Segoe UI', 9))
         self.status_bar.grid(row=1, column=0, sticky="ew", pady=(10, 0))
@@ -251,8 +260,16 @@ class SteganographyApp(TkinterDnD.Tk):
 
         return tab_frame
 
-    def _create_decrypt_tab(self, parent):
-        tab_frame = ttk.Frame(parent, padding=20)
+    def _on_tab_changed(self, event=None):
+        if self.notebook.select() == str(self.decrypt_tab_frame):
+            self._ensure_decrypt_tab()
+
+    def _ensure_decrypt_tab(self):
+        """Builds the extract tab the first time it is needed."""
+        if self.decrypt_tab is None:
+            self.decrypt_tab = self._create_decrypt_tab(self.decrypt_tab_frame)
+
+    def _create_decrypt_tab(self, tab_frame):
         tab_frame.grid_columnconfigure(0, weight=2, uniform="group1")
         tab_frame.grid_columnconfigure(1, weight=1, uniform="group1")
         tab_frame.grid_rowconfigure(0, weight=1)
@@ -346,11 +363,14 @@ class SteganographyApp(TkinterDnD.Tk):
 
     def _perform_resize(self):
         self._update_image_preview(self.img_label_encrypt, self.original_pil_encrypt, self.img_container_encrypt)
-        self._update_image_preview(self.img_label_decrypt, self.original_pil_decrypt, self.img_container_decrypt)
+        if self.decrypt_tab is not None:
+            self._update_image_preview(self.img_label_decrypt, self.original_pil_decrypt, self.img_container_decrypt)
 
     def _update_image_preview(self, label, pil_img, container):
         if not pil_img or container.winfo_width() < 50 or container.winfo_height() < 50:
             return
+        from PIL import Image, ImageTk
+
         img_copy = pil_img.copy()
         img_copy.thumbnail((container.winfo_width() - 10, container.winfo_height() - 10), Image.LANCZOS)
         tk_img = ImageTk.PhotoImage(img_copy)
@@ -359,12 +379,17 @@ class SteganographyApp(TkinterDnD.Tk):
 
     def _load_image(self, path, is_encrypt=True):
         try:
+            import cv2
+            from PIL import Image
+
             if is_encrypt:
                 self.img_encrypt, self.original_pil_encrypt = cv2.imread(path), Image.open(path)
-                self.max_bytes = (self.img_encrypt.shape[0] * self.img_encrypt.shape[1] * 3) // 8
+                self.encrypt_path = path
+                self.max_bytes = calculate_capacity(self.img_encrypt)
                 self._update_msg_size_indicator()
                 self._update_status(f"Loaded: {os.path.basename(path)}", "info")
             else:
+                self._ensure_decrypt_tab()
                 self._clear(is_encrypt=False)
                 self.img_decrypt, self.original_pil_decrypt = cv2.imread(path), Image.open(path)
                 self._update_status(f"Loaded for decryption: {os.path.basename(path)}", "info")
@@ -382,8 +407,12 @@ class SteganographyApp(TkinterDnD.Tk):
         if not all((self.img_encrypt is not None, message, self.pass_entry.get())):
             self._update_status("Input Required: Please fill all fields.", "warning")
             return
+        if not plan_embedding(len(message.encode('utf-8')), self.max_bytes)["fits"]:
+            self._update_status("Error: Message is too large for this image.", "danger")
+            return
         path = filedialog.asksaveasfilename(defaultextension=".png",
-                                            filetypes=[("PNG files", "*.png"), ("All files", "*.*")])
+                                            filetypes=[("PNG files", "*.png"), ("BMP files", "*.bmp"),
+                                                       ("All files", "*.*")])
         if path:
             if path.lower().endswith(('.jpg', '.jpeg')) and not messagebox.askyesno("Warning",
                                                                                     "Saving as JPEG may corrupt data.\nContinue?"):
@@ -400,10 +429,19 @@ class SteganographyApp(TkinterDnD.Tk):
         self.progress_encrypt.grid(row=7, column=0, sticky="ew", pady=20)
         self.progress_encrypt.start()
         self._update_status("Encrypting message...", "info")
-        encrypted_msg = encrypt_message(message, self.pass_entry.get())
-        modified_img = encode_lsb(self.img_encrypt, encrypted_msg)
-        if modified_img is not None:
-            cv2.imwrite(path, modified_img)
+        # Stream container: its key check value lets a wrong password be rejected from the header alone
+        payload = encrypt_stream_message(message, self.pass_entry.get())
+        if self.encrypt_path and can_embed_raw(self.encrypt_path, path):
+            # Uncompressed carrier saved in the same format: patch the pixel bytes directly
+            saved = encode_lsb_raw(self.encrypt_path, path, payload)
+        else:
+            modified_img = self.img_encrypt.copy()
+            saved = encode_lsb_stream(modified_img, [payload]) is not None
+            if saved:
+                import cv2
+
+                cv2.imwrite(path, modified_img)
+        if saved:
             self.after(0, lambda: self._update_status("Image saved successfully!", "success"))
         else:
             self.after(0, lambda: self._update_status("Error: Message is too large for this image.", "danger"))
@@ -414,21 +452,32 @@ class SteganographyApp(TkinterDnD.Tk):
         self.progress_decrypt.grid(row=3, column=0, sticky="ew", pady=20)
         self.progress_decrypt.start()
         self._update_status("Decrypting message...", "info")
-        extracted_data = decode_lsb(self.img_decrypt)
-        if extracted_data:
-            decrypted_msg = decrypt_message(extracted_data, self.decrypt_pass_entry.get())
-            if decrypted_msg == "INVALID_PASSWORD":
-                self.after(0, lambda: self._update_status("Decryption Failed: Incorrect password.", "danger"))
-            elif decrypted_msg:
-                self.after(0, self._display_decrypted_message, decrypted_msg)
-                self.after(0, lambda: self._update_status("Decryption successful!", "success"))
-            else:
-                self.after(0, lambda: self._update_status("Decryption Failed: Data is corrupted.", "danger"))
+        if is_stream_payload(self.img_decrypt):
+            # Chunked AES-GCM stream, written by this GUI and by the command line tool
+            self._show_decrypt_result(decrypt_stream_message(self.img_decrypt, self.decrypt_pass_entry.get()))
         else:
-            self.after(0, lambda: self._update_status("Decryption Failed: No hidden message found.", "danger"))
+            # Fernet text format embedded by older versions (read-only)
+            extracted_data = decode_lsb(self.img_decrypt)
+            if extracted_data:
+                self._show_decrypt_result(decrypt_message(extracted_data, self.decrypt_pass_entry.get()))
+            else:
+                self.after(0, lambda: self._update_status("Decryption Failed: No hidden message found.", "danger"))
         self.progress_decrypt.stop()
         self.progress_decrypt.grid_forget()
 
+    def _show_decrypt_result(self, decrypted_msg):
+        if decrypted_msg == "INVALID_PASSWORD":
+            self.after(0, lambda: self._update_status("Decryption Failed: Incorrect password.", "danger"))
+        elif decrypted_msg == "BINARY_PAYLOAD":
+            self.after(0, lambda: self._update_status(
+                "The hidden payload is a file, not text. Extract it with: python -m apps.steganography.cli extract",
+                "warning"))
+        elif decrypted_msg:
+            self.after(0, self._display_decrypted_message, decrypted_msg)
+            self.after(0, lambda: self._update_status("Decryption successful!", "success"))
+        else:
+            self.after(0, lambda: self._update_status("Decryption Failed: Data is corrupted.", "danger"))
+
     def _toggle_password(self, entry, var):
         entry.config(show="" if var.get() else "*")
 
@@ -443,13 +492,16 @@ class SteganographyApp(TkinterDnD.Tk):
             indicator_text = "Open an image to see capacity"
             self.msg_size_label.config(bootstyle="default")
         else:
-            indicator_text = f"Size: {current_len} / {self.max_bytes} bytes"
-            self.msg_size_label.config(bootstyle="danger" if current_len > self.max_bytes else "primary")
+            # Size once encrypted and encoded, which is what actually goes into the image
+            plan = plan_embedding(current_len, self.max_bytes)
+            indicator_text = f"Size: {plan['payload_bytes']} / {self.max_bytes} bytes (message: {current_len})"
+            self.msg_size_label.config(bootstyle="primary" if plan["fits"] else "danger")
         self.msg_size_label.config(text=indicator_text)
 
     def _clear(self, is_encrypt=True):
         if is_encrypt:
             self.img_encrypt, self.original_pil_encrypt, self.max_bytes = None, None, 0
+            self.encrypt_path = None
             self.msg_entry.text.delete("1.0", "end")
             self.pass_entry.delete(0, 'end')
             self.img_label_encrypt.config(image='', text="\n\nDrag & Drop Image Here\nor Click Below")
@@ -0,0 +1,320 @@
+# File: apps/steganography/cli.py
+# Headless command line front-end for the Steganography Suite.
+#
+#   python -m apps.steganography.cli embed cover.png out.png -m "secret" -p pass
+#   echo "secret" | python -m apps.steganography.cli embed cover.png out.png -p pass
+#   python -m apps.steganography.cli extract out.png -p pass > secret.txt
+#   python -m apps.steganography.cli probe out.png
+#   python -m apps.steganography.cli capacity cover.png
+#
+# Only the core logic is used here: nothing from Tk, ttkbootstrap or tkinterdnd2
+# is imported. OpenCV and the crypto stack are imported inside the command that
+# needs them so `--help` and argument errors return immediately.
+#
+# Payloads are written as a chunked AES-GCM stream (core.encrypt_stream), so
+# files of any size are embedded and extracted one chunk at a time. Images
+# made by older GUI versions (Fernet text format) can still be extracted.
+
+import argparse
+import getpass
+import io
+import os
+import shutil
+import stat
+import sys
+
+# --- Exit Codes ---
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2  # Also used by argparse for invalid arguments
+EXIT_NO_MESSAGE = 3
+EXIT_INVALID_PASSWORD = 4
+EXIT_TOO_LARGE = 5
+
+PASSWORD_ENV_VAR = "STEGO_PASSWORD"
+LOSSY_EXTENSIONS = (".jpg", ".jpeg")
+
+
+def _error(message, code=EXIT_ERROR):
+    print(f"error: {message}", file=sys.stderr)
+    return code
+
+
+def _read_password(args):
+    """Password from --password, then $STEGO_PASSWORD, then an interactive prompt."""
+    if args.password:
+        return args.password
+    if os.environ.get(PASSWORD_ENV_VAR):
+        return os.environ[PASSWORD_ENV_VAR]
+    if sys.stdin.isatty():
+        return getpass.getpass("Password: ")
+    return None
+
+
+def _read_candidate_passwords(path):
+    """One candidate password per line; blank lines are skipped."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.rstrip("\r\n") for line in f if line.strip()]
+
+
+def _select_password(image, candidates):
+    """The candidates worth a full decryption: the first one accepted by the stream header's key check.
+
+    The Fernet format of older GUI versions has no key check value and cannot be checked
+    cheaply, so every candidate is returned for a trial decryption instead.
+    """
+    from .app.core import check_stream_password, is_stream_payload
+
+    if not is_stream_payload(image):
+        return candidates
+    for candidate in candidates:
+        if check_stream_password(image, candidate):
+            return [candidate]
+    return []
+
+
+def _open_payload(args):
+    """Returns (binary file object, size or None if unknown) for the payload."""
+    if args.message is not None:
+        data = args.message.encode("utf-8")
+        return io.BytesIO(data), len(data)
+    if args.input and args.input != "-":
+        f = open(args.input, "rb")
+        return f, os.fstat(f.fileno()).st_size
+    return sys.stdin.buffer, None
+
+
+def _open_output(path):
+    if path and path != "-":
+        return open(path, "wb")
+    return sys.stdout.buffer
+
+
+def _truncation_point(stream):
+    """Size of stdout before writing if it is a regular file written at its end (`> out.bin`); else None.
+
+    Output to a pipe or terminal cannot be taken back, nor can output to a
+    file opened for appending (`>>`), whose position is unknown until the
+    first write. Same rule as the CryptoSuite CLI's bake.
+    """
+    try:
+        info = os.fstat(stream.fileno())
+        if stat.S_ISREG(info.st_mode) and stream.tell() == info.st_size:
+            return info.st_size
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _load_image(path):
+    """Memory-maps uncompressed BMP/PPM carriers; everything else is decoded with OpenCV."""
+    from .app.core import open_raw_carrier
+
+    _, image = open_raw_carrier(path)
+    if image is not None:
+        return image
+
+    import cv2
+
+    image = cv2.imread(path)
+    if image is None:
+        raise ValueError(f"could not read image '{path}'")
+    return image
+
+
+def cmd_embed(args):
+    from .app.core import (encrypt_stream, encode_lsb_stream, stream_payload_size, can_embed_raw,
+                           open_raw_carrier, calculate_capacity)
+
+    if args.output.lower().endswith(LOSSY_EXTENSIONS):
+        return _error("lossy output formats destroy the hidden message; use .png or .bmp", EXIT_USAGE)
+
+    password = _read_password(args)
+    if not password:
+        return _error(f"a password is required (--password or ${PASSWORD_ENV_VAR})", EXIT_USAGE)
+
+    try:
+        source, payload_size = _open_payload(args)
+    except OSError as e:
+        return _error(f"could not read payload: {e}")
+
+    with source:
+        if can_embed_raw(args.cover, args.output):
+            # Patch a copy of the uncompressed carrier in place through a memory map
+            shutil.copyfile(args.cover, args.output)
+            mapped, image = open_raw_carrier(args.output, mode="r+")
+        else:
+            # Writable in-memory copy; the result is re-encoded by OpenCV below
+            import numpy as np
+
+            mapped, image = None, np.array(_load_image(args.cover))
+
+        if payload_size is not None and stream_payload_size(payload_size) > calculate_capacity(image):
+            written = None
+        else:
+            written = encode_lsb_stream(image, encrypt_stream(source, password))
+
+    if mapped is not None:
+        mapped.flush()
+        del mapped, image
+        if written is None:
+            os.remove(args.output)
+    elif written is not None:
+        import cv2
+
+        if not cv2.imwrite(args.output, image):
+            return _error(f"could not write image '{args.output}'")
+
+    if written is None:
+        return _error("payload is too large for this image", EXIT_TOO_LARGE)
+    return EXIT_OK
+
+
+def _extract_stream(image, password, output_path):
+    from cryptography.exceptions import InvalidTag
+    from .app.core import LSBReader, InvalidPassword, decrypt_stream
+
+    output = _open_output(output_path)
+    start = _truncation_point(output) if output is sys.stdout.buffer else None
+    try:
+        for chunk in decrypt_stream(LSBReader(image), password):
+            output.write(chunk)
+    except (InvalidTag, ValueError) as e:
+        # Chunks before a failing one are already written: never leave them behind
+        if output is not sys.stdout.buffer:
+            output.close()
+            os.remove(output_path)
+        elif start is not None:
+            output.seek(start)
+            output.truncate()
+        if isinstance(e, InvalidPassword):
+            return _error("incorrect password", EXIT_INVALID_PASSWORD)
+        return _error("hidden data is corrupted")
+    output.flush()
+    if output is not sys.stdout.buffer:
+        output.close()
+    return EXIT_OK
+
+
+def cmd_extract(args):
+    image = _load_image(args.image)
+    if args.password_file:
+        candidates = _select_password(image, _read_candidate_passwords(args.password_file))
+        if not candidates:
+            return _error("none of the candidate passwords is correct", EXIT_INVALID_PASSWORD)
+        for password in candidates:
+            code = _extract(image, password, args.output)
+            if code != EXIT_INVALID_PASSWORD:
+                return code
+        return code
+
+    password = _read_password(args)
+    if not password:
+        return _error(f"a password is required (--password or ${PASSWORD_ENV_VAR})", EXIT_USAGE)
+    return _extract(image, password, args.output)
+
+
+def _extract(image, password, output_path):
+    from .app.core import decrypt_message, decode_lsb, is_stream_payload
+
+    if is_stream_payload(image):
+        return _extract_stream(image, password, output_path)
+
+    # Fernet text format written by older GUI versions
+    extracted_data = decode_lsb(image)
+    if not extracted_data:
+        return _error("no hidden message found", EXIT_NO_MESSAGE)
+
+    decrypted_msg = decrypt_message(extracted_data, password)
+    if decrypted_msg == "INVALID_PASSWORD":
+        return _error("incorrect password", EXIT_INVALID_PASSWORD)
+    if decrypted_msg is None:
+        return _error("hidden data is corrupted")
+
+    output = _open_output(output_path)
+    output.write(decrypted_msg.encode("utf-8"))
+    output.flush()
+    if output is not sys.stdout.buffer:
+        output.close()
+    return EXIT_OK
+
+
+def cmd_probe(args):
+    from .app.core import decode_lsb, is_stream_payload
+
+    image = _load_image(args.image)
+    if is_stream_payload(image):
+        print("hidden payload found: chunked AES-GCM stream")
+        return EXIT_OK
+
+    extracted_data = decode_lsb(image)
+    if not extracted_data:
+        print("no hidden message found")
+        return EXIT_NO_MESSAGE
+    print(f"hidden message found: {len(extracted_data)} bytes of encrypted payload")
+    return EXIT_OK
+
+
+def cmd_capacity(args):
+    from .app.core import calculate_capacity, max_stream_plaintext
+
+    max_bytes = calculate_capacity(_load_image(args.image))
+    max_payload = max_stream_plaintext(max_bytes)
+    if args.bytes:
+        print(max_payload)
+    else:
+        print(f"capacity: {max_bytes} bytes ({max_payload} bytes of payload)")
+    return EXIT_OK
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m apps.steganography.cli",
+        description="Hide and extract encrypted messages in images without the GUI."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    embed = subparsers.add_parser("embed", help="encrypt a message and hide it in an image")
+    embed.add_argument("cover", help="cover image to hide the message in")
+    embed.add_argument("output", help="where to write the new image (.png or .bmp)")
+    source = embed.add_mutually_exclusive_group()
+    source.add_argument("-m", "--message", help="message text (default: read from stdin)")
+    source.add_argument("-i", "--input", help="read the payload from a file of any type ('-' for stdin)")
+    embed.add_argument("-p", "--password", help=f"encryption password (default: ${PASSWORD_ENV_VAR} or prompt)")
+    embed.set_defaults(handler=cmd_embed)
+
+    extract = subparsers.add_parser("extract", help="extract and decrypt a hidden message")
+    extract.add_argument("image", help="image containing a hidden message")
+    extract.add_argument("-o", "--output", help="write the payload to a file (default: stdout)")
+    passwords = extract.add_mutually_exclusive_group()
+    passwords.add_argument("-p", "--password", help=f"decryption password (default: ${PASSWORD_ENV_VAR} or prompt)")
+    passwords.add_argument("-P", "--password-file",
+                           help="try each password in this file (one per line) and use the first that matches")
+    extract.set_defaults(handler=cmd_extract)
+
+    probe = subparsers.add_parser("probe", help="check whether an image carries a hidden message")
+    probe.add_argument("image", help="image to inspect")
+    probe.set_defaults(handler=cmd_probe)
+
+    capacity = subparsers.add_parser("capacity", help="show how much data an image can hold")
+    capacity.add_argument("image", help="cover image to measure")
+    capacity.add_argument("--bytes", action="store_true", help="print only the payload capacity in bytes")
+    capacity.set_defaults(handler=cmd_capacity)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except ImportError as e:
+        return _error(f"{e}. Required: opencv-python, numpy, cryptography")
+    except (OSError, ValueError) as e:
+        return _error(str(e))
+    except KeyboardInterrupt:
+        return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,10 @@
 import os
 import platform
 import sys
+import time
+
+# Reference point for the startup measurement hook (STEGO_STARTUP_TIMING=1)
+_STARTUP_T0 = time.perf_counter()
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,7 +25,13 @@ def main():
             except Exception as e:
                 print(f"Warning: Could not set DPI awareness: {e}")
 
-        app = SteganographyApp()
+        on_first_window = None
+        if os.environ.get("STEGO_STARTUP_TIMING"):
+            def on_first_window():
+                elapsed_ms = (time.perf_counter() - _STARTUP_T0) * 1000
+                print(f"Steganography Suite: first window after {elapsed_ms:.0f} ms")
+
+        app = SteganographyApp(on_first_window=on_first_window)
         app.mainloop()
 
     except ImportError as e:
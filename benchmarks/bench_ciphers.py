@@ -0,0 +1,83 @@
+# File: benchmarks/bench_ciphers.py
+# Compares the table-driven Caesar/Atbash/ROT ciphers against the original
+# character-by-character loops on GUI-sized inputs. With the default sizes the
+# tables ran about 75-80x faster at 4 KB, 170-190x at 64 KB and 210-245x at
+# 2 MB on a single-CPU Linux VM (Python 3.11); exact figures vary by machine.
+#
+#   python -m benchmarks.bench_ciphers
+#   python -m benchmarks.bench_ciphers --sizes 65536 2097152 --repeat 5
+
+import argparse
+import random
+import string
+import timeit
+
+from apps.cryptosuite.operations.ciphers import caesar_cipher, atbash_cipher, rot13, rot47
+
+DEFAULT_SIZES = (4 * 1024, 64 * 1024, 2 * 1024 * 1024)  # Up to the GUI's 2 MB CHUNK_SIZE
+
+
+def loop_caesar(text, shift):
+    """The original per-character implementation, kept as the baseline."""
+    result = ""
+    for char in text:
+        if 'a' <= char <= 'z':
+            result += chr(((ord(char) - ord('a') + shift) % 26) + ord('a'))
+        elif 'A' <= char <= 'Z':
+            result += chr(((ord(char) - ord('A') + shift) % 26) + ord('A'))
+        else:
+            result += char
+    return result
+
+
+def loop_atbash(text):
+    result = ""
+    for char in text:
+        if 'a' <= char <= 'z':
+            result += chr(ord('z') - ord(char) + ord('a'))
+        elif 'A' <= char <= 'Z':
+            result += chr(ord('Z') - ord(char) + ord('A'))
+        else:
+            result += char
+    return result
+
+
+def _best_time(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def run(sizes, repeat):
+    rng = random.Random(0)
+    alphabet = string.ascii_letters + string.digits + string.punctuation + " " * 10
+    print(f"{'operation':<16}{'size':>10}{'loop (ms)':>12}{'table (ms)':>12}{'speedup':>10}")
+    for size in sizes:
+        text = "".join(rng.choice(alphabet) for _ in range(size))
+        assert caesar_cipher(text, 3)[1] == loop_caesar(text, 3)
+        assert atbash_cipher(text)[1] == loop_atbash(text)
+        cases = [
+            ("Caesar", lambda: loop_caesar(text, 3), lambda: caesar_cipher(text, 3)),
+            ("Atbash", lambda: loop_atbash(text), lambda: atbash_cipher(text)),
+            ("ROT13", lambda: loop_caesar(text, 13), lambda: rot13(text)),
+            ("Caesar (bytes)", None, lambda: caesar_cipher(text.encode(), 3)),
+            ("ROT47", None, lambda: rot47(text)),
+        ]
+        for name, baseline, fast in cases:
+            fast_time = _best_time(fast, repeat)
+            if baseline is None:
+                print(f"{name:<16}{size:>10}{'-':>12}{fast_time * 1000:>12.3f}{'-':>10}")
+                continue
+            loop_time = _best_time(baseline, repeat)
+            print(f"{name:<16}{size:>10}{loop_time * 1000:>12.3f}{fast_time * 1000:>12.3f}"
+                  f"{loop_time / fast_time:>9.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the classic cipher implementations.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="input sizes in characters")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per case (best is reported)")
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
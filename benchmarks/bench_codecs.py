@@ -0,0 +1,74 @@
+# File: benchmarks/bench_codecs.py
+# Times the Base32/Base58/Base85/Ascii85 codecs across input sizes, and the
+# divide-and-conquer Base58 against the digit-by-digit big-integer loop
+# (quadratic, so it is only run up to --baseline-limit bytes).
+#
+#   python -m benchmarks.bench_codecs
+#   python -m benchmarks.bench_codecs --sizes 65536 1048576 --repeat 1
+
+import argparse
+import os
+import timeit
+
+from apps.cryptosuite.operations.codecs import (
+    BASE58_ALPHABET, from_ascii85, from_base32, from_base58, from_base85,
+    to_ascii85, to_base32, to_base58, to_base85,
+)
+
+DEFAULT_SIZES = (1024, 16 * 1024, 64 * 1024, 256 * 1024, 1024 * 1024)
+DEFAULT_BASELINE_LIMIT = 64 * 1024
+
+
+def naive_base58(data):
+    """Repeated divmod by 58 on one big integer: the usual textbook implementation."""
+    n = int.from_bytes(data, 'big')
+    digits = []
+    while n:
+        n, digit = divmod(n, 58)
+        digits.append(BASE58_ALPHABET[digit])
+    zeros = len(data) - len(data.lstrip(b"\0"))
+    return BASE58_ALPHABET[0] * zeros + "".join(reversed(digits))
+
+
+def _best_time(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def run(sizes, repeat, baseline_limit):
+    codecs = [
+        ("Base32", to_base32, from_base32),
+        ("Base58", to_base58, from_base58),
+        ("Base85", to_base85, from_base85),
+        ("Ascii85", to_ascii85, from_ascii85),
+    ]
+    print(f"{'codec':<10}{'size':>10}{'encode (ms)':>14}{'decode (ms)':>14}{'naive (ms)':>13}{'speedup':>10}")
+    for size in sizes:
+        data = os.urandom(size)
+        for name, encode, decode in codecs:
+            encoded = encode(data)[1]
+            assert decode(encoded) == (True, data)
+            encode_time = _best_time(lambda: encode(data), repeat)
+            decode_time = _best_time(lambda: decode(encoded), repeat)
+            baseline = "-"
+            speedup = "-"
+            if name == "Base58" and size <= baseline_limit:
+                assert naive_base58(data) == encoded
+                naive_time = _best_time(lambda: naive_base58(data), repeat)
+                baseline = f"{naive_time * 1000:.1f}"
+                speedup = f"{naive_time / encode_time:.1f}x"
+            print(f"{name:<10}{size:>10}{encode_time * 1000:>14.1f}{decode_time * 1000:>14.1f}"
+                  f"{baseline:>13}{speedup:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Base32/58/85 codecs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="input sizes in bytes")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per case (best is reported)")
+    parser.add_argument("--baseline-limit", type=int, default=DEFAULT_BASELINE_LIMIT,
+                        help="largest size to run the quadratic Base58 baseline on")
+    args = parser.parse_args()
+    run(args.sizes, args.repeat, args.baseline_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# File: benchmarks/check_streaming.py
+# Checks that decoders give the same result whether a recipe streams or
+# runs in one go. Each edge input, plus random inputs mixing valid symbols
+# with padding, whitespace, "0x" prefixes and stray characters, goes through
+# run_recipe and through stream_recipe at several chunk sizes. The two must
+# succeed or fail together and produce identical bytes. Exits with status 1
+# on the first kind of mismatch, listing every case that differs.
+#
+#   python -m benchmarks.check_streaming
+#   python -m benchmarks.check_streaming --random 5000 --seed 7
+
+import argparse
+import io
+import random
+import sys
+
+from apps.cryptosuite.operations.recipe import run_recipe
+from apps.cryptosuite.operations.registry import DECRYPT
+from apps.cryptosuite.operations.streaming import stream_recipe
+
+CHUNK_SIZES = (1, 2, 3, 5, 7, 64, 2 * 1024 * 1024)
+
+EDGE_CASES = {
+    "From Base64": [
+        b"", b"SGVsbG8=", b"SGVsbG8", b"SGVsb", b"SGVs-bG8=", b"SGVs_bG8=", b"SG\nVs bG8=\n",
+        b"SGVsbG8=SGVsbG8=", b"SG=Vs", b"=SGVs", b"S=GVs", b"SGV=sbG8", b"SGVsbA=x=", b"SGVsbA==",
+        b"SGVsbA=", b"SG==Vs", b"SG=VsbA=x", b"QQ=AB", b"====", b"SGVsbG8=\xff\xfe", b"\xffSGVs",
+    ],
+    "From Hex": [
+        b"", b"48656c6c6f", b"0x48656c6c6f", b"0x48 0x65", b"48 65\n6c", b"ab\ncd", b"4\n8",
+        b"48656c6c6", b"4865zz", b"00x41", b"0x0x41", b"0 x41", b"0X41", b"\t48\r\n65 ", b"0",
+    ],
+    "From Base32": [b"", b"JBSWY3DP", b"jbswy3dp", b"JBSW Y3DP\n", b"JBSWY3D", b"JBSWY3DPEE======",
+                    b"JBSWY3D=JBSWY3DP", b"JBSWY3DPEE======\n=="],
+    "From Base85": [b"", b"NM&qnZ!", b"NM&q nZ!\n", b"NM&qnZ", b"NM&q~Z!"],
+}
+SYMBOLS = {
+    "From Base64": b"ABCSGVsbG8+/0123==== \n-_\xff",
+    "From Hex": b"0123456789abcdefABx   \n\t0x0xg",
+    "From Base32": b"ABCDEFGHJBSWY3DP234567abc==== \n",
+    "From Base85": b"0123456789ABCxyz!#$%&()*+-;<=>?@^_`{|}~ \n",
+}
+
+
+def one_shot(steps, data):
+    success, result = run_recipe(steps, data, DECRYPT)
+    return (True, result if isinstance(result, bytes) else result.encode('utf-8')) if success else (False, None)
+
+
+def streamed(steps, data, chunk_size):
+    sink = io.BytesIO()
+    try:
+        stream_recipe(steps, io.BytesIO(data), sink, DECRYPT, chunk_size=chunk_size)
+    except ValueError:
+        return False, None
+    return True, sink.getvalue()
+
+
+def check(operation, data):
+    """Chunk sizes at which streaming disagrees with the one-shot run, with both results."""
+    steps = [{"operation": operation, "args": {}}]
+    expected = one_shot(steps, data)
+    mismatches = []
+    for chunk_size in CHUNK_SIZES:
+        actual = streamed(steps, data, chunk_size)
+        if actual != expected:
+            mismatches.append((chunk_size, expected, actual))
+    return mismatches
+
+
+def run(random_cases, seed):
+    rng = random.Random(seed)
+    failures = 0
+    print(f"{'operation':<14}{'cases':>8}{'mismatches':>12}")
+    for operation, edge_cases in EDGE_CASES.items():
+        symbols = SYMBOLS[operation]
+        cases = list(edge_cases) + [bytes(rng.choice(symbols) for _ in range(rng.randrange(0, 24)))
+                                    for _ in range(random_cases)]
+        bad = 0
+        for data in cases:
+            for chunk_size, expected, actual in check(operation, data):
+                bad += 1
+                print(f"  {operation}: {data!r} (chunk {chunk_size}): one-shot {expected}, streamed {actual}")
+        failures += bad
+        print(f"{operation:<14}{len(cases):>8}{bad:>12}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check streamed decoders against their one-shot functions.")
+    parser.add_argument("--random", type=int, default=2000, help="random inputs per operation")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random inputs")
+    args = parser.parse_args()
+    sys.exit(1 if run(args.random, args.seed) else 0)
+
+
+if __name__ == "__main__":
+    main()